@@ -0,0 +1,47 @@
+"""
+Mede o tempo de conversão dos elementos do corpo do texto (etapa 2),
+executando cada pipe separadamente e com `ConvertElementsPipe`
+
+    python -m benchmarks.bench_body_cleanup
+"""
+import time
+from copy import deepcopy
+
+from lxml import etree as ET
+
+from scielo_classic_website.spsxml import sps_xml_body_pipes
+
+PARAGRAPH = (
+    "<p><b>Texto</b> <i>em</i> <a href='#t1'>Tabela 1</a> <a name='f1'>Fig</a> "
+    "<img src='/img/revistas/aa/v1n1/f1.jpg'/> <a href='mailto:x@y.org'>x</a> "
+    "<sup>1</sup><br/></p>"
+)
+SECTION = "<div><h2>Seção</h2>" + PARAGRAPH * 20 + "<ol><li>item</li></ol></div>"
+
+
+def convert(xml, pipes, number):
+    seconds = 0
+    for i in range(number):
+        tree = deepcopy(xml)
+        started = time.perf_counter()
+        for pipe in pipes:
+            pipe.transform((None, tree))
+        seconds += time.perf_counter() - started
+    return seconds
+
+
+def main(sections=500, number=5):
+    xml = ET.fromstring(f"<article><body>{SECTION * sections}</body></article>")
+    for label, pipes in (
+        (
+            "one tree walk per pipe",
+            [pipe() for pipe in sps_xml_body_pipes.ConvertElementsPipe.PIPES],
+        ),
+        ("ConvertElementsPipe", [sps_xml_body_pipes.ConvertElementsPipe()]),
+    ):
+        seconds = convert(xml, pipes, number)
+        print(f"{label}: {seconds / number * 1000:.1f} ms per document")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Mede o tempo de conversão de conteúdo no formato ID para JSON
+
+    python -m benchmarks.bench_id2json3 [arquivo.id]
+
+Sem argumentos, usa registros de citação (`c`) sintéticos
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from scielo_classic_website.iid2json import id2json3
+
+CITATION_RECORD = [
+    "!v706!c",
+    "!v880!S0044-59672019000300242",
+    "!v010!^nYardany^sRAMOS-PASTRANA^rND",
+    "!v010!^nMarta^sWOLFF^rND",
+    "!v012!Biodiversidade da região amazônica^lpt",
+    "!v030!Acta Amaz.",
+    "!v031!49",
+    "!v032!3",
+    "!v014!^f242^l250",
+    "!v064!2019",
+    "!v704!^aRAMOS-PASTRANA, Y.; WOLFF, M. Acta Amaz., 49(3), 2019.",
+]
+
+
+def create_id_file(file_path, total=20000):
+    with open(file_path, "w", encoding="iso-8859-1") as fp:
+        for i in range(1, total + 1):
+            fp.write(f"!ID {str(i).zfill(7)}\n")
+            fp.write("\n".join(CITATION_RECORD) + "\n")
+
+
+def main(id_file_path=None, repeat=3):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if not id_file_path:
+            id_file_path = os.path.join(tmpdir, "artigo.id")
+            create_id_file(id_file_path)
+
+        rows = [
+            row
+            for row in id2json3.get_id_file_rows(id_file_path)
+            if row and not row.startswith("!ID ")
+        ]
+        seconds = min(
+            timeit.repeat(
+                lambda: [id2json3._parse_field(row) for row in rows],
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(f"_parse_field: {len(rows)} fields in {seconds:.3f}s")
+
+        seconds = min(
+            timeit.repeat(
+                lambda: list(id2json3.pids_and_their_records(id_file_path, "artigo")),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(f"pids_and_their_records: {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
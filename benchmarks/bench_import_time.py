@@ -0,0 +1,59 @@
+"""
+Mede o tempo de importação de `sps_xml_pipes` em um novo processo,
+como ocorre nos processos de cada fascículo, e o tempo do primeiro
+acesso às tabelas de `sps_xml_attributes`, a partir dos arquivos CSV
+e do snapshot
+
+    python -m benchmarks.bench_import_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from scielo_classic_website.spsxml import sps_xml_attributes
+
+IMPORT = "import scielo_classic_website.spsxml.sps_xml_pipes"
+FIRST_ACCESS = (
+    "import time\n"
+    "from scielo_classic_website.spsxml import sps_xml_attributes\n"
+    "started = time.perf_counter()\n"
+    "sps_xml_attributes.COUNTRY_ITEMS\n"
+    "print(time.perf_counter() - started)\n"
+)
+
+
+def run(code, env=None):
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return time.perf_counter() - started, result.stdout
+
+
+def main(number=20):
+    seconds = [run(IMPORT)[0] for i in range(number)]
+    print(f"import sps_xml_pipes: {statistics.median(seconds) * 1000:.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        snapshot_path = os.path.join(tmpdir, "attributes.pickle")
+        sps_xml_attributes.write_snapshot(snapshot_path)
+        for label, env in (
+            ("CSV files", dict(os.environ, ATTRIBUTES_SNAPSHOT_PATH="")),
+            ("snapshot", dict(os.environ, ATTRIBUTES_SNAPSHOT_PATH=snapshot_path)),
+        ):
+            seconds = [float(run(FIRST_ACCESS, env)[1]) for i in range(number)]
+            print(
+                f"first access to the tables ({label}): "
+                f"{statistics.median(seconds) * 1000:.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
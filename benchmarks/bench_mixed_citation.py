@@ -0,0 +1,45 @@
+"""
+Mede o tempo de `html_style_fixer.get_mixed_citation_node`, que cria o
+`mixed-citation` de cada referência, com as substituições de STYLES
+uma a uma e um `HTMLParser` novo por referência (como antes) e com
+`fix_styles`, o `HTMLParser` reutilizado e `ET.HTML`
+
+    python -m benchmarks.bench_mixed_citation
+"""
+import timeit
+from io import StringIO
+
+from lxml import etree as ET
+
+from scielo_classic_website.htmlbody import html_style_fixer
+
+CITATION = (
+    '<p align="left"><font face="Verdana">1. Silva <B>A</B>, Souza <b>B</b>. '
+    "<i>Título do artigo</i>. <em>Acta Amaz.</em> 2001; <strong>31</strong>"
+    "(2): 10-20.</font></p>"
+)
+
+
+def get_mixed_citation_node_by_steps(reference_html_paragraph):
+    html_str = reference_html_paragraph
+    for old, new in html_style_fixer.STYLES:
+        html_str = html_str.replace(old, new)
+        html_str = html_str.replace(old.upper(), new)
+    html_tree = ET.parse(StringIO(html_str), ET.HTMLParser())
+    p = html_tree.find(".//body/p")
+    if p is not None:
+        p.tag = "mixed-citation"
+    return p
+
+
+def main(citations=3000):
+    for label, func in (
+        ("by steps", get_mixed_citation_node_by_steps),
+        ("get_mixed_citation_node", html_style_fixer.get_mixed_citation_node),
+    ):
+        seconds = min(timeit.repeat(lambda: func(CITATION), number=citations, repeat=5))
+        print(f"{label}: {seconds:.3f} s for {citations} citations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Mede, por documento, com e sem a memorização de `field_property`:
+
+- o tempo de acesso às propriedades de `DocumentRecord`
+- o tempo de `sps_xml_batch.generate_full_xml`
+
+    python -m benchmarks.bench_record_properties
+"""
+import logging
+import timeit
+from contextlib import contextmanager
+
+from scielo_classic_website.isisdb.base_h_record import ATTRIBUTES
+from scielo_classic_website.isisdb.h_record import DocumentRecord
+from scielo_classic_website.isisdb.meta_record import MetaRecord
+from scielo_classic_website.models.issue_context import IssueContext
+from scielo_classic_website.spsxml.sps_xml_batch import generate_full_xml
+
+RECORD = {
+    "v002": [{"_": "S0044-59672019000300242.xml"}],
+    "v010": [
+        {"1": "aff1", "n": "Yardany", "s": "RAMOS-PASTRANA", "r": "ND"},
+        {"1": "aff2", "n": "Marta", "s": "WOLFF", "r": "ND"},
+    ],
+    "v012": [{"_": "Título", "l": "pt"}, {"_": "Title", "l": "en"}],
+    "v014": [{"f": "242", "l": "250"}],
+    "v031": [{"_": "49"}],
+    "v032": [{"_": "3"}],
+    "v040": [{"_": "pt"}],
+    "v049": [{"_": "AA970"}],
+    "v070": [{"i": "aff1", "_": "Universidade", "p": "Brasil"}],
+    "v083": [{"a": "Resumo", "l": "pt"}],
+    "v085": [{"k": "Amazônia", "l": "pt"}],
+    "v702": [{"_": "aa/v49n3/1809-4392-aa-49-03-242.xml"}],
+    "v706": [{"_": "h"}],
+    "v880": [{"_": "S0044-59672019000300242"}],
+}
+
+JOURNAL_RECORD = {
+    "v400": [{"_": "0044-5967"}],
+    "v068": [{"_": "aa"}],
+    "v100": [{"_": "Acta Amazonica"}],
+    "v150": [{"_": "Acta Amaz."}],
+    "v435": [{"_": "0044-5967", "t": "PRINT"}],
+    "v480": [{"_": "INPA"}],
+    "v490": [{"_": "Manaus"}],
+    "v320": [{"_": "AM"}],
+    "v310": [{"_": "BR"}],
+}
+ISSUE_RECORD = {
+    "v035": [{"_": "0044-5967"}],
+    "v036": [{"_": "20193"}],
+    "v031": [{"_": "49"}],
+    "v032": [{"_": "3"}],
+    "v065": [{"_": "20190900"}],
+}
+PARAGRAPH_RECORDS = [
+    {"v706": [{"_": "p"}], "v701": [{"_": "1"}], "v704": [{"_": "<p>Texto</p>"}]},
+    {
+        "v706": [{"_": "p"}],
+        "v701": [{"_": "2"}],
+        "v888": [{"_": "1"}],
+        "v704": [{"_": "<p>1. Silva A. Título. 2001.</p>"}],
+    },
+]
+
+# medições de `generate_full_xml`; vale a menor
+REPEAT = 5
+
+# quantidade de vezes que os pipes de `get_xml_rsps` acessam cada propriedade
+ACCESSES_PER_DOCUMENT = 5
+
+
+def get_properties(record, clear):
+    for i in range(ACCESSES_PER_DOCUMENT):
+        if clear:
+            record.clear_field_values()
+        for name in ATTRIBUTES:
+            try:
+                getattr(record, name)
+            except Exception:
+                pass
+
+
+def _get_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _get_subclasses(subclass)
+
+
+@contextmanager
+def without_memoization():
+    """
+    Substitui, temporariamente, cada `field_property` das subclasses
+    de `MetaRecord` por uma `property` sem memorização
+    """
+    replaced = []
+    for cls in _get_subclasses(MetaRecord):
+        for name, value in list(vars(cls).items()):
+            get_value = isinstance(value, property) and getattr(
+                value.fget, "__wrapped__", None
+            )
+            if get_value:
+                setattr(cls, name, property(get_value))
+                replaced.append((cls, name, value))
+    try:
+        yield
+    finally:
+        for cls, name, value in replaced:
+            setattr(cls, name, value)
+
+
+def generate_document_xml():
+    issue_context = IssueContext(ISSUE_RECORD, JOURNAL_RECORD)
+    records = [
+        dict(RECORD, v706=[{"_": "o"}]),
+        RECORD,
+        dict(RECORD, v706=[{"_": "f"}]),
+    ] + [dict(record, v880=RECORD["v880"]) for record in PARAGRAPH_RECORDS]
+    return generate_full_xml(
+        issue_context.get_document(records, RECORD["v880"][0]["_"])
+    )
+
+
+def main(documents=1000):
+    for label, clear in (("without memoization", True), ("with memoization", False)):
+        seconds = timeit.timeit(
+            lambda: get_properties(DocumentRecord(RECORD), clear), number=documents
+        )
+        print(f"properties {label}: {seconds / documents * 1000:.3f} ms per document")
+
+    logging.disable(logging.CRITICAL)
+    documents = documents // 10
+    generate_document_xml()
+    times = {"without memoization": [], "with memoization": []}
+    for i in range(REPEAT):
+        # alterna as medições, que ficam sujeitas às mesmas variações
+        with without_memoization():
+            times["without memoization"].append(
+                timeit.timeit(generate_document_xml, number=documents)
+            )
+        times["with memoization"].append(
+            timeit.timeit(generate_document_xml, number=documents)
+        )
+    for label, seconds in times.items():
+        print(
+            f"generate_full_xml {label}: "
+            f"{min(seconds) / documents * 1000:.3f} ms per document"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Mede a memória ocupada pelos registros de citação (`c`) de um arquivo ID,
+em relação ao tamanho do arquivo
+
+    python -m benchmarks.bench_records_memory [arquivo.id]
+
+Sem argumentos, usa registros sintéticos
+
+Também informa a memória das tags (chaves dos registros), que
+`id2json3._build_compact_record` compartilha entre os registros com `sys.intern`,
+e quanto ocupariam se cada registro tivesse a sua própria cópia
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from benchmarks.bench_id2json3 import create_id_file
+from scielo_classic_website.iid2json import id2json3
+from scielo_classic_website.models.document import DocumentRecords
+
+
+def get_tags_sizes(records):
+    """
+    Returns
+    -------
+    tuple (int, int)
+        memória das tags compartilhadas e memória das tags
+        se não fossem compartilhadas
+    """
+    shared = {}
+    total = 0
+    for record in records:
+        for tag in record:
+            size = sys.getsizeof(tag)
+            shared[id(tag)] = size
+            total += size
+    return sum(shared.values()), total
+
+
+def main(id_file_path=None):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if not id_file_path:
+            id_file_path = os.path.join(tmpdir, "artigo.id")
+            create_id_file(id_file_path, total=5000)
+        size = os.path.getsize(id_file_path)
+
+        tracemalloc.start()
+        pids_and_records = list(id2json3.pids_and_their_records(id_file_path, "artigo"))
+        records_size = tracemalloc.get_traced_memory()[0]
+        document_records = [
+            DocumentRecords(records) for _id, records in pids_and_records
+        ]
+        total_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print(f"ID file: {size} bytes")
+        print(f"records: {records_size} bytes ({records_size / size:.1f}x)")
+        print(f"records + DocumentRecords: {total_size / size:.1f}x")
+
+        shared_tags_size, tags_size = get_tags_sizes(
+            record for _id, records in pids_and_records for record in records
+        )
+        print(
+            f"tags: {shared_tags_size} bytes "
+            f"(sem compartilhar: {tags_size} bytes, {tags_size / size:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,96 @@
+"""
+Mede, para cada pipe que consulta a árvore com XPath, o tempo de
+`xml.xpath(expressão)` e do `ET.XPath` pré-compilado de `get_xpath`,
+e o tempo de `html_body_tree` criando ou reutilizando o `HTMLParser`
+
+    python -m benchmarks.bench_spsxml_xpath
+"""
+import timeit
+from io import StringIO
+
+from lxml import etree as ET
+
+from scielo_classic_website.spsxml import sps_xml_body_pipes
+from scielo_classic_website.spsxml.utils import get_xpath
+
+PARAGRAPH = (
+    "<p><!-- c --><font face='symbol'>a</font> <span name='style_bold'>b</span> "
+    "<b>b</b> <i>i</i> <a href='#t1'>t</a> <img src='f1.jpg'/></p>"
+)
+
+
+def get_tree(paragraphs):
+    return ET.fromstring(
+        f"<article><body>{PARAGRAPH * paragraphs}</body>"
+        "<back><fig id='f1'/><table-wrap id='t1'/></back></article>"
+    )
+
+
+EXPRESSIONS = (
+    ("RemoveCommentPipe", ["//comment()"]),
+    ("FontSymbolPipe", [".//font[@face='symbol']"]),
+    (
+        "RenameElementsPipe",
+        [f".//{old}" for old, new in sps_xml_body_pipes.RenameElementsPipe.from_to],
+    ),
+    (
+        "StylePipe",
+        [
+            f".//span[@name='style_{style}']"
+            for style in sps_xml_body_pipes.StylePipe.STYLES
+        ],
+    ),
+    ("AHrefPipe", [".//a[@href]"]),
+    ("ImgSrcPipe", [".//img[@src]"]),
+    ("TableWrapFigPipe", [".//div[@id]"]),
+    (
+        "XMLArticleMetaCountsPipe",
+        [
+            "count(.//fig[@id] | .//fig-group[@id])",
+            "count(.//table-wrap[@id] | .//table-wrap-group[@id])",
+            "count(.//disp-formula[@id])",
+        ],
+    ),
+)
+
+HTML = "<p>" + "<b>texto</b> " * 20 + "</p>"
+
+
+def html_body_tree_with_new_parser(html_text):
+    return ET.parse(StringIO(html_text), ET.HTMLParser()).getroot().find(".//body")
+
+
+def main(number=20):
+    # o custo de compilar a expressão pesa mais em árvores pequenas
+    for paragraphs, repeat in ((1, number * 500), (2000, number)):
+        print(f"{paragraphs} paragraph(s)")
+        xml = get_tree(paragraphs)
+        for pipe, expressions in EXPRESSIONS:
+            string = timeit.timeit(
+                lambda: [xml.xpath(expression) for expression in expressions],
+                number=repeat,
+            )
+            compiled = timeit.timeit(
+                lambda: [get_xpath(expression)(xml) for expression in expressions],
+                number=repeat,
+            )
+            print(
+                f"  {pipe}: xpath() {string / repeat * 1000000:.1f} us, "
+                f"get_xpath {compiled / repeat * 1000000:.1f} us"
+            )
+
+    number = number * 500
+    new_parser = timeit.timeit(
+        lambda: html_body_tree_with_new_parser(HTML), number=number
+    )
+    shared_parser = timeit.timeit(
+        lambda: sps_xml_body_pipes.html_body_tree(HTML), number=number
+    )
+    print(
+        f"html_body_tree: new HTMLParser {new_parser / number * 1000000:.1f} us, "
+        f"shared HTMLParser {shared_parser / number * 1000000:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Orquestração assíncrona (asyncio) da migração com `ClassicWebsite`.
+
+Cada etapa tem o seu limite de execuções simultâneas:
+
+- leitura dos registros das bases ISIS (CISIS ou arquivos ID), em threads
+- listagem das pastas do fascículo (`IssueFiles`), em threads
+- geração do XML SPS, em processos
+
+Enquanto uma etapa espera por I/O (por exemplo, em storage de rede),
+as demais continuam e os processos de geração do XML não ficam ociosos.
+
+```
+async with AsyncClassicWebsite(classic_website) as website:
+    async for issue, result, error in website.migrate_issues(issues):
+        ...
+```
+"""
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from scielo_classic_website import exceptions
+from scielo_classic_website.spsxml.sps_xml_batch import generate_full_xml
+
+
+def _list(func, *args):
+    # consome o generator na própria thread
+    return list(func(*args))
+
+
+def _convert_documents(convert, issue_context, pids_and_records):
+    # executado em um dos processos: `issue_context` é enviado uma única vez
+    # por fascículo e os seus `Journal` e `Issue` são compartilhados pelos
+    # documentos, que são criados no próprio processo, fora do event loop
+    results = []
+    for pid, document in issue_context.get_documents(pids_and_records):
+        try:
+            results.append((pid, convert(document), None))
+        except Exception as e:
+            logging.exception("Unable to generate XML %s: %s" % (pid, e))
+            results.append((pid, None, e))
+    return results
+
+
+class AsyncClassicWebsite:
+    """
+    Deve ser usado como `async with`, que cria e encerra
+    as threads e os processos
+
+    Parameters
+    ----------
+    classic_website: ClassicWebsite
+    records_concurrency: int
+        quantidade máxima de leituras simultâneas das bases
+    files_concurrency: int
+        quantidade máxima de listagens simultâneas das pastas dos fascículos
+    xml_workers: int
+        quantidade de processos de geração do XML
+        (padrão: quantidade de CPUs)
+    xml_concurrency: int
+        quantidade máxima de documentos, ou de fascículos em
+        `migrate_issue`, enviados aos processos e ainda não retornados
+        (padrão: 2 * xml_workers)
+    convert: callable
+        função que gera o XML a partir de um `Document`
+        (padrão: `sps_xml_batch.generate_full_xml`)
+    catalog: Catalog
+        catálogo dos periódicos e fascículos
+        (padrão: `ClassicWebsite.get_catalog`, obtido uma única vez)
+    """
+
+    def __init__(
+        self,
+        classic_website,
+        records_concurrency=4,
+        files_concurrency=4,
+        xml_workers=None,
+        xml_concurrency=None,
+        convert=None,
+        catalog=None,
+    ):
+        self.classic_website = classic_website
+        self.records_concurrency = records_concurrency
+        self.files_concurrency = files_concurrency
+        self.xml_workers = xml_workers or os.cpu_count() or 1
+        self.xml_concurrency = xml_concurrency or 2 * self.xml_workers
+        self.convert = convert or generate_full_xml
+        self._catalog = catalog
+        self._catalog_lock = None
+        self._records_semaphore = None
+        self._files_semaphore = None
+        self._xml_semaphore = None
+        self._io_executor = None
+        self._xml_executor = None
+
+    async def __aenter__(self):
+        # os semáforos são criados no event loop em que são usados
+        self._records_semaphore = asyncio.Semaphore(self.records_concurrency)
+        self._files_semaphore = asyncio.Semaphore(self.files_concurrency)
+        self._xml_semaphore = asyncio.Semaphore(self.xml_concurrency)
+        self._catalog_lock = asyncio.Lock()
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=self.records_concurrency + self.files_concurrency
+        )
+        self._xml_executor = ProcessPoolExecutor(max_workers=self.xml_workers)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        io_executor, self._io_executor = self._io_executor, None
+        xml_executor, self._xml_executor = self._xml_executor, None
+        # aguarda o encerramento sem bloquear o event loop
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, partial(io_executor.shutdown, wait=True))
+        await loop.run_in_executor(None, partial(xml_executor.shutdown, wait=True))
+
+    async def _run(self, semaphore, executor, func, *args):
+        if executor is None:
+            raise RuntimeError("Use AsyncClassicWebsite with `async with`")
+        async with semaphore:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(executor, partial(func, *args))
+
+    async def get_documents_pids_and_records(self, acron, issue_folder, issue_pid):
+        """
+        Obtém os registros dos documentos do fascículo
+
+        Returns
+        -------
+        list of tuple (pid, records)
+        """
+        return await self._run(
+            self._records_semaphore,
+            self._io_executor,
+            _list,
+            self.classic_website.get_documents_pids_and_records,
+            acron,
+            issue_folder,
+            issue_pid,
+        )
+
+    async def get_issue_files(self, acron, issue_folder):
+        """
+        Obtém os arquivos do fascículo
+
+        Returns
+        -------
+        list of dict
+        """
+        return await self._run(
+            self._files_semaphore,
+            self._io_executor,
+            _list,
+            self.classic_website.get_issue_files,
+            acron,
+            issue_folder,
+        )
+
+    async def get_catalog(self, snapshot_path=None):
+        """
+        Obtém o catálogo dos periódicos e fascículos
+
+        Returns
+        -------
+        Catalog
+        """
+        return await self._run(
+            self._records_semaphore,
+            self._io_executor,
+            self.classic_website.get_catalog,
+            snapshot_path,
+        )
+
+    async def get_issue_context(self, issue_pid):
+        """
+        Obtém o `IssueContext` do fascículo pelo catálogo,
+        que é obtido na primeira chamada
+
+        Returns
+        -------
+        IssueContext or None
+        """
+        async with self._catalog_lock:
+            if self._catalog is None:
+                self._catalog = await self.get_catalog()
+        return self._catalog.get_issue_context(issue_pid)
+
+    async def generate_full_xml(self, key, item):
+        """
+        Gera o XML de `item` (um `Document`) em um dos processos
+
+        Returns
+        -------
+        tuple (key, xml, error)
+            se a geração falha, `xml` é `None` e `error`
+            é a exceção ocorrida
+        """
+        try:
+            xml = await self._run(
+                self._xml_semaphore, self._xml_executor, self.convert, item
+            )
+        except Exception as e:
+            logging.exception("Unable to generate XML %s: %s" % (key, e))
+            return key, None, e
+        return key, xml, None
+
+    async def migrate_issue(self, acron, issue_folder, issue_pid):
+        """
+        Obtém os registros e os arquivos do fascículo, ao mesmo tempo,
+        e gera o XML dos seus documentos, com o periódico e o fascículo
+        do catálogo. Os documentos do fascículo são enviados juntos
+        a um dos processos
+
+        Returns
+        -------
+        dict
+            keys: "issue_files" (list of dict) e
+            "documents" (list of tuple (pid, xml, error))
+
+        Raises
+        ------
+        exceptions.IssueNotFoundError
+        """
+        issue_context = await self.get_issue_context(issue_pid)
+        if issue_context is None:
+            raise exceptions.IssueNotFoundError(
+                "Unable to migrate issue %s: not found in the catalog" % issue_pid
+            )
+        pids_and_records, issue_files = await asyncio.gather(
+            self.get_documents_pids_and_records(acron, issue_folder, issue_pid),
+            self.get_issue_files(acron, issue_folder),
+        )
+        try:
+            documents = await self._run(
+                self._xml_semaphore,
+                self._xml_executor,
+                _convert_documents,
+                self.convert,
+                issue_context,
+                pids_and_records,
+            )
+        except Exception as e:
+            logging.exception("Unable to generate XML %s: %s" % (issue_pid, e))
+            documents = [(pid, None, e) for pid, records in pids_and_records]
+        return {"issue_files": issue_files, "documents": documents}
+
+    async def _migrate_issue(self, issue):
+        try:
+            return issue, await self.migrate_issue(*issue), None
+        except Exception as e:
+            logging.exception("Unable to migrate issue %s: %s" % (issue, e))
+            return issue, None, e
+
+    async def migrate_issues(self, issues, max_in_flight=None):
+        """
+        Migra vários fascículos ao mesmo tempo
+
+        Parameters
+        ----------
+        issues: iterable of tuple
+            (acron, issue_folder, issue_pid)
+        max_in_flight: int
+            quantidade máxima de fascículos em andamento
+            (padrão: records_concurrency + files_concurrency)
+
+        Returns
+        -------
+        async generator of tuple (issue, result, error)
+            em ordem de finalização dos fascículos. `result` é o retorno
+            de `migrate_issue` ou, se a migração falha, `None` e `error`
+            é a exceção ocorrida
+        """
+        max_in_flight = max_in_flight or (
+            self.records_concurrency + self.files_concurrency
+        )
+        issues = iter(issues)
+        running = set()
+        try:
+            while True:
+                for issue in issues:
+                    running.add(asyncio.ensure_future(self._migrate_issue(issue)))
+                    if len(running) >= max_in_flight:
+                        break
+                if not running:
+                    break
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+        finally:
+            # a iteração foi interrompida
+            for future in running:
+                future.cancel()
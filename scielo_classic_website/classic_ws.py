@@ -1,8 +1,10 @@
 import logging
 import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 from scielo_classic_website.iid2json import id2json3
 from scielo_classic_website.isisdb.isis_cmd import ISISCommader
+from scielo_classic_website.models.catalog import Catalog, get_source_signature
 from scielo_classic_website.models.document import Document
 from scielo_classic_website.models.issue import Issue
 from scielo_classic_website.models.issue_files import ArtigoDBPath, IssueFiles
@@ -76,31 +78,138 @@ class ClassicWebsite:
         )
         self.isis_commander = ISISCommader(self.classic_website_paths)
 
-    def get_issue_files(self, acron, issue_folder):
-        classic_ws_fs = IssueFiles(acron, issue_folder, self.classic_website_paths)
+    def get_issue_files(self, acron, issue_folder, max_workers=None):
+        classic_ws_fs = IssueFiles(
+            acron, issue_folder, self.classic_website_paths, max_workers
+        )
         return classic_ws_fs.files
 
     def get_journals_pids_and_records(self):
-        id_file_path = self.isis_commander.get_id_file_path(
-            self.classic_website_paths.title_path
+        return self.isis_commander.pids_and_their_records(
+            self.classic_website_paths.title_path, "title"
         )
-        return id2json3.pids_and_their_records(id_file_path, "title")
 
     def get_issues_pids_and_records(self):
-        id_file_path = self.isis_commander.get_id_file_path(
-            self.classic_website_paths.issue_path
+        return self.isis_commander.pids_and_their_records(
+            self.classic_website_paths.issue_path, "issue"
+        )
+
+    def get_catalog(self, snapshot_path=None):
+        """
+        Obtém o catálogo dos periódicos e fascículos, lendo as bases
+        `title` e `issue` uma única vez
+
+        Parameters
+        ----------
+        snapshot_path: str
+            arquivo pickle do catálogo, reaproveitado enquanto as bases
+            não mudam e regravado quando mudam
+
+        Returns
+        -------
+        Catalog
+        """
+        signature = None
+        if snapshot_path:
+            paths = self.classic_website_paths
+            signature = [
+                get_source_signature(paths.title_path),
+                get_source_signature(paths.issue_path),
+            ]
+            catalog = Catalog.read_snapshot(snapshot_path, signature)
+            if catalog is not None:
+                return catalog
+        catalog = Catalog(
+            self.get_journals_pids_and_records(), self.get_issues_pids_and_records()
         )
-        return id2json3.pids_and_their_records(id_file_path, "issue")
+        if snapshot_path:
+            catalog.write_snapshot(snapshot_path, signature)
+        return catalog
 
     def get_documents_pids_and_records(self, acron, issue_folder, issue_pid):
         article_db_path = ArtigoDBPath(self.classic_website_paths, acron, issue_folder)
         for source_path in article_db_path.get_artigo_db_path():
-            id_file_path = self.isis_commander.get_id_file_path(source_path)
-            pids_and_records = id2json3.pids_and_their_records(id_file_path, "artigo")
+            pids_and_records = self.isis_commander.pids_and_their_records(
+                source_path, "artigo"
+            )
             for group_id, records in pids_and_records:
                 pid, p_records = self._get_p_records(group_id, records, issue_pid)
                 yield (pid, records + p_records)
 
+    def get_documents(self, acron, issue_folder, issue_pid, issue_context):
+        """
+        Obtém os documentos de um fascículo, todos com o mesmo
+        `Journal` e `Issue` de `issue_context`
+
+        Parameters
+        ----------
+        issue_context: IssueContext
+
+        Returns
+        -------
+        generator of tuple (pid, Document)
+        """
+        return issue_context.get_documents(
+            self.get_documents_pids_and_records(acron, issue_folder, issue_pid)
+        )
+
+    def get_documents_pids_and_records_in_batch(
+        self, issues, max_workers=None, max_in_flight=None
+    ):
+        """
+        Obtém os registros dos documentos de vários fascículos,
+        convertendo as bases de dados em processos paralelos
+
+        Parameters
+        ----------
+        issues: iterable of tuple
+            (acron, issue_folder, issue_pid)
+        max_workers: int
+            quantidade de processos (padrão: quantidade de CPUs)
+        max_in_flight: int
+            quantidade máxima de fascículos submetidos e ainda não
+            retornados (padrão: 2 * max_workers)
+
+        Returns
+        -------
+        generator of tuple (issue, pids_and_records, error)
+            em ordem de finalização dos fascículos. `pids_and_records`
+            é a lista de tuple (pid, records) do fascículo ou, se a
+            conversão falha, `None` e `error` é a exceção ocorrida
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or 2 * max_workers
+        issues = iter(issues)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_documents_worker,
+            initargs=(self.classic_website_paths,),
+        ) as executor:
+            running = {}
+            while True:
+                for issue in issues:
+                    future = executor.submit(
+                        _get_issue_documents_pids_and_records, issue
+                    )
+                    running[future] = issue
+                    if len(running) >= max_in_flight:
+                        break
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    issue = running.pop(future)
+                    try:
+                        pids_and_records = future.result()
+                    except Exception as e:
+                        logging.exception(
+                            "Unable to get documents pids and records %s: %s"
+                            % (issue, e)
+                        )
+                        yield issue, None, e
+                        continue
+                    yield issue, pids_and_records, None
+
     def _get_p_records(self, group_id, records, issue_pid):
         p_records = []
         if issue_pid in group_id:
@@ -116,3 +225,34 @@ class ClassicWebsite:
             ):
                 break
         return pid, p_records
+
+
+# instância de `ClassicWebsite` de cada processo de
+# `ClassicWebsite.get_documents_pids_and_records_in_batch`
+_worker_classic_website = None
+
+
+def _init_documents_worker(classic_website_paths):
+    global _worker_classic_website
+    paths = classic_website_paths
+    _worker_classic_website = ClassicWebsite(
+        paths.bases_path,
+        paths.bases_work_path,
+        paths.bases_translation_path,
+        paths.bases_pdf_path,
+        paths.bases_xml_path,
+        paths.htdocs_img_revistas_path,
+        paths.serial_path,
+        paths.cisis_path,
+        paths.title_path,
+        paths.issue_path,
+    )
+
+
+def _get_issue_documents_pids_and_records(issue):
+    acron, issue_folder, issue_pid = issue
+    return list(
+        _worker_classic_website.get_documents_pids_and_records(
+            acron, issue_folder, issue_pid
+        )
+    )
@@ -94,7 +94,8 @@ class ModelBuilder:
         with open(class_file_path, "w") as fp:
             fp.write("# generated by ModelBuilder\n")
             fp.write(
-                "from scielo_classic_website.isisdb.meta_record import MetaRecord\n\n\n"
+                "from scielo_classic_website.isisdb.meta_record import "
+                "MetaRecord, field_property\n\n\n"
             )
             fp.write(f"{_attributes_var(self.get_attributes())}\n\n\n")
 
@@ -187,6 +188,7 @@ def _class_init_builder(class_name, parent_class_name):
         (
             f"""# generated by ModelBuilder""",
             f"""class {class_name}({parent_class_name}):""",
+            f"""    __slots__ = ()""",
             f"""""",
             f"""    def __init__(""",
             f"""            self, record, multi_val_tags=None,""",
@@ -275,7 +277,7 @@ def _attribute_builder(attribute_name, tag, subfields, is_multi_val, comment="")
         (
             "",
             f"""    # generated by ModelBuilder""",
-            f"""    @property""",
+            f"""    @field_property""",
             f"""    def {attribute_name}(self):""",
             f"""{comment}""",
             f"""        return self.get_field_content({params})""",
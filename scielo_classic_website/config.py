@@ -4,12 +4,34 @@ import os
 from scielo_classic_website import exceptions
 
 ATTRIBUTES_PATH = os.environ.get(
-    "ATTRIBUTES_PATH", "scielo_classic_website/settings/attributes"
+    "ATTRIBUTES_PATH",
+    os.path.join(os.path.dirname(__file__), "settings", "attributes"),
 )
+# arquivo gerado por `sps_xml_attributes.write_snapshot`
+ATTRIBUTES_SNAPSHOT_PATH = os.environ.get("ATTRIBUTES_SNAPSHOT_PATH")
 
 # /var/www/scielo/proc/cisis
 CLASSIC_WEBSITE_CISIS_PATH = os.environ.get("CLASSIC_WEBSITE_CISIS_PATH")
 
+# tempo máximo (segundos) de execução de mx, i2id, ifkeys
+CLASSIC_WEBSITE_CISIS_TIMEOUT = (
+    float(os.environ.get("CLASSIC_WEBSITE_CISIS_TIMEOUT") or 0) or None
+)
+# quantidade máxima de comandos do CISIS executados simultaneamente
+CLASSIC_WEBSITE_CISIS_MAX_WORKERS = (
+    int(os.environ.get("CLASSIC_WEBSITE_CISIS_MAX_WORKERS") or 0) or None
+)
+
+# pasta onde os arquivos ID gerados por i2id são mantidos entre as execuções
+# (não informado: os arquivos ID são criados em pastas temporárias)
+CLASSIC_WEBSITE_ID_FILE_CACHE_PATH = os.environ.get(
+    "CLASSIC_WEBSITE_ID_FILE_CACHE_PATH"
+)
+# tamanho total máximo (bytes) dos arquivos ID mantidos
+CLASSIC_WEBSITE_ID_FILE_CACHE_MAX_BYTES = (
+    int(os.environ.get("CLASSIC_WEBSITE_ID_FILE_CACHE_MAX_BYTES") or 0) or None
+)
+
 CLASSIC_WEBSITE_BASES_WORK_PATH = os.environ.get("CLASSIC_WEBSITE_BASES_WORK_PATH")
 CLASSIC_WEBSITE_BASES_XML_PATH = os.environ.get("CLASSIC_WEBSITE_BASES_XML_PATH")
 CLASSIC_WEBSITE_BASES_PDF_PATH = os.environ.get("CLASSIC_WEBSITE_BASES_PDF_PATH")
@@ -89,5 +111,13 @@ def get_bases_artigo_path():
     return os.path.join(CLASSIC_WEBSITE_BASES_PATH, "artigo", "artigo")
 
 
+def get_bases_title_path():
+    return os.path.join(CLASSIC_WEBSITE_BASES_PATH, "title", "title")
+
+
+def get_bases_issue_path():
+    return os.path.join(CLASSIC_WEBSITE_BASES_PATH, "issue", "issue")
+
+
 def get_htdocs_path():
     return os.path.dirname(os.path.dirname(CLASSIC_WEBSITE_HTDOCS_IMG_REVISTAS_PATH))
@@ -28,3 +28,19 @@ class MissingConfigurationError(Exception):
 
 class MustBeDirectoryError(Exception):
     ...
+
+
+class MasterFileError(Exception):
+    ...
+
+
+class CisisCommandError(Exception):
+    ...
+
+
+class RecordsFileError(Exception):
+    ...
+
+
+class IssueNotFoundError(Exception):
+    ...
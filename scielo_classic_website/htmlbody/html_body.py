@@ -6,11 +6,68 @@ from lxml.html import fromstring, iterlinks, rewrite_links, tostring
 from scielo_classic_website.utils.files_utils import read_file
 
 
+class AssetLinks:
+    """
+    Obtém o link novo (a partir de htdocs ou bases) dos links de
+    `img/@src` e `a/@href` dos textos HTML, consultando o sistema de
+    arquivos uma única vez por link
+
+    Parameters
+    ----------
+    asset_files: list of dict
+        arquivos conhecidos, com a chave `path`, por exemplo,
+        `IssueFiles.htdocs_img_revistas_files`. Os links que correspondem
+        a estes arquivos são resolvidos sem `realpath` e `stat`
+    """
+
+    FOLDERS = ("htdocs", "bases")
+
+    def __init__(self, asset_files=None):
+        self._index = {
+            os.path.abspath(item["path"]): item["path"] for item in asset_files or []
+        }
+        # path absoluto do link: link novo ou None
+        self._new_links = {}
+
+    def get_new_link(self, old_link):
+        """
+        Returns
+        -------
+        str or None
+            link novo ou None, se o link não é de um arquivo local
+        """
+        if ":" in old_link:
+            return None
+        # mesmo path que realpath(old_link) usa para links relativos
+        path = os.path.join(os.getcwd(), old_link)
+        try:
+            return self._new_links[path]
+        except KeyError:
+            pass
+
+        file_path = self._index.get(os.path.normpath(path))
+        if file_path is None:
+            file_path = os.path.realpath(path)
+            if not os.path.isfile(file_path):
+                file_path = None
+
+        new_link = None
+        if file_path:
+            for folder in self.FOLDERS:
+                if folder in file_path:
+                    new_link = file_path[file_path.find(folder) + len(folder) :]
+                    break
+        self._new_links[path] = new_link
+        return new_link
+
+
 class HTMLFile:
     """ """
 
-    def __init__(self, file_path):
-        self._html_content = HTMLContent(read_file(file_path, encoding="iso-8859-1"))
+    def __init__(self, file_path, asset_links=None):
+        self._html_content = HTMLContent(
+            read_file(file_path, encoding="iso-8859-1"), asset_links
+        )
 
     @property
     def asset_path_fixes(self):
@@ -34,8 +91,10 @@ class HTMLFile:
 
 
 class HTMLContent:
-    def __init__(self, content=None):
+    def __init__(self, content=None, asset_links=None):
         self._content = content
+        # compartilhado por old_and_new_links e replace_old_and_new_links
+        self._asset_links = asset_links or AssetLinks()
 
     @property
     def body_content(self):
@@ -77,17 +136,10 @@ class HTMLContent:
                 old_link = node.get(attr)
                 if not old_link:
                     continue
-                if ":" not in old_link:
-                    new_link = os.path.realpath(old_link)
-                    if os.path.isfile(new_link):
-                        for folder in ("htdocs", "bases"):
-                            if folder in new_link:
-                                new_link = new_link[
-                                    new_link.find(folder) + len(folder) :
-                                ]
-                                logging.info(f"{old_link} {new_link}")
-                                yield {"old_link": old_link, "new_link": new_link}
-                                break
+                new_link = self._asset_links.get_new_link(old_link)
+                if new_link is not None:
+                    logging.info(f"{old_link} {new_link}")
+                    yield {"old_link": old_link, "new_link": new_link}
 
     def replace_old_and_new_links(self):
         if not self.tree:
@@ -97,18 +149,11 @@ class HTMLContent:
                 old_link = node.get(attr)
                 if not old_link:
                     continue
-                if ":" not in old_link:
-                    new_link = os.path.realpath(old_link)
-                    if os.path.isfile(new_link):
-                        for folder in ("htdocs", "bases"):
-                            if folder in new_link:
-                                new_link = new_link[
-                                    new_link.find(folder) + len(folder) :
-                                ]
-                                logging.info(f"{old_link} {new_link}")
-                                node.set("data-old-link", old_link)
-                                node.set(attr, new_link)
-                                break
+                new_link = self._asset_links.get_new_link(old_link)
+                if new_link is not None:
+                    logging.info(f"{old_link} {new_link}")
+                    node.set("data-old-link", old_link)
+                    node.set(attr, new_link)
         self._content = tostring(self._tree, encoding="utf-8").decode("utf-8")
 
 
@@ -127,11 +172,12 @@ class BodyFromISIS:
     def get_paragraphs_data(self, p_records):
         for item in p_records:
             # item.data (dict which keys: text, index, reference_index)
-            if item.data["text"]:
-                html_content = HTMLContent(item.data["text"])
-                html_content.replace_old_and_new_links()
-                item.data["text"] = html_content.body_content
-                yield item.data
+            # é criado a cada acesso; obtém uma única vez
+            data = item.data
+            if data["text"]:
+                # o texto é mantido como está; o parse do HTML
+                # é feito uma única vez, na conversão para XML (RemoveCDATAPipe)
+                yield data
 
     @property
     def before_references_paragraphs(self):
@@ -153,12 +153,17 @@ def cleanup_string(text):
 
 
 def remove_control_characters(data):
+    if data.isprintable():
+        # não há caracteres de controle (categoria "C")
+        return data
     return "".join(ch for ch in data if unicodedata.category(ch)[0] != "C")
 
 
 def html_decode(string):
     try:
-        string = html_parser(string)
+        if "&" in string:
+            # há entidades a decodificar
+            string = html_parser(string)
     except Exception as e:
         logging.exception(f"html_decode({string} {e}")
         return string
@@ -1,7 +1,10 @@
+import re
 from io import StringIO
 
 from lxml import etree as ET
 
+from scielo_classic_website.spsxml.utils import get_html_parser
+
 STYLES = (
     ("<u ", '<span name="style_underline" '),
     ("<strong ", '<span name="style_bold" '),
@@ -27,18 +30,39 @@ STYLES = (
 )
 
 
-def get_html_tree(html_str):
-    parser = ET.HTMLParser()
+# STYLES, em minúsculas e em maiúsculas, em uma única expressão.
+# Todas as tags começam por "<" e não há outro "<" nelas nem nas
+# substituições, então o resultado é o mesmo de aplicar cada
+# `str.replace` em sequência
+_STYLES_REPLACEMENTS = {}
+for old, new in STYLES:
+    _STYLES_REPLACEMENTS.setdefault(old, new)
+    _STYLES_REPLACEMENTS.setdefault(old.upper(), new)
+_STYLES_REGEX = re.compile("|".join(map(re.escape, _STYLES_REPLACEMENTS)))
+
+
+def _replace_style(match):
+    return _STYLES_REPLACEMENTS[match.group()]
 
-    for old, new in STYLES:
-        html_str = html_str.replace(old, new)
-        html_str = html_str.replace(old.upper(), new)
-    return ET.parse(StringIO(html_str), parser)
+
+def fix_styles(html_str):
+    """
+    Substitui as tags de estilo (STYLES) por `span`, percorrendo
+    o texto uma única vez
+    """
+    return _STYLES_REGEX.sub(_replace_style, html_str)
+
+
+def get_html_tree(html_str):
+    return ET.parse(StringIO(fix_styles(html_str)), get_html_parser())
 
 
 def get_mixed_citation_node(reference_html_paragraph):
-    html_tree = get_html_tree(reference_html_paragraph)
-    p = html_tree.find(".//body/p")
+    root = ET.HTML(fix_styles(reference_html_paragraph), get_html_parser())
+    if root is None:
+        # texto somente com espaços
+        return None
+    p = root.find(".//body/p")
     if p is not None:
         p.tag = "mixed-citation"
     return p
@@ -28,6 +28,9 @@ to JSON
 
 """
 import logging
+import sys
+from collections.abc import Mapping
+from itertools import chain
 
 
 def get_id_function(db_type):
@@ -43,14 +46,29 @@ def pids_and_their_records(id_file_path, db_type):
     logging.info("pids_and_their_records %s %s" % (id_file_path, db_type))
     if not id_file_path:
         return []
-    id_function = get_id_function(db_type)
+    rows = get_id_file_rows(id_file_path)
+    return pids_and_their_records_from_rows(rows, db_type)
 
-    rows = _get_id_file_rows(id_file_path)
-    logging.info("pids_and_their_records rows=%s" % rows)
 
-    records = _join_id_file_rows_and_return_records(rows)
-    logging.info("pids_and_their_records records=%s" % records)
-    return _get_id_and_json_records(records, id_function)
+def pids_and_their_records_from_rows(id_file_rows, db_type):
+    """
+    Obtém os registros agrupados por ID a partir das linhas de conteúdo
+    no formato ID, por exemplo, a saída padrão de `i2id`
+
+    Parameters
+    ----------
+    id_file_rows: iterable of str
+    db_type: str
+
+    Returns
+    -------
+    generator of tuple (_id, list of CompactRecord)
+    """
+    records = (
+        _build_compact_record(fields)
+        for fields in get_records_fields(id_file_rows, _split_field)
+    )
+    return group_records_by_id(records, get_id_function(db_type))
 
 
 def _get_value(data, tag):
@@ -78,24 +96,61 @@ def _get_items(data, tag):
         return None
 
 
+# identificadores de subcampo válidos
+SUBFIELD_KEYS = frozenset("_abcdefghijklmnopqrstuvwxyz123456789")
+
+
 def _parse_field_content(content):
+    """
+    Obtém os subcampos de `content`
+
+    Separa os subcampos com `str.split` e constrói o dicionário
+    diretamente. Os conteúdos com `^` seguido de caractere que não é
+    identificador de subcampo são tratados por
+    `_parse_field_content_with_invalid_subfields`
+
+    Parameters
+    ----------
+    content: str
+        "New record of Blepharicnema splendens^len"
+
+    Returns
+    -------
+    dict
+        {"_": "New record of Blepharicnema splendens", "l": "en"}
+    """
     if not content:
         return
     if "^" not in content:
         return {"_": content}
-    if not content.startswith("^"):
+    if content[0] != "^":
         content = "^_" + content
-    content = content.replace("\\^", "ESCAPECIRC")
-    subfields = content.split("^")
+    if "\\^" in content:
+        content = content.replace("\\^", "ESCAPECIRC")
+    d = {}
+    for subf in content.split("^"):
+        if not subf:
+            continue
+        s = subf[0]
+        if s not in SUBFIELD_KEYS:
+            return _parse_field_content_with_invalid_subfields(content)
+        if len(subf) > 1:
+            d[s] = subf[1:]
+    return d
+
+
+def _parse_field_content_with_invalid_subfields(content):
+    # `^` seguido de caractere inválido é mantido, como `\^`,
+    # no conteúdo do subcampo anterior
     items = []
-    for subf in subfields:
+    for subf in content.split("^"):
         if not subf:
             continue
         s = subf[0]
-        if s in "_abcdefghijklmnopqrstuvwxyz123456789":
+        if s in SUBFIELD_KEYS:
             items.append([s, subf[1:]])
         else:
-            items.append(["", "\\^" + s + subf[1:]])
+            items.append(["", "\\^" + subf])
 
     for i, item in enumerate(items):
         s, v = item
@@ -110,13 +165,54 @@ def _parse_field_content(content):
     return d
 
 
+def _split_field(data):
+    """
+    Obtém a tag e o conteúdo, sem separar os subcampos, de uma linha
+    no formato ID
+
+    Parameters
+    ----------
+    data: str
+        "!v012!New record of Blepharicnema splendens^len"
+
+    Returns
+    -------
+    tuple (str, str)
+        ("v012", "New record of Blepharicnema splendens^len")
+    """
+    second_excl_char_pos = data.find("!", 1)
+    if second_excl_char_pos < 0:
+        second_excl_char_pos = 0
+    return (data[1:second_excl_char_pos], data[second_excl_char_pos + 1 :])
+
+
 def _parse_field(data):
-    second_excl_char_pos = data[1:].find("!") + 1
+    second_excl_char_pos = data.find("!", 1)
+    if second_excl_char_pos < 0:
+        second_excl_char_pos = 0
     tag = data[1:second_excl_char_pos]
     subfields = _parse_field_content(data[second_excl_char_pos + 1 :])
     return (tag, subfields)
 
 
+def _has_subfields(content):
+    """
+    Indica se `_parse_field_content(content)` obtém algum subcampo,
+    sem construir o dicionário na maioria dos casos
+    """
+    if not content:
+        return False
+    if content[0] != "^":
+        # o subcampo "_" tem o conteúdo até o primeiro `^`
+        return True
+    if "\\^" in content:
+        return bool(_parse_field_content(content))
+    for subf in content.split("^"):
+        if len(subf) > 1 and subf[0] in SUBFIELD_KEYS:
+            return True
+    return bool(_parse_field_content(content))
+
+
 def _build_record(record):
     if not record:
         return
@@ -124,11 +220,122 @@ def _build_record(record):
     for k, v in record:
         if not k or not v:
             continue
-        data.setdefault(k, [])
-        data[k].append(v)
+        # as tags se repetem em todos os registros, mantém uma única cópia
+        k = sys.intern(k)
+        if k in data:
+            data[k].append(v)
+        else:
+            data[k] = [v]
     return data
 
 
+class _RecordLayout:
+    """
+    Tags de um `CompactRecord` e a posição das ocorrências de cada tag,
+    compartilhadas pelos registros que têm os mesmos campos
+    """
+
+    __slots__ = ("tags_and_totals", "tags", "positions")
+
+    def __init__(self, tags_and_totals):
+        self.tags_and_totals = tags_and_totals
+        self.tags = tuple(tag for tag, total in tags_and_totals)
+        self.positions = {}
+        start = 0
+        for tag, total in tags_and_totals:
+            self.positions[tag] = (start, start + total)
+            start += total
+
+    def __reduce__(self):
+        return (_get_record_layout, (self.tags_and_totals,))
+
+
+# estruturas de registro já conhecidas
+_RECORD_LAYOUTS = {}
+
+# limite de estruturas mantidas em `_RECORD_LAYOUTS`
+MAX_RECORD_LAYOUTS = 10000
+
+
+def _get_record_layout(tags_and_totals):
+    try:
+        return _RECORD_LAYOUTS[tags_and_totals]
+    except KeyError:
+        layout = _RecordLayout(tags_and_totals)
+        if len(_RECORD_LAYOUTS) < MAX_RECORD_LAYOUTS:
+            _RECORD_LAYOUTS[tags_and_totals] = layout
+        return layout
+
+
+class CompactRecord(Mapping):
+    """
+    Registro com o mesmo conteúdo do `dict` de `_build_record`,
+    `{"v010": [{"s": "surname", ...}]}`, ocupando menos memória
+
+    Guarda o conteúdo de cada ocorrência, como está no arquivo ID,
+    em uma única tupla. As tags e a posição das suas ocorrências na
+    tupla são compartilhadas entre os registros com os mesmos campos.
+    Os subcampos são obtidos a cada acesso ao campo, então a lista
+    retornada não altera o registro
+    """
+
+    __slots__ = ("_layout", "_contents")
+
+    def __init__(self, layout, contents):
+        self._layout = layout
+        self._contents = contents
+
+    def __getitem__(self, tag):
+        start, stop = self._layout.positions[tag]
+        return [_parse_field_content(content) for content in self._contents[start:stop]]
+
+    def __contains__(self, tag):
+        return tag in self._layout.positions
+
+    def __iter__(self):
+        return iter(self._layout.tags)
+
+    def __len__(self):
+        return len(self._layout.tags)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (CompactRecord, (self._layout, self._contents))
+
+
+def _build_compact_record(fields):
+    """
+    Constrói o registro a partir de campos cujo conteúdo não foi separado
+    em subcampos
+
+    Parameters
+    ----------
+    fields: list of tuple (tag, content)
+        [("v012", "New record of Blepharicnema splendens^len")]
+
+    Returns
+    -------
+    CompactRecord
+    """
+    if not fields:
+        return
+    contents = {}
+    for k, v in fields:
+        if not k or not _has_subfields(v):
+            continue
+        try:
+            contents[k].append(v)
+        except KeyError:
+            # as tags se repetem em todos os registros, mantém uma única cópia
+            contents[sys.intern(k)] = [v]
+    layout = _get_record_layout(
+        tuple((tag, len(items)) for tag, items in contents.items())
+    )
+    return CompactRecord(layout, tuple(chain.from_iterable(contents.values())))
+
+
 def journal_id(data):
     return _get_value(data, "v400")
 
@@ -173,10 +380,15 @@ def _get_fields_and_their_content(content):
     return [_parse_field(row) for row in rows if row]
 
 
+# tamanho do buffer de leitura do arquivo ID
+ID_FILE_BUFFER_SIZE = 1024 * 1024
+
+
 # ok
-def _get_id_file_rows(id_file_path):
+def get_id_file_rows(id_file_path):
     """
-    Obtém uma lista de linhas do arquivo `id_file_path`
+    Obtém as linhas do arquivo `id_file_path`, uma a uma,
+    sem carregar o arquivo inteiro na memória
 
     Parameters
     ----------
@@ -185,18 +397,52 @@ def _get_id_file_rows(id_file_path):
 
     Returns
     -------
-    list of strings
+    generator of strings
     """
     try:
-        with open(id_file_path, "r", encoding="iso-8859-1") as fp:
-            for item in fp.readlines():
+        with open(
+            id_file_path, "r", encoding="iso-8859-1", buffering=ID_FILE_BUFFER_SIZE
+        ) as fp:
+            for item in fp:
                 yield item.strip()
     except FileNotFoundError:
-        return []
+        return
+
+
+def get_records_fields(id_file_rows, get_field=_parse_field):
+    """
+    Lê as linhas `id_file_rows` em uma única passagem e retorna os campos
+    de cada registro assim que a linha `!ID` do registro seguinte é lida
+
+    Parameters
+    ----------
+    id_file_rows: iterable of str
+        linhas do arquivo ID
+    get_field: callable
+        obtém o campo de uma linha, `_parse_field` ou `_split_field`
+
+    Returns
+    -------
+    generator of list of tuple (tag, subfields)
+    """
+    fields = []
+    for row in id_file_rows:
+        row = row.strip()
+        if not row:
+            continue
+        if row[:4] == "!ID ":
+            if fields:
+                yield fields
+                # inicia um novo registro
+                fields = []
+        else:
+            fields.append(get_field(row))
+    if fields:
+        yield fields
 
 
 # ok
-def _join_id_file_rows_and_return_records(id_file_rows):
+def join_id_file_rows_and_return_records(id_file_rows):
     """
     Junta linhas `id_file_rows` que formam registros (str) e os retorna
 
@@ -228,7 +474,7 @@ def _join_id_file_rows_and_return_records(id_file_rows):
 
 
 # ok
-def _get_id_and_json_records(records, get_id_function):
+def get_id_and_json_records(records, get_id_function):
     """
     Given `records` e `get_id_function`, returns `_id` and `json_records`
 
@@ -243,13 +489,34 @@ def _get_id_and_json_records(records, get_id_function):
     -------
     list of strings
     """
+    return group_records_by_id(
+        (
+            _build_record(_get_fields_and_their_content(record_content))
+            for record_content in records
+            if record_content
+        ),
+        get_id_function,
+    )
+
+
+def group_records_by_id(records, get_id_function):
+    """
+    Agrupa registros consecutivos (`dict`) que têm o mesmo ID
+
+    Parameters
+    ----------
+    records: iterable of dict
+        registros no formato `{"v010": [{"s": "surname", ...}]}`
+    get_id_function: callable
+        função que gera o ID do registro
+
+    Returns
+    -------
+    generator of tuple (_id, list of dict)
+    """
     _id = None
     _id_records = []
-    for record_content in records:
-        if not record_content:
-            continue
-        fields = _get_fields_and_their_content(record_content)
-        data = _build_record(fields)
+    for data in records:
         if not data:
             continue
         _next_id = get_id_function(data)
@@ -0,0 +1,320 @@
+"""
+Formato binário para gravar e ler a saída de `pids_and_their_records`,
+sem serializar em JSON ou pickle e sem decodificar o arquivo inteiro.
+
+Tags (`v010`) e identificadores de subcampos (`s`, `_`) são gravados
+uma única vez em uma tabela de strings; registros referenciam os índices.
+
+```
+MAGIC
+grupo 1 ... grupo N
+tabela de strings       uint32 quantidade, (uint32 tamanho, utf-8) ...
+índice dos grupos       (uint32 id, uint64 posição, uint32 registros) ...
+rodapé                  uint64 posição da tabela, uint64 posição do índice,
+                        uint32 quantidade de grupos, MAGIC
+```
+
+Grupo (`_id`, registros): posição de cada registro (uint32, relativa
+ao início do grupo) seguida dos registros. Registro: uint16 quantidade de
+tags; para cada tag, uint32 tag, uint16 ocorrências; para cada ocorrência,
+uint16 quantidade de subcampos; para cada subcampo,
+uint32 identificador, uint32 tamanho e o conteúdo em utf-8.
+
+O leitor usa `mmap` e decodifica somente os registros acessados.
+"""
+import mmap
+import os
+import struct
+
+from scielo_classic_website import exceptions
+
+MAGIC = b"SCLREC01"
+RECORDS_FILE_EXTENSION = ".rec"
+
+# `_id` ausente (`None`)
+NO_ID = 0xFFFFFFFF
+
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_TAG = struct.Struct("<IH")
+_SUBFIELD = struct.Struct("<II")
+_INDEX_ENTRY = struct.Struct("<IQI")
+_FOOTER = struct.Struct("<QQI8s")
+
+
+class _StringTable:
+    def __init__(self):
+        self.strings = []
+        self._ids = {}
+
+    def get_id(self, text):
+        try:
+            return self._ids[text]
+        except KeyError:
+            self._ids[text] = len(self.strings)
+            self.strings.append(text)
+            return self._ids[text]
+
+    def encode(self):
+        parts = [_UINT32.pack(len(self.strings))]
+        for text in self.strings:
+            encoded = text.encode("utf-8")
+            parts.append(_UINT32.pack(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+
+
+def _encode_record(record, string_table):
+    parts = [_UINT16.pack(len(record))]
+    for tag, occurrences in record.items():
+        parts.append(_TAG.pack(string_table.get_id(tag), len(occurrences)))
+        for subfields in occurrences:
+            parts.append(_UINT16.pack(len(subfields)))
+            for key, value in subfields.items():
+                encoded = value.encode("utf-8")
+                parts.append(_SUBFIELD.pack(string_table.get_id(key), len(encoded)))
+                parts.append(encoded)
+    return b"".join(parts)
+
+
+def _encode_group(records, string_table):
+    encoded_records = [_encode_record(record, string_table) for record in records]
+    position = _UINT32.size * (len(records) + 1)
+    offsets = []
+    for encoded in encoded_records:
+        offsets.append(position)
+        position += len(encoded)
+    header = struct.pack(f"<I{len(offsets)}I", len(offsets), *offsets)
+    return header + b"".join(encoded_records)
+
+
+def write_records_file(file_path, pids_and_records):
+    """
+    Grava os registros agrupados por ID no formato binário
+
+    Parameters
+    ----------
+    file_path: str
+    pids_and_records: iterable of tuple (_id, list of dict)
+        por exemplo, o retorno de `id2json3.pids_and_their_records`
+
+    Returns
+    -------
+    int
+        quantidade de grupos gravados
+    """
+    string_table = _StringTable()
+    index = []
+    temp_file_path = file_path + ".tmp"
+    try:
+        with open(temp_file_path, "wb") as fp:
+            fp.write(MAGIC)
+            for _id, records in pids_and_records:
+                _id = NO_ID if _id is None else string_table.get_id(_id)
+                index.append((_id, fp.tell(), len(records)))
+                fp.write(_encode_group(records, string_table))
+
+            string_table_position = fp.tell()
+            fp.write(string_table.encode())
+
+            index_position = fp.tell()
+            for entry in index:
+                fp.write(_INDEX_ENTRY.pack(*entry))
+            fp.write(
+                _FOOTER.pack(string_table_position, index_position, len(index), MAGIC)
+            )
+        os.replace(temp_file_path, file_path)
+    finally:
+        if os.path.isfile(temp_file_path):
+            os.unlink(temp_file_path)
+    return len(index)
+
+
+class LazyRecords:
+    """
+    Registros de um grupo, decodificados somente quando acessados
+    """
+
+    def __init__(self, records_file, position, total):
+        self._records_file = records_file
+        self._position = position
+        self._total = total
+        self._cache = {}
+
+    def __len__(self):
+        return self._total
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._total))]
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError("record index out of range")
+        if index not in self._cache:
+            self._cache[index] = self._records_file._decode_record(
+                self._position, index
+            )
+        return self._cache[index]
+
+    def __iter__(self):
+        for i in range(self._total):
+            yield self[i]
+
+
+class RecordsFile:
+    """
+    Leitura de um arquivo gravado por `write_records_file`
+
+    Parameters
+    ----------
+    file_path: str
+
+    Raises
+    ------
+    exceptions.RecordsFileError
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._fp = open(file_path, "rb")
+        try:
+            self._data = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_footer()
+        except (ValueError, struct.error) as e:
+            self.close()
+            raise exceptions.RecordsFileError(f"Invalid records file {file_path}: {e}")
+        except exceptions.RecordsFileError:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        data = getattr(self, "_data", None)
+        if data is not None:
+            data.close()
+            self._data = None
+        self._fp.close()
+
+    def _read_footer(self):
+        data = self._data
+        if data[: len(MAGIC)] != MAGIC:
+            raise exceptions.RecordsFileError(f"Invalid records file {self.file_path}")
+        string_table_position, index_position, total, magic = _FOOTER.unpack_from(
+            data, len(data) - _FOOTER.size
+        )
+        if magic != MAGIC:
+            raise exceptions.RecordsFileError(
+                f"Incomplete records file {self.file_path}"
+            )
+
+        strings = []
+        (count,) = _UINT32.unpack_from(data, string_table_position)
+        position = string_table_position + _UINT32.size
+        for i in range(count):
+            (size,) = _UINT32.unpack_from(data, position)
+            position += _UINT32.size
+            strings.append(data[position : position + size].decode("utf-8"))
+            position += size
+        self._strings = strings
+
+        self._index = [
+            _INDEX_ENTRY.unpack_from(data, index_position + i * _INDEX_ENTRY.size)
+            for i in range(total)
+        ]
+        self._positions = {}
+        for _id, position, records_total in self._index:
+            self._positions.setdefault(self._get_id(_id), (position, records_total))
+
+    def _get_id(self, _id):
+        if _id == NO_ID:
+            return None
+        return self._strings[_id]
+
+    def _decode_record(self, group_position, index):
+        data = self._data
+        strings = self._strings
+        (offset,) = _UINT32.unpack_from(
+            data, group_position + _UINT32.size * (index + 1)
+        )
+        position = group_position + offset
+        (tags_total,) = _UINT16.unpack_from(data, position)
+        position += _UINT16.size
+        record = {}
+        for i in range(tags_total):
+            tag, occurrences_total = _TAG.unpack_from(data, position)
+            position += _TAG.size
+            occurrences = []
+            for j in range(occurrences_total):
+                (subfields_total,) = _UINT16.unpack_from(data, position)
+                position += _UINT16.size
+                subfields = {}
+                for k in range(subfields_total):
+                    key, size = _SUBFIELD.unpack_from(data, position)
+                    position += _SUBFIELD.size
+                    subfields[strings[key]] = data[position : position + size].decode(
+                        "utf-8"
+                    )
+                    position += size
+                occurrences.append(subfields)
+            record[strings[tag]] = occurrences
+        return record
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, _id):
+        return _id in self._positions
+
+    def ids(self):
+        return [self._get_id(_id) for _id, position, total in self._index]
+
+    def get_records(self, _id):
+        """
+        Obtém os registros do grupo `_id`
+
+        Returns
+        -------
+        LazyRecords
+        """
+        position, total = self._positions[_id]
+        return LazyRecords(self, position, total)
+
+    def pids_and_their_records(self):
+        """
+        Obtém os grupos na ordem em que foram gravados
+
+        Returns
+        -------
+        generator of tuple (_id, LazyRecords)
+        """
+        for _id, position, total in self._index:
+            yield self._get_id(_id), LazyRecords(self, position, total)
+
+
+def pids_and_their_records(file_path):
+    """
+    Obtém os registros agrupados por ID do arquivo `file_path`,
+    assim como `id2json3.pids_and_their_records` faz para arquivos ID
+
+    Returns
+    -------
+    generator of tuple (_id, list of dict)
+
+    Raises
+    ------
+    exceptions.RecordsFileError
+    """
+    records_file = RecordsFile(file_path)
+    return _pids_and_their_records(records_file)
+
+
+def _pids_and_their_records(records_file):
+    with records_file:
+        for _id, records in records_file.pids_and_their_records():
+            yield _id, list(records)
@@ -0,0 +1,238 @@
+"""
+Migração incremental dos documentos.
+
+A data de processamento (OAITS) mais recente já migrada é gravada,
+por coleção, em um arquivo JSON, com os PIDs dos documentos cuja
+migração falhou. Cada execução consulta somente os documentos
+atualizados a partir desta data e tenta migrar novamente os que falharam.
+
+```
+{
+    "scl": {"date": "20210917", "failed_pids": ["S0044-59672019000300242"]},
+    "arg": {"date": "20210915", "failed_pids": []}
+}
+```
+
+A data é incluída na consulta seguinte, pois outros documentos podem
+ter sido processados na mesma data. A data avança até a do último
+documento consultado, mesmo que algum documento falhe; somente se a
+execução é interrompida, ela não avança além do primeiro documento
+não processado.
+"""
+import json
+import logging
+import os
+
+from scielo_classic_website import config, exceptions
+from scielo_classic_website.iid2json import id2json3
+from scielo_classic_website.isisdb import isis_cmd, master_file
+from scielo_classic_website.isisdb.master_file import MasterFile
+from scielo_classic_website.isisdb.pid_index import PidIndex
+from scielo_classic_website.models.catalog import Catalog
+
+
+class HighWaterMark:
+    """
+    Parameters
+    ----------
+    file_path: str
+        arquivo JSON com a data OAITS mais recente migrada de cada coleção
+        e os PIDs dos documentos cuja migração falhou
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def _read(self):
+        try:
+            with open(self.file_path, encoding="utf-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+
+    def _get_entry(self, collection):
+        entry = self._read().get(collection)
+        if entry is None or isinstance(entry, str):
+            # formato anterior: somente a data
+            return {"date": entry, "failed_pids": []}
+        return entry
+
+    def get(self, collection):
+        return self._get_entry(collection).get("date")
+
+    def get_failed_pids(self, collection):
+        """
+        Returns
+        -------
+        list of str
+            PIDs dos documentos cuja migração falhou
+        """
+        return self._get_entry(collection).get("failed_pids") or []
+
+    def set(self, collection, date, failed_pids=None):
+        content = self._read()
+        content[collection] = {"date": date, "failed_pids": list(failed_pids or [])}
+        temp_file_path = self.file_path + ".tmp"
+        with open(temp_file_path, "w", encoding="utf-8") as fp:
+            json.dump(content, fp)
+        os.replace(temp_file_path, self.file_path)
+
+
+class IncrementalMigration:
+    """
+    Parameters
+    ----------
+    collection: str
+        acrônimo da coleção
+    high_water_mark: HighWaterMark
+    get_document_pids: callable
+        `get_document_pids(from_date, to_date)`, que retorna
+        dicts `{"updated": "YYYYMMDD", "pid": pid}`.
+        Padrão: `isis_cmd.get_document_pids`
+    migrate_document: callable
+        `migrate_document(pid)`. Padrão: `IncrementalMigration.migrate_document`
+    catalog: Catalog
+        periódicos e fascículos dos documentos. Padrão: catálogo das bases
+        `title` e `issue` de CLASSIC_WEBSITE_BASES_PATH, criado no primeiro uso
+    """
+
+    def __init__(
+        self,
+        collection,
+        high_water_mark,
+        get_document_pids=None,
+        migrate_document=None,
+        catalog=None,
+    ):
+        self.collection = collection
+        self.high_water_mark = high_water_mark
+        self._get_document_pids = get_document_pids or isis_cmd.get_document_pids
+        self._migrate_document = migrate_document or self.migrate_document
+        self._catalog = catalog
+        self._pid_index = None
+
+    def get_changed_documents(self, to_date=None):
+        """
+        Obtém os documentos atualizados desde a última migração
+
+        Returns
+        -------
+        list of dict
+            `{"updated": "YYYYMMDD", "pid": pid}`, um por pid,
+            ordenados pela data de atualização
+        """
+        from_date = self.high_water_mark.get(self.collection)
+        items = {}
+        for item in self._get_document_pids(from_date, to_date):
+            # mantém a atualização mais recente de cada pid
+            if item["updated"] >= items.get(item["pid"], item)["updated"]:
+                items[item["pid"]] = item
+        return sorted(items.values(), key=lambda item: item["updated"])
+
+    def get_document_records(self, pid):
+        if self._pid_index is None:
+            self._pid_index = PidIndex(MasterFile(config.get_bases_artigo_path()))
+        return self._pid_index.get_records(pid)
+
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            self._catalog = Catalog(
+                master_file.pids_and_their_records(
+                    config.get_bases_title_path(), "title"
+                ),
+                master_file.pids_and_their_records(
+                    config.get_bases_issue_path(), "issue"
+                ),
+            )
+        return self._catalog
+
+    def get_paragraphs_records(self, pid):
+        """
+        Obtém os registros dos parágrafos (`p`) do documento,
+        assim como `ClassicWebsite.get_documents_pids_and_records`
+        """
+        id_file_path = config.get_paragraphs_id_file_path(pid)
+        if not os.path.isfile(id_file_path):
+            return []
+        for _id, records in id2json3.pids_and_their_records(id_file_path, "artigo"):
+            return records
+        return []
+
+    def migrate_document(self, pid):
+        """
+        Obtém os registros do documento `pid` e gera o seu XML,
+        com o periódico e o fascículo do catálogo
+
+        Raises
+        ------
+        exceptions.IssueNotFoundError
+        """
+        # S + ISSN + ano + número de ordem
+        issue_pid = pid[1:18]
+        issue_context = self.catalog.get_issue_context(issue_pid)
+        if issue_context is None:
+            raise exceptions.IssueNotFoundError(
+                f"Unable to migrate {pid}: issue {issue_pid} not found"
+            )
+        records = self.get_document_records(pid) + self.get_paragraphs_records(pid)
+        document = issue_context.get_document(records, pid)
+        return document.generate_full_xml()
+
+    def run(self, to_date=None):
+        """
+        Migra novamente os documentos que falharam na execução anterior
+        e os documentos atualizados desde a última migração, e atualiza
+        a data da última migração e os PIDs que falharam
+
+        Returns
+        -------
+        generator of tuple (pid, result)
+            `result` é o retorno de `migrate_document`
+            ou a exceção ocorrida
+        """
+        items = self.get_changed_documents(to_date)
+        changed_pids = set(item["pid"] for item in items)
+        retry_pids = [
+            pid
+            for pid in self.high_water_mark.get_failed_pids(self.collection)
+            if pid not in changed_pids
+        ]
+        pids = retry_pids + [item["pid"] for item in items]
+        logging.info(
+            "Incremental migration %s: %i documents, %i to retry"
+            % (self.collection, len(items), len(retry_pids))
+        )
+        failed_pids = []
+        processed = 0
+        try:
+            for pid in pids:
+                try:
+                    result = self._migrate_document(pid)
+                except Exception as e:
+                    logging.exception("Unable to migrate %s: %s" % (pid, e))
+                    failed_pids.append(pid)
+                    result = e
+                processed += 1
+                yield pid, result
+        finally:
+            self._update_high_water_mark(retry_pids, items, processed, failed_pids)
+
+    def _update_high_water_mark(self, retry_pids, items, processed, failed_pids):
+        # os documentos a migrar novamente que não foram processados,
+        # porque a execução foi interrompida, continuam pendentes
+        failed_pids = failed_pids + retry_pids[processed:]
+        processed_items = max(0, processed - len(retry_pids))
+        current = (
+            self.high_water_mark.get(self.collection),
+            self.high_water_mark.get_failed_pids(self.collection),
+        )
+        date = current[0]
+        if processed_items < len(items):
+            # a execução foi interrompida, avança somente até
+            # o primeiro documento não processado
+            date = items[processed_items]["updated"]
+        elif items:
+            date = items[-1]["updated"]
+        if (date, failed_pids) != current:
+            self.high_water_mark.set(self.collection, date, failed_pids)
@@ -1,5 +1,5 @@
 # generated by ModelBuilder
-from scielo_classic_website.isisdb.meta_record import MetaRecord
+from scielo_classic_website.isisdb.meta_record import MetaRecord, field_property
 
 ATTRIBUTES = (
     "fulltexts",
@@ -142,6 +142,8 @@ def adapt_data(original):
 
 # generated by ModelBuilder
 class BaseDocumentRecord(MetaRecord):
+    __slots__ = ()
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
 
@@ -151,7 +153,7 @@ class BaseDocumentRecord(MetaRecord):
         return dict([(k, getattr(self, k)) for k in ATTRIBUTES])
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def text_languages(self):
         """
         Fulltexts languages
@@ -160,7 +162,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v601", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def html_url(self):
         """
         Html Url
@@ -169,7 +171,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_ahead_of_print(self):
         """
         Is Ahead Of Print
@@ -178,7 +180,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def issue(self):
         """
         Issue
@@ -187,7 +189,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def issue_label(self):
         """
         Issue Label
@@ -196,7 +198,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def issue_url(self):
         """
         Issue Url
@@ -205,7 +207,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def journal(self):
         """
         Journal
@@ -214,7 +216,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def mixed_affiliations(self):
         """
         Mixed Affiliations
@@ -223,7 +225,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def pdf_url(self):
         """
         Pdf Url
@@ -232,7 +234,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def translated_htmls(self):
         """
         Translated Htmls
@@ -241,7 +243,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def assets_code(self):
         """
         Assets Code
@@ -250,7 +252,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v004", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def authors(self):
         """
         Author
@@ -272,7 +274,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def corporative_authors(self):
         """
         Corporative Authors
@@ -281,7 +283,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v011", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def article_titles(self):
         """
         Article Titles
@@ -295,7 +297,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def page(self):
         """
         Page
@@ -309,7 +311,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def volume(self):
         """
         Volume
@@ -318,7 +320,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v031", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def issue_number(self):
         """
         Number
@@ -327,7 +329,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v032", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def journal_id(self):
         """
         Journal ID
@@ -336,7 +338,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v035", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def illustrative_material(self):
         """
         Illustrative Material
@@ -345,7 +347,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v038", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def original_language(self):
         """
         Original Language
@@ -354,7 +356,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v040", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def original_section(self):
         """
         Original Section
@@ -363,7 +365,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v049", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def section(self):
         """
         Section
@@ -372,7 +374,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v049", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def section_code(self):
         """
         Section Code
@@ -381,7 +383,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v049", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def translated_section(self):
         """
         Translated Section
@@ -390,7 +392,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v049", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def thesis_degree(self):
         """
         Thesis Degree
@@ -399,7 +401,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v051", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def thesis_organization(self):
         """
         Thesis Organization
@@ -408,7 +410,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v052", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def project_sponsor(self):
         """
         Project Sponsor
@@ -417,7 +419,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v058", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def project_name(self):
         """
         Project Name
@@ -426,7 +428,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v059", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def contract(self):
         """
         Contract
@@ -435,7 +437,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v060", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def issue_publication_date(self):
         """
         Issue Publication Date
@@ -444,7 +446,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v065", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publication_date(self):
         """
         Publication Date
@@ -453,7 +455,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v065", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def affiliations(self):
         """
         Affiliations
@@ -479,7 +481,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def article_type(self):
         """
         Article Type
@@ -488,7 +490,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v071", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def document_type(self):
         """
         Document Type
@@ -497,7 +499,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v071", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def abstracts(self):
         """
         Abstracts
@@ -511,7 +513,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def keywords(self):
         """
         Keywords
@@ -525,7 +527,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def processing_date(self):
         """
         Processing Date
@@ -534,7 +536,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v091", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def update_date(self):
         """
         Update Date
@@ -543,7 +545,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v091", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def creation_date(self):
         """
         Creation Date
@@ -552,7 +554,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v093", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def receive_date_iso(self):
         """
         Receive Date ISO
@@ -561,7 +563,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v112", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def acceptance_date_iso(self):
         """
         Acceptance Date ISO
@@ -570,7 +572,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v114", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def review_date_iso(self):
         """
         Review Date ISO
@@ -579,7 +581,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v116", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def data_model_version(self):
         """
         Data Model Version
@@ -588,7 +590,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v120", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def internal_sequence_id(self):
         """
         Internal Sequence Id
@@ -597,7 +599,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v121", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def order(self):
         """
         Order
@@ -606,7 +608,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v121", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def vol_suppl(self):
         """
         Supplement
@@ -615,7 +617,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v131", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def num_suppl(self):
         """
         Supplement
@@ -624,7 +626,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v132", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def ahead_publication_date(self):
         """
         Ahead Publication Date
@@ -633,7 +635,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v223", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def document_publication_date(self):
         """
         Document Publication Date
@@ -642,7 +644,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v223", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def doi(self):
         """
         DOI
@@ -651,7 +653,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v237", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def normalized_affiliations(self):
         """
         Normalized Affiliations
@@ -662,7 +664,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def doi_with_lang(self):
         """
         DOI with language
@@ -673,7 +675,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def any_issn(self):
         """
         Any Issn
@@ -684,7 +686,7 @@ class BaseDocumentRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def permissions(self):
         """
         Permissions
@@ -693,7 +695,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v540", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def languages(self):
         """
         Languages
@@ -702,7 +704,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v601", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def xml_languages(self):
         """
         Xml Languages
@@ -711,7 +713,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v601", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def scielo_domain(self):
         """
         Scielo Domain
@@ -720,7 +722,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v690", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def file_code(self):
         """
         File Code
@@ -729,7 +731,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v702", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def original_html(self):
         """
         Original Html
@@ -738,7 +740,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v702", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_id(self):
         """
         Publisher Id
@@ -747,7 +749,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v880", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def scielo_pid_v2(self):
         """
         SciELO PID v2
@@ -756,7 +758,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v880", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_ahead_id(self):
         """
         Publisher Ahead Id
@@ -765,7 +767,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v881", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def aop_pid(self):
         """
         Ahead Of Print Id
@@ -774,7 +776,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v881", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def scielo_pid_v3(self):
         """
         SciELO PID v3
@@ -783,7 +785,7 @@ class BaseDocumentRecord(MetaRecord):
         return self.get_field_content("v885", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def collection_acronym(self):
         """
         Collection Acronym
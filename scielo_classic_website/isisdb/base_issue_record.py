@@ -1,5 +1,5 @@
 # generated by ModelBuilder
-from scielo_classic_website.isisdb.meta_record import MetaRecord
+from scielo_classic_website.isisdb.meta_record import MetaRecord, field_property
 
 ATTRIBUTES = (
     "journal",
@@ -72,6 +72,8 @@ def adapt_data(original):
 
 # generated by ModelBuilder
 class BaseIssueRecord(MetaRecord):
+    __slots__ = ()
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
 
@@ -81,7 +83,7 @@ class BaseIssueRecord(MetaRecord):
         return dict([(k, getattr(self, k)) for k in ATTRIBUTES])
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def journal(self):
         """
         Journal
@@ -90,7 +92,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v035", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def start_month(self):
         """
         Start Month
@@ -99,7 +101,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def end_month(self):
         """
         End Month
@@ -108,7 +110,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_ahead_of_print(self):
         """
         Is Ahead Of Print
@@ -117,7 +119,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def url(self):
         """
         Url
@@ -126,7 +128,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def assets_code(self):
         """
         Assets Code
@@ -135,7 +137,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v004", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def label(self):
         """
         Label
@@ -144,7 +146,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v004", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def type(self):
         """
         Type
@@ -153,7 +155,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v031", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def volume(self):
         """
         Volume
@@ -162,7 +164,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v031", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def number(self):
         """
         Number
@@ -171,7 +173,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v032", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def titles(self):
         """
         Titles
@@ -180,7 +182,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v033", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def order(self):
         """
         Order
@@ -189,7 +191,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v036", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_press_release(self):
         """
         Is Press Release
@@ -198,7 +200,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v041", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def bibliographic_legends(self):
         """
         Bibliographic Legends
@@ -207,7 +209,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v043", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def bibliographic_strip(self):
         """
         Bibliographic strip
@@ -230,7 +232,7 @@ class BaseIssueRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def sections(self):
         """
         Sections
@@ -244,7 +246,7 @@ class BaseIssueRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publication_date(self):
         """
         Publication Date
@@ -253,7 +255,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v065", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def controlled_vocabulary(self):
         """
         Controlled Vocabulary
@@ -262,7 +264,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v085", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def processing_date(self):
         """
         Processing Date
@@ -271,7 +273,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v091", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def update_date(self):
         """
         Update Date
@@ -280,7 +282,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v091", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def creation_date(self):
         """
         Creation Date
@@ -289,7 +291,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v093", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def editorial_standard(self):
         """
         Editorial Standard
@@ -298,7 +300,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v117", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def total_documents(self):
         """
         Total Documents
@@ -307,7 +309,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v122", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def supplement_volume(self):
         """
         Supplement Volume
@@ -316,7 +318,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v131", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def supplement_number(self):
         """
         Supplement Number
@@ -325,7 +327,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v132", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_marked_up(self):
         """
         Is Marked Up
@@ -334,7 +336,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v200", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def permissions(self):
         """
         Permissions
@@ -343,7 +345,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v541", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def scielo_domain(self):
         """
         Scielo Domain
@@ -352,7 +354,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v690", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_id(self):
         """
         Publisher Id
@@ -361,7 +363,7 @@ class BaseIssueRecord(MetaRecord):
         return self.get_field_content("v880", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def collection_acronym(self):
         """
         Collection Acronym
@@ -1,14 +1,16 @@
 # generated by ModelBuilder
-from scielo_classic_website.isisdb.meta_record import MetaRecord
+from scielo_classic_website.isisdb.meta_record import MetaRecord, field_property
 
 
 # generated by ModelBuilder
 class BaseJournalRecord(MetaRecord):
+    __slots__ = ()
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def scimago_code(self):
         """
         Scimago Code
@@ -17,7 +19,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def any_issn(self):
         """
         Any Issn
@@ -26,7 +28,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def url(self):
         """
         Url
@@ -35,7 +37,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def fulltitle(self):
         """
         Fulltitle
@@ -44,7 +46,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v000", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def cnn_code(self):
         """
         Cnn Code
@@ -53,7 +55,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v020", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def secs_code(self):
         """
         Secs Code
@@ -62,7 +64,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v037", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def current_status(self):
         """
         Current Status
@@ -71,7 +73,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v050", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def status_history(self):
         """
         Status History
@@ -90,7 +92,7 @@ class BaseJournalRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def copyright_holder(self):
         """
         Copyright_holder
@@ -99,7 +101,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v062", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_address(self):
         """
         Editor Address
@@ -108,7 +110,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v063", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_email(self):
         """
         Editor Email
@@ -117,7 +119,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v064", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def acronym(self):
         """
         Acronym
@@ -126,7 +128,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v068", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def institutional_url(self):
         """
         Institutional Url
@@ -135,7 +137,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v069", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def controlled_vocabulary(self):
         """
         Controlled Vocabulary
@@ -144,7 +146,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v085", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def title(self):
         """
         Title
@@ -153,7 +155,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v100", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def subtitle(self):
         """
         Subtitle
@@ -162,7 +164,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v110", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def editorial_standard(self):
         """
         Editorial Standard
@@ -171,7 +173,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v117", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def sponsors(self):
         """
         Sponsors
@@ -180,7 +182,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v140", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def abbreviated_title(self):
         """
         Abbreviated Title
@@ -189,7 +191,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v150", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def abbreviated_iso_title(self):
         """
         Abbreviated Iso Title
@@ -198,7 +200,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v151", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def parallel_titles(self):
         """
         Parallel Titles - official titles in other languages
@@ -207,7 +209,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v230", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def other_titles(self):
         """
         Other Titles - alternative titles
@@ -216,7 +218,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v240", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def first_year(self):
         """
         First Year
@@ -225,7 +227,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v301", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def first_volume(self):
         """
         First Volume
@@ -234,7 +236,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v302", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def first_number(self):
         """
         First Number
@@ -243,7 +245,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v303", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def last_year(self):
         """
         Last Year
@@ -252,7 +254,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v304", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def last_volume(self):
         """
         Last Volume
@@ -261,7 +263,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v305", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def last_number(self):
         """
         Last Number
@@ -270,7 +272,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v306", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_country(self):
         """
         Publisher Country
@@ -279,7 +281,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v310", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_state(self):
         """
         Publisher State
@@ -288,7 +290,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v320", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publication_level(self):
         """
         Publication Level
@@ -297,7 +299,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v330", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def languages(self):
         """
         Languages
@@ -306,7 +308,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v350", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def abstract_languages(self):
         """
         Abstract Languages
@@ -315,7 +317,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v360", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def periodicity(self):
         """
         Periodicity
@@ -324,7 +326,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v380", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def periodicity_in_months(self):
         """
         Periodicity In Months
@@ -333,7 +335,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v380", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def scielo_issn(self):
         """
         Scielo Issn
@@ -342,7 +344,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v400", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def title_nlm(self):
         """
         Title Nlm
@@ -351,7 +353,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v421", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def issns(self):
         """
          Load Issn
@@ -362,7 +364,7 @@ class BaseJournalRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def subject_descriptors(self):
         """
         Subject Descriptors
@@ -371,7 +373,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v440", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def subject_areas(self):
         """
         Subject Areas
@@ -380,7 +382,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v441", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def index_coverage(self):
         """
         Index Coverage
@@ -389,7 +391,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v450", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_name(self):
         """
         Publisher Name
@@ -398,7 +400,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v480", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_loc(self):
         """
         Publisher Loc
@@ -407,7 +409,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v490", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publisher_city(self):
         """
         Publisher City
@@ -416,7 +418,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v490", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def permissions(self):
         """
         Permissions
@@ -425,7 +427,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v541", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def previous_title(self):
         """
         Previous Title
@@ -434,7 +436,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v610", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def scielo_domain(self):
         """
         Scielo Domain
@@ -443,7 +445,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v690", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def submission_url(self):
         """
         Submission Url
@@ -452,7 +454,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v692", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def publishing_model(self):
         """
         Publishing Model
@@ -461,7 +463,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v699", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_publishing_model_continuous(self):
         """
         Is Publishing Model Continuous
@@ -470,7 +472,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v699", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def next_title(self):
         """
         Next Title
@@ -479,7 +481,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v710", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_indexed_in_scie(self):
         """
         Is Indexed In Scie
@@ -488,7 +490,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v851", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def wos_citation_indexes(self):
         """
         Wos Citation Indexes
@@ -497,7 +499,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v851", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_indexed_in_ssci(self):
         """
         Is Indexed In Ssci
@@ -506,7 +508,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v852", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def is_indexed_in_ahci(self):
         """
         Is Indexed In Ahci
@@ -515,7 +517,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v853", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def wos_subject_areas(self):
         """
         Wos Subject Areas
@@ -524,7 +526,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v854", subfields={}, single=False, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def mission(self):
         """
         Mission
@@ -535,7 +537,7 @@ class BaseJournalRecord(MetaRecord):
         )
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def creation_date(self):
         """
         Creation Date
@@ -544,7 +546,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v940", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def update_date(self):
         """
         Update Date
@@ -553,7 +555,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v941", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def processing_date(self):
         """
         Processing Date
@@ -562,7 +564,7 @@ class BaseJournalRecord(MetaRecord):
         return self.get_field_content("v941", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def collection_acronym(self):
         """
         Collection Acronym
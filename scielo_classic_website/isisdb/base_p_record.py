@@ -1,5 +1,5 @@
 # generated by ModelBuilder
-from scielo_classic_website.isisdb.meta_record import MetaRecord
+from scielo_classic_website.isisdb.meta_record import MetaRecord, field_property
 
 ATTRIBUTES = (
     "record_type_index",
@@ -20,6 +20,8 @@ def adapt_data(original):
 
 # generated by ModelBuilder
 class BaseParagraphRecord(MetaRecord):
+    __slots__ = ()
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
 
@@ -37,7 +39,7 @@ class BaseParagraphRecord(MetaRecord):
         return dict([(k, getattr(self, k)) for k in ATTRIBUTES])
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def record_type_index(self):
         """
         record_type_index
@@ -46,7 +48,7 @@ class BaseParagraphRecord(MetaRecord):
         return self.get_field_content("v701", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def paragraph_text(self):
         """
         paragraph_text
@@ -55,7 +57,7 @@ class BaseParagraphRecord(MetaRecord):
         return self.get_field_content("v704", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def record_type(self):
         """
         record_type
@@ -64,7 +66,7 @@ class BaseParagraphRecord(MetaRecord):
         return self.get_field_content("v706", subfields={}, single=True, simple=True)
 
     # generated by ModelBuilder
-    @property
+    @field_property
     def reference_index(self):
         """
         reference_index
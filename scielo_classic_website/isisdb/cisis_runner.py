@@ -0,0 +1,191 @@
+"""
+Execução dos utilitários do CISIS (mx, i2id, ifkeys) em subprocessos,
+com timeout, verificação do código de saída e leitura da saída padrão
+em fluxo, sem arquivos intermediários nem espera ativa.
+"""
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from scielo_classic_website import exceptions
+
+
+class CisisRunner:
+    """
+    Parameters
+    ----------
+    cisis_path: str
+        pasta que contém os utilitários do CISIS
+    timeout: float
+        tempo máximo, em segundos, de cada comando (None: sem limite)
+    max_workers: int
+        quantidade máxima de comandos executados simultaneamente
+        em `run_many`
+    """
+
+    def __init__(self, cisis_path, timeout=None, max_workers=None):
+        self.cisis_path = cisis_path
+        self.timeout = timeout
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def get_command_path(self, command):
+        """
+        Raises
+        ------
+        exceptions.MissingI2IdCommandPathEnvVarError
+        FileNotFoundError
+        """
+        command_path = os.path.join(self.cisis_path, command)
+        if not os.path.isfile(command_path):
+            if command == "i2id":
+                raise exceptions.MissingI2IdCommandPathEnvVarError(
+                    f"Not found: {command_path}"
+                )
+            raise FileNotFoundError(f"Not found: {command_path}")
+        return command_path
+
+    def run(self, command, args, stdout_file_path=None, timeout=None):
+        """
+        Executa `command` e aguarda a sua finalização
+
+        Parameters
+        ----------
+        command: str
+            "mx", "i2id", "ifkeys", ...
+        args: list of str
+        stdout_file_path: str
+            grava a saída padrão neste arquivo
+        timeout: float
+
+        Returns
+        -------
+        subprocess.CompletedProcess
+
+        Raises
+        ------
+        exceptions.CisisCommandError
+        """
+        cmd = [self.get_command_path(command)] + list(args)
+        timeout = timeout or self.timeout
+        logging.info("Run %s" % cmd)
+
+        stdout = subprocess.PIPE
+        if stdout_file_path:
+            stdout = open(stdout_file_path, "wb")
+        try:
+            completed = subprocess.run(
+                cmd, stdout=stdout, stderr=subprocess.PIPE, timeout=timeout
+            )
+        except subprocess.TimeoutExpired as e:
+            raise exceptions.CisisCommandError(
+                f"Timeout ({timeout}s) expired: {cmd}"
+            ) from e
+        finally:
+            if stdout_file_path:
+                stdout.close()
+
+        if completed.returncode != 0:
+            raise exceptions.CisisCommandError(
+                f"{cmd} returned {completed.returncode}: "
+                f"{completed.stderr.decode('iso-8859-1', 'replace').strip()}"
+            )
+        return completed
+
+    def stream(self, command, args, timeout=None, encoding="iso-8859-1"):
+        """
+        Executa `command` e retorna as linhas da saída padrão
+        à medida que são produzidas
+
+        Parameters
+        ----------
+        command: str
+        args: list of str
+        timeout: float
+        encoding: str
+
+        Returns
+        -------
+        generator of str
+
+        Raises
+        ------
+        exceptions.CisisCommandError
+        """
+        cmd = [self.get_command_path(command)] + list(args)
+        timeout = timeout or self.timeout
+        logging.info("Stream %s" % cmd)
+
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=stderr, encoding=encoding
+            )
+            timed_out = threading.Event()
+            timer = None
+            if timeout:
+                timer = threading.Timer(timeout, _kill, (proc, timed_out))
+                timer.start()
+            try:
+                yield from proc.stdout
+            finally:
+                if timer:
+                    timer.cancel()
+                if proc.poll() is None:
+                    # o consumidor interrompeu a leitura
+                    proc.kill()
+                proc.stdout.close()
+                returncode = proc.wait()
+
+            if timed_out.is_set():
+                raise exceptions.CisisCommandError(
+                    f"Timeout ({timeout}s) expired: {cmd}"
+                )
+            if returncode != 0:
+                stderr.seek(0)
+                raise exceptions.CisisCommandError(
+                    f"{cmd} returned {returncode}: "
+                    f"{stderr.read().decode(encoding, 'replace').strip()}"
+                )
+
+    def run_many(self, commands, max_workers=None):
+        """
+        Executa os comandos simultaneamente, limitando a quantidade
+        de comandos em execução a `max_workers`
+
+        Parameters
+        ----------
+        commands: iterable of tuple
+            (command, args) ou (command, args, stdout_file_path)
+        max_workers: int
+
+        Returns
+        -------
+        generator of tuple (command, result)
+            em ordem de finalização. `result` é `subprocess.CompletedProcess`
+            ou a exceção ocorrida
+        """
+        max_workers = max_workers or self.max_workers
+        commands = iter(commands)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while True:
+                for item in commands:
+                    running[executor.submit(self.run, *item)] = item
+                    if len(running) >= max_workers:
+                        break
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = running.pop(future)
+                    try:
+                        yield item, future.result()
+                    except Exception as e:
+                        yield item, e
+
+
+def _kill(proc, timed_out):
+    timed_out.set()
+    proc.kill()
@@ -7,6 +7,8 @@ from scielo_classic_website.utils.windows_path import fix_windows_path
 
 # generated by ModelBuilder
 class DocumentRecord(BaseDocumentRecord):
+    __slots__ = ("_filename_no_ext", "_file_type")
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
 
@@ -0,0 +1,143 @@
+"""
+Cache persistente dos arquivos ID gerados por `i2id`.
+
+Cada arquivo ID é identificado pela base de dados ISIS de origem
+e pela data de modificação e tamanho dos seus arquivos `.mst` e `.xrf`.
+Enquanto a base não muda, o arquivo ID já gerado é reaproveitado.
+
+```
+<cache_path>/<hash do path da base>-<hash de mtime e tamanho>.id
+```
+
+Quando o tamanho total ultrapassa `max_bytes`, os arquivos menos
+usados recentemente são apagados.
+"""
+import glob
+import hashlib
+import logging
+import os
+import tempfile
+
+from scielo_classic_website.isisdb.master_file import get_db_signature
+
+
+def _get_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class IdFileCache:
+    """
+    Parameters
+    ----------
+    cache_path: str
+        pasta dos arquivos ID
+    max_bytes: int
+        tamanho total máximo dos arquivos ID (None: sem limite)
+    """
+
+    def __init__(self, cache_path, max_bytes=None):
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+
+    def _get_prefix(self, db_file_path):
+        return _get_hash(os.path.abspath(db_file_path))
+
+    def get_cached_file_path(self, db_file_path):
+        """
+        Obtém o path do arquivo ID correspondente ao estado atual
+        da base de dados `db_file_path`, exista ele ou não
+
+        Raises
+        ------
+        FileNotFoundError
+        """
+        signature = get_db_signature(db_file_path)
+        return os.path.join(
+            self.cache_path,
+            "%s-%s.id" % (self._get_prefix(db_file_path), _get_hash(str(signature))),
+        )
+
+    def get_id_file_path(self, db_file_path, create_id_file):
+        """
+        Obtém o arquivo ID da base de dados `db_file_path`,
+        criando-o somente se não existe no cache
+
+        Parameters
+        ----------
+        db_file_path: str
+            path of an ISIS database without extension
+        create_id_file: callable
+            `create_id_file(db_file_path, id_file_path)`, que gera o arquivo ID
+
+        Returns
+        -------
+        str
+        """
+        id_file_path = self.get_cached_file_path(db_file_path)
+        if os.path.isfile(id_file_path):
+            logging.info("Use cached %s for %s" % (id_file_path, db_file_path))
+            # registra o uso para a remoção dos menos usados
+            os.utime(id_file_path)
+            return id_file_path
+
+        os.makedirs(self.cache_path, exist_ok=True)
+        fd, temp_file_path = tempfile.mkstemp(dir=self.cache_path, suffix=".tmp")
+        os.close(fd)
+        try:
+            create_id_file(db_file_path, temp_file_path)
+            os.replace(temp_file_path, id_file_path)
+        finally:
+            if os.path.isfile(temp_file_path):
+                os.unlink(temp_file_path)
+
+        # remove as versões anteriores do arquivo ID desta base
+        self.invalidate(db_file_path, keep=id_file_path)
+        self.evict(keep=id_file_path)
+        return id_file_path
+
+    def _get_files(self, pattern="*.id"):
+        items = []
+        for file_path in glob.glob(os.path.join(self.cache_path, pattern)):
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            items.append((stat.st_mtime, stat.st_size, file_path))
+        return items
+
+    def evict(self, keep=None):
+        """
+        Apaga os arquivos ID menos usados recentemente até que
+        o tamanho total seja menor ou igual a `max_bytes`
+        """
+        if not self.max_bytes:
+            return
+        items = sorted(self._get_files())
+        total = sum(size for mtime, size, file_path in items)
+        for mtime, size, file_path in items:
+            if total <= self.max_bytes:
+                break
+            if file_path == keep:
+                continue
+            logging.info("Evict %s" % file_path)
+            _remove(file_path)
+            total -= size
+
+    def invalidate(self, db_file_path=None, keep=None):
+        """
+        Apaga os arquivos ID da base `db_file_path`
+        ou todos os arquivos, se `db_file_path` não é informado
+        """
+        pattern = "*.id"
+        if db_file_path:
+            pattern = self._get_prefix(db_file_path) + "-*.id"
+        for mtime, size, file_path in self._get_files(pattern):
+            if file_path != keep:
+                _remove(file_path)
+
+
+def _remove(file_path):
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
@@ -1,17 +1,55 @@
 """
 CISIS COMMANDS
 """
+import logging
 import os
 
 from scielo_classic_website import config, exceptions
+from scielo_classic_website.iid2json import id2json3, records_file
+from scielo_classic_website.isisdb import master_file
+from scielo_classic_website.isisdb.cisis_runner import CisisRunner
+from scielo_classic_website.isisdb.id_file_cache import IdFileCache
+from scielo_classic_website.isisdb.pid_index import PidIndex
 from scielo_classic_website.utils.files_utils import (
     create_temp_file,
     date_now_as_folder_name,
-    read_file,
     write_file,
 )
 
 
+def get_cisis_runner(cisis_path=None):
+    """
+    Obtém o executor dos utilitários do CISIS
+
+    Raises
+    ------
+    exceptions.MissingCisisPathEnvVarError
+    exceptions.CisisPathNotFoundMigrationError
+    """
+    return CisisRunner(
+        cisis_path or config.get_cisis_path(),
+        timeout=config.CLASSIC_WEBSITE_CISIS_TIMEOUT,
+        max_workers=config.CLASSIC_WEBSITE_CISIS_MAX_WORKERS,
+    )
+
+
+def get_id_file_cache():
+    """
+    Obtém o cache dos arquivos ID, se CLASSIC_WEBSITE_ID_FILE_CACHE_PATH
+    está configurado
+
+    Returns
+    -------
+    IdFileCache or None
+    """
+    if not config.CLASSIC_WEBSITE_ID_FILE_CACHE_PATH:
+        return None
+    return IdFileCache(
+        config.CLASSIC_WEBSITE_ID_FILE_CACHE_PATH,
+        max_bytes=config.CLASSIC_WEBSITE_ID_FILE_CACHE_MAX_BYTES,
+    )
+
+
 def get_document_isis_db(pid):
     """
     Consulta a base de dados ISIS artigo e retorna os registros do pid
@@ -24,20 +62,19 @@ def get_document_isis_db(pid):
         )
 
     name = date_now_as_folder_name()
-    finished_file_path = create_temp_file(f"{name}_finished.out")
     output_file_path = create_temp_file(f"{name}_output")
 
-    cisis_path = config.get_cisis_path()
-    cmds = []
-    cmds.append(
-        f"""{cisis_path}/mx {BASES_ARTIGO_PATH} btell=0 """
-        f""""bool=IV={pid}$" """
-        f"""append={output_file_path} now -all"""
+    get_cisis_runner().run(
+        "mx",
+        [
+            BASES_ARTIGO_PATH,
+            "btell=0",
+            f"bool=IV={pid}$",
+            f"append={output_file_path}",
+            "now",
+            "-all",
+        ],
     )
-    cmds.append(f"echo finished > {finished_file_path}")
-    os.system(";".join(cmds))
-    while "finished" not in read_file(finished_file_path):
-        pass
     return output_file_path
 
 
@@ -63,21 +100,30 @@ def create_id_file(db_file_path, id_file_path=None):
     exceptions.CisisPathNotFoundMigrationError
     exceptions.MissingI2IdCommandPathEnvVarError
     exceptions.IsisDBNotFoundError
+    exceptions.CisisCommandError
     PermissionError
     FileNotFoundError
     """
-    # obtém CISIS_PATH
-    cisis_path = config.get_cisis_path()
+    return _create_id_file(
+        get_cisis_runner(), db_file_path, id_file_path, get_id_file_cache()
+    )
+
 
+def _create_id_file(cisis_runner, db_file_path, id_file_path=None, id_file_cache=None):
     # check if the utilitary i2id exists
-    i2id_cmd = os.path.join(cisis_path, "i2id")
-    if not os.path.isfile(i2id_cmd):
-        raise exceptions.MissingI2IdCommandPathEnvVarError(f"Not found: {i2id_cmd}")
+    cisis_runner.get_command_path("i2id")
 
     # check if the isis database exists
     if not os.path.isfile(db_file_path + ".mst"):
         raise exceptions.IsisDBNotFoundError(f"Not found {db_file_path}.mst")
 
+    if id_file_path is None and id_file_cache and master_file.is_isis_db(db_file_path):
+        # reuse the id_file if the isis database has not changed
+        return id_file_cache.get_id_file_path(
+            db_file_path,
+            lambda db, id_file: _create_id_file(cisis_runner, db, id_file),
+        )
+
     if id_file_path is None:
         # create id_file in a temp folder
         id_file_path = create_temp_file(os.path.basename(db_file_path))
@@ -91,15 +137,12 @@ def create_id_file(db_file_path, id_file_path=None):
         write_file(id_file_path, "")
 
     # execute i2id db > id_file_path
-    os.system(f"{i2id_cmd} {db_file_path} > {id_file_path}")
+    cisis_runner.run("i2id", [db_file_path], stdout_file_path=id_file_path)
 
     # check if id_file_path is valid
-    try:
-        content = read_file(id_file_path, encoding="iso-8859-1")
-    except FileNotFoundError:
+    if not os.path.isfile(id_file_path):
         return None
-    else:
-        return id_file_path
+    return id_file_path
 
 
 def get_id_file_path(source_file_path):
@@ -148,24 +191,14 @@ def get_document_pids(from_date=None, to_date=None):
 
     """
     BASES_ARTIGO_PATH = config.get_bases_artigo_path()
-    name = date_now_as_folder_name()
-    finished_file_path = create_temp_file(f"{name}_finished.out")
-    output_file_path = create_temp_file(f"{name}_output.csv")
     from_date = from_date or "0" * 8
     to_date = to_date or "9" * 8
-    cmd = (
-        f"""{config.get_cisis_path()}/ifkeys {BASES_ARTIGO_PATH} """
-        f"""from=OAITS={from_date} to=OAITS={to_date} > """
-        f"""{output_file_path};"""
-        f"""echo finished> {finished_file_path}"""
+    rows = get_cisis_runner().stream(
+        "ifkeys",
+        [BASES_ARTIGO_PATH, f"from=OAITS={from_date}", f"to=OAITS={to_date}"],
     )
-    os.system(cmd)
-    while "finished" not in read_file(finished_file_path):
-        pass
-
-    with open(output_file_path, "r") as fp:
-        """
-        output_file content
+    """
+    ifkeys output
 
          1|OAITS=20210917=2352-22912021005005225
          1|OAITS=20210917=2352-22912021005005226
@@ -176,11 +209,13 @@ def get_document_pids(from_date=None, to_date=None):
          1|OAITS=20210917=2675-54752021000300402
          1|OAITS=20210917=2675-54752021000300700
 
-        """
-        for row in fp:
-            # 1|OAITS=20210917=2675-54752021000300700
-            parts = row.strip().split("=")
-            yield {"updated": parts[1], "pid": "S" + parts[-1]}
+    """
+    for row in rows:
+        # 1|OAITS=20210917=2675-54752021000300700
+        parts = row.strip().split("=")
+        if len(parts) < 3:
+            continue
+        yield {"updated": parts[1], "pid": "S" + parts[-1]}
 
 
 def get_documents_by_issue_folder(cisis_path, bases_work_acron_file_path, issue_folder):
@@ -194,32 +229,162 @@ def get_documents_by_issue_folder(cisis_path, bases_work_acron_file_path, issue_
             f"Unable to get {issue_folder} documents. {bases_work_acron_file_path}.mst not found"
         )
 
-    mx = os.path.join(cisis_path, "mx")
-    if not os.path.isfile(mx):
-        raise FileNotFoundError(
-            f"Unable to get {issue_folder} documents. {mx} not found"
-        )
+    cisis_runner = get_cisis_runner(cisis_path)
+    try:
+        cisis_runner.get_command_path("mx")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Unable to get {issue_folder} documents. {e}")
 
     name = date_now_as_folder_name()
-    finished_file_path = create_temp_file(f"{name}_{issue_folder}_finished.out")
     output_file_path = create_temp_file(f"{name}_{issue_folder}_output")
 
-    cmds = []
-    cmds.append(
-        f"""{mx} {bases_work_acron_file_path} btell=0 """
-        f""""bool={issue_folder}" """
-        f"""append={output_file_path} now -all"""
+    cisis_runner.run(
+        "mx",
+        [
+            bases_work_acron_file_path,
+            "btell=0",
+            f"bool={issue_folder}",
+            f"append={output_file_path}",
+            "now",
+            "-all",
+        ],
     )
-    cmds.append(f"echo finished > {finished_file_path}")
-    os.system(";".join(cmds))
-    while "finished" not in read_file(finished_file_path):
-        pass
     return output_file_path
 
 
 class ISISCommader:
     def __init__(self, paths):
         self.paths = paths
+        self._pid_indexes = {}
+        self._cisis_runner = None
+        self.id_file_cache = get_id_file_cache()
+
+    @property
+    def cisis_runner(self):
+        if self._cisis_runner is None:
+            self._cisis_runner = get_cisis_runner(self.paths.cisis_path)
+        return self._cisis_runner
+
+    def _get_pid_index(self, db_file_path=None):
+        # o índice é reaproveitado enquanto a base não muda
+        db_file_path = db_file_path or self.paths.BASES_ARTIGO_PATH
+        try:
+            signature = master_file.get_db_signature(db_file_path)
+        except FileNotFoundError:
+            signature = None
+        try:
+            cached_signature, pid_index = self._pid_indexes[db_file_path]
+        except KeyError:
+            pass
+        else:
+            if cached_signature == signature:
+                return pid_index
+            pid_index.master_file.close()
+        pid_index = PidIndex(master_file.MasterFile(db_file_path))
+        self._pid_indexes[db_file_path] = (signature, pid_index)
+        return pid_index
+
+    def close(self):
+        """
+        Fecha as bases de dados abertas por `get_record_by_mfn`
+        e `get_records_by_pid`
+        """
+        for signature, pid_index in self._pid_indexes.values():
+            pid_index.master_file.close()
+        self._pid_indexes = {}
+
+    def get_record_by_mfn(self, mfn, db_file_path=None):
+        """
+        Obtém o registro `mfn` da base de dados `db_file_path`
+        (padrão: base artigo)
+
+        Parameters
+        ----------
+        mfn: int
+        db_file_path: str
+            path of an ISIS database without extension
+
+        Returns
+        -------
+        dict or None
+
+        Raises
+        ------
+            exceptions.IsisDBNotFoundError
+            exceptions.MasterFileError
+        """
+        return self._get_pid_index(db_file_path).master_file.get_record(mfn)
+
+    def get_records_by_pid(self, pid, db_file_path=None):
+        """
+        Obtém os registros do documento `pid` da base de dados `db_file_path`
+        (padrão: base artigo), usando o índice PID -> MFN,
+        que é criado na primeira consulta
+
+        Parameters
+        ----------
+        pid: str
+        db_file_path: str
+            path of an ISIS database without extension
+
+        Returns
+        -------
+        list of dict
+
+        Raises
+        ------
+            exceptions.IsisDBNotFoundError
+            exceptions.MasterFileError
+        """
+        return self._get_pid_index(db_file_path).get_records(pid)
+
+    def pids_and_their_records(self, source_file_path, db_type):
+        """
+        Obtém os registros de `source_file_path` agrupados por ID.
+        Bases ISIS são lidas diretamente dos arquivos `.mst` e `.xrf`;
+        `i2id` é usado somente se o formato da base não for reconhecido,
+        com o arquivo ID mantido em `id_file_cache`, se configurado.
+        Arquivos `.rec` são lidos com `records_file`
+
+        Parameters
+        ----------
+        source_file_path: str
+            path of a ISIS Database or ID file
+        db_type: str
+            "title", "issue" ou "artigo"
+
+        Returns
+        -------
+        generator of tuple (_id, list of dict)
+
+        Raises
+        ------
+            exceptions.IdFileNotFoundError
+            exceptions.IsisDBNotFoundError
+            exceptions.RecordsFileError
+        """
+        name, ext = os.path.splitext(source_file_path)
+        if ext == records_file.RECORDS_FILE_EXTENSION:
+            # registros já convertidos por `records_file.write_records_file`
+            return records_file.pids_and_their_records(source_file_path)
+        if ext != ".id" and master_file.is_isis_db(source_file_path):
+            try:
+                return master_file.pids_and_their_records(source_file_path, db_type)
+            except exceptions.MasterFileError as e:
+                logging.info(
+                    "Unable to read %s directly, using i2id: %s" % (source_file_path, e)
+                )
+                if self.id_file_cache:
+                    # reaproveita o arquivo ID gerado por i2id enquanto
+                    # a base não muda
+                    id_file_path = self.create_id_file(source_file_path)
+                    return id2json3.pids_and_their_records(id_file_path, db_type)
+                # sem cache, a saída de i2id é lida diretamente,
+                # sem criar o arquivo ID
+                rows = self.cisis_runner.stream("i2id", [source_file_path])
+                return id2json3.pids_and_their_records_from_rows(rows, db_type)
+        id_file_path = self.get_id_file_path(source_file_path)
+        return id2json3.pids_and_their_records(id_file_path, db_type)
 
     def get_id_file_path(self, source_file_path):
         """
@@ -281,40 +446,10 @@ class ISISCommader:
         exceptions.CisisPathNotFoundMigrationError
         exceptions.MissingI2IdCommandPathEnvVarError
         exceptions.IsisDBNotFoundError
+        exceptions.CisisCommandError
         PermissionError
         FileNotFoundError
         """
-        # obtém CISIS_PATH
-        cisis_path = self.paths.cisis_path
-
-        # check if the utilitary i2id exists
-        i2id_cmd = os.path.join(cisis_path, "i2id")
-        if not os.path.isfile(i2id_cmd):
-            raise exceptions.MissingI2IdCommandPathEnvVarError(f"Not found: {i2id_cmd}")
-
-        # check if the isis database exists
-        if not os.path.isfile(db_file_path + ".mst"):
-            raise exceptions.IsisDBNotFoundError(f"Not found {db_file_path}.mst")
-
-        if id_file_path is None:
-            # create id_file in a temp folder
-            id_file_path = create_temp_file(os.path.basename(db_file_path))
-        else:
-            # create the destination folder
-            dirname = os.path.dirname(id_file_path)
-            if not os.path.isdir(dirname):
-                os.makedirs(dirname)
-
-            # delete the id_file_path
-            write_file(id_file_path, "")
-
-        # execute i2id db > id_file_path
-        os.system(f"{i2id_cmd} {db_file_path} > {id_file_path}")
-
-        # check if id_file_path is valid
-        try:
-            content = read_file(id_file_path, encoding="iso-8859-1")
-        except FileNotFoundError:
-            return None
-        else:
-            return id_file_path
+        return _create_id_file(
+            self.cisis_runner, db_file_path, id_file_path, self.id_file_cache
+        )
@@ -4,6 +4,8 @@ from scielo_classic_website.isisdb.base_issue_record import BaseIssueRecord
 
 # generated by ModelBuilder
 class IssueRecord(BaseIssueRecord):
+    __slots__ = ()
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
 
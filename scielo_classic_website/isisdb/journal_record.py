@@ -4,6 +4,8 @@ from scielo_classic_website.isisdb.base_journal_record import BaseJournalRecord
 
 # generated by ModelBuilder
 class JournalRecord(BaseJournalRecord):
+    __slots__ = ("_print_issn", "_electronic_issn")
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
 
@@ -0,0 +1,400 @@
+"""
+Leitura nativa de bases de dados ISIS (arquivos `.mst` e `.xrf`),
+sem depender do utilitário `i2id` do CISIS e sem gerar o arquivo ID.
+
+`.xrf` (cross-reference): blocos de 512 bytes, cada um com
+`xrfpos` (int32) seguido de 127 ponteiros (int32), um por MFN.
+Cada ponteiro codifica `mfb * 2048 + mfp`, sendo `mfb` o número do bloco
+(iniciado em 1) no `.mst` e `mfp` a posição do registro no bloco
+(os bits acima de 511 são flags de atualização).
+Ponteiro negativo indica registro apagado e zero, registro inexistente.
+
+`.mst` (master file): registro de controle (MFN 0) seguido dos registros.
+Cada registro tem um líder
+(mfn, mfrl, mfbwb, mfbwp, base, nvf, status),
+um diretório com `nvf` entradas (tag, pos, len)
+e os dados dos campos, que começam em `base`.
+
+Os registros são entregues no mesmo formato gerado por
+`iid2json.id2json3.pids_and_their_records`:
+
+```
+{
+    "v012": [{"_": "New record of Blepharicnema splendens", "l": "en"}],
+    "v049": [{"c": "AA970", "l": "pt", "t": "Biodiversidade e Conservação"}],
+}
+```
+"""
+import logging
+import mmap
+import os
+import struct
+
+from scielo_classic_website import exceptions
+from scielo_classic_website.iid2json import id2json3
+
+BLOCK_SIZE = 512
+XRF_ENTRIES_PER_BLOCK = 127
+XRF_SHIFT = 2048
+CONTROL_RECORD_FORMAT = "iiiHHiiii"
+
+# líder do registro: mfn, mfrl, mfbwb, mfbwp, base, nvf, status
+# o CISIS compilado com alinhamento de 4 bytes insere 2 bytes após `mfrl`
+LEADER_FORMATS = ("ihiHHHH", "ihxxiHHHH")
+DIRECTORY_ENTRY_FORMAT = "HHH"
+
+# quantidade de MFN avaliados na detecção do formato
+MAX_MFN_TO_DETECT_LAYOUT = 100
+
+
+class MasterFile:
+    """
+    Acesso somente leitura a uma base de dados ISIS,
+    usando `mmap` para os arquivos `.mst` e `.xrf`
+
+    Parameters
+    ----------
+    db_file_path: str
+        path da base de dados ISIS sem extensão
+    encoding: str
+        codificação do conteúdo dos campos
+    """
+
+    def __init__(self, db_file_path, encoding="iso-8859-1"):
+        self.db_file_path = db_file_path
+        self.encoding = encoding
+        self._files = []
+        self._mst = None
+        self._xrf = None
+        self._byte_order = None
+        self._leader = None
+        self._directory_entry = None
+        self.next_mfn = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """
+        Abre os arquivos `.mst` e `.xrf` e identifica o formato da base
+
+        Raises
+        ------
+        exceptions.IsisDBNotFoundError
+        exceptions.MasterFileError
+        """
+        if self._mst is not None:
+            return
+        for ext in (".mst", ".xrf"):
+            if not os.path.isfile(self.db_file_path + ext):
+                raise exceptions.IsisDBNotFoundError(
+                    f"Not found {self.db_file_path}{ext}"
+                )
+        try:
+            self._mst = self._mmap(self.db_file_path + ".mst")
+            self._xrf = self._mmap(self.db_file_path + ".xrf")
+            self._read_control_record()
+            self._detect_layout()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        for item in (self._mst, self._xrf):
+            if item is not None:
+                item.close()
+        for fp in self._files:
+            fp.close()
+        self._files = []
+        self._mst = None
+        self._xrf = None
+
+    def _mmap(self, file_path):
+        fp = open(file_path, "rb")
+        self._files.append(fp)
+        try:
+            return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # arquivo vazio não pode ser mapeado
+            raise exceptions.MasterFileError(f"Empty file {file_path}")
+
+    def _read_control_record(self):
+        size = struct.calcsize("<" + CONTROL_RECORD_FORMAT)
+        if len(self._mst) < size or len(self._xrf) < BLOCK_SIZE:
+            raise exceptions.MasterFileError(
+                f"Invalid ISIS database {self.db_file_path}: truncated files"
+            )
+        for byte_order in ("<", ">"):
+            ctlmfn, nxtmfn = struct.unpack_from(byte_order + "ii", self._mst, 0)
+            (xrfpos,) = struct.unpack_from(byte_order + "i", self._xrf, 0)
+            if ctlmfn == 0 and nxtmfn > 0 and abs(xrfpos) == 1:
+                self._byte_order = byte_order
+                self.next_mfn = nxtmfn
+                return
+        raise exceptions.MasterFileError(
+            f"Invalid ISIS database {self.db_file_path}: unknown control record"
+        )
+
+    def _detect_layout(self):
+        """
+        Identifica o formato do líder avaliando o primeiro registro ativo
+        """
+        self._directory_entry = struct.Struct(self._byte_order + DIRECTORY_ENTRY_FORMAT)
+        last_mfn = min(self.next_mfn, MAX_MFN_TO_DETECT_LAYOUT + 1)
+        for mfn in range(1, last_mfn):
+            offset = self._get_offset(mfn)
+            if offset is None:
+                continue
+            for leader_format in LEADER_FORMATS:
+                leader = struct.Struct(self._byte_order + leader_format)
+                try:
+                    _mfn, mfrl, _, _, base, nvf, status = leader.unpack_from(
+                        self._mst, offset
+                    )
+                except struct.error:
+                    continue
+                if (
+                    _mfn == mfn
+                    and base == leader.size + nvf * self._directory_entry.size
+                    and status in (0, 1)
+                ):
+                    self._leader = leader
+                    return
+            raise exceptions.MasterFileError(
+                f"Unsupported ISIS database {self.db_file_path}: "
+                f"unable to read MFN {mfn}"
+            )
+        # base sem registros ativos
+        self._leader = struct.Struct(self._byte_order + LEADER_FORMATS[0])
+
+    def _get_offset(self, mfn):
+        """
+        Obtém a posição do registro `mfn` no `.mst` consultando o `.xrf`
+
+        Returns
+        -------
+        int or None
+            None se o registro não existe ou está apagado
+        """
+        if mfn < 1 or mfn >= self.next_mfn:
+            return None
+        block, entry = divmod(mfn - 1, XRF_ENTRIES_PER_BLOCK)
+        position = block * BLOCK_SIZE + 4 * (entry + 1)
+        if position + 4 > len(self._xrf):
+            return None
+        (pointer,) = struct.unpack_from(self._byte_order + "i", self._xrf, position)
+        if pointer <= 0:
+            return None
+        mfb, mfp = divmod(pointer, XRF_SHIFT)
+        return (mfb - 1) * BLOCK_SIZE + mfp % BLOCK_SIZE
+
+    def _read_leader(self, mfn, offset):
+        try:
+            leader = self._leader.unpack_from(self._mst, offset)
+        except struct.error:
+            raise exceptions.MasterFileError(
+                f"Invalid ISIS database {self.db_file_path}: "
+                f"MFN {mfn} at {offset} is out of the file"
+            )
+        if leader[0] != mfn:
+            raise exceptions.MasterFileError(
+                f"Invalid ISIS database {self.db_file_path}: "
+                f"expected MFN {mfn} at {offset}, found {leader[0]}"
+            )
+        return leader
+
+    def validate(self):
+        """
+        Verifica o líder e o diretório de todos os registros,
+        sem decodificar os campos, para que uma base corrompida
+        seja identificada antes da leitura dos registros
+
+        Raises
+        ------
+        exceptions.MasterFileError
+        """
+        if self._mst is None:
+            self.open()
+        mst_size = len(self._mst)
+        entry_size = self._directory_entry.size
+        for mfn in range(1, self.next_mfn):
+            offset = self._get_offset(mfn)
+            if offset is None:
+                continue
+            _mfn, mfrl, _, _, base, nvf, status = self._read_leader(mfn, offset)
+            if status != 0:
+                continue
+            directory_position = offset + self._leader.size
+            if directory_position + nvf * entry_size > mst_size:
+                raise exceptions.MasterFileError(
+                    f"Invalid ISIS database {self.db_file_path}: "
+                    f"truncated directory of MFN {mfn}"
+                )
+            for i in range(nvf):
+                tag, pos, length = self._directory_entry.unpack_from(
+                    self._mst, directory_position + i * entry_size
+                )
+                if offset + base + pos + length > mst_size:
+                    raise exceptions.MasterFileError(
+                        f"Invalid ISIS database {self.db_file_path}: "
+                        f"truncated field {tag} of MFN {mfn}"
+                    )
+
+    def get_fields(self, mfn, tags=None):
+        """
+        Obtém os campos do registro `mfn`, na ordem em que estão gravados
+
+        Parameters
+        ----------
+        mfn: int
+        tags: set of int
+            se informado, somente estes campos são decodificados
+
+        Returns
+        -------
+        list of tuple (tag, content) or None
+            None se o registro não existe ou está apagado
+        """
+        if self._mst is None:
+            self.open()
+        offset = self._get_offset(mfn)
+        if offset is None:
+            return None
+        _mfn, mfrl, _, _, base, nvf, status = self._read_leader(mfn, offset)
+        if status != 0:
+            return None
+
+        fields = []
+        directory_position = offset + self._leader.size
+        data_position = offset + base
+        entry_size = self._directory_entry.size
+        for i in range(nvf):
+            tag, pos, length = self._directory_entry.unpack_from(
+                self._mst, directory_position + i * entry_size
+            )
+            if tags is not None and tag not in tags:
+                continue
+            start = data_position + pos
+            content = self._mst[start : start + length].decode(self.encoding)
+            fields.append((tag, content))
+        return fields
+
+    def get_record(self, mfn):
+        """
+        Obtém o registro `mfn` no mesmo formato dos registros
+        obtidos a partir do arquivo ID
+
+        Parameters
+        ----------
+        mfn: int
+
+        Returns
+        -------
+        id2json3.CompactRecord or None
+        """
+        fields = self.get_fields(mfn)
+        if not fields:
+            return None
+        return _build_record(fields)
+
+    def records(self, from_mfn=1, to_mfn=None):
+        """
+        Obtém, sequencialmente, os registros ativos da base de dados
+
+        Parameters
+        ----------
+        from_mfn: int
+        to_mfn: int
+            último MFN (inclusive)
+
+        Returns
+        -------
+        generator of id2json3.CompactRecord
+        """
+        if self._mst is None:
+            self.open()
+        last_mfn = self.next_mfn - 1
+        if to_mfn is not None:
+            last_mfn = min(to_mfn, last_mfn)
+        for mfn in range(from_mfn, last_mfn + 1):
+            record = self.get_record(mfn)
+            if record:
+                yield record
+
+
+def _build_record(fields):
+    # mesmo resultado de `i2id` seguido de `id2json3`:
+    # tag no formato v010 e linhas sem espaços no final
+    return id2json3._build_compact_record(
+        [("v" + str(tag).zfill(3), content.rstrip()) for tag, content in fields]
+    )
+
+
+def get_db_signature(db_file_path):
+    """
+    Obtém a data de modificação e o tamanho dos arquivos `.mst` e `.xrf`,
+    que identificam o estado atual da base de dados
+
+    Returns
+    -------
+    dict
+        {"mst": [mtime_ns, size], "xrf": [mtime_ns, size]}
+
+    Raises
+    ------
+    FileNotFoundError
+    """
+    signature = {}
+    for ext in ("mst", "xrf"):
+        stat = os.stat(f"{db_file_path}.{ext}")
+        signature[ext] = [stat.st_mtime_ns, stat.st_size]
+    return signature
+
+
+def is_isis_db(db_file_path):
+    return os.path.isfile(db_file_path + ".mst") and os.path.isfile(
+        db_file_path + ".xrf"
+    )
+
+
+def pids_and_their_records(db_file_path, db_type):
+    """
+    Obtém os registros da base ISIS `db_file_path` agrupados por ID,
+    assim como `id2json3.pids_and_their_records` faz para arquivos ID
+
+    Parameters
+    ----------
+    db_file_path: str
+        path da base de dados ISIS sem extensão
+    db_type: str
+        "title", "issue" ou "artigo"
+
+    Returns
+    -------
+    generator of tuple (_id, list of dict)
+
+    Raises
+    ------
+    exceptions.IsisDBNotFoundError
+    exceptions.MasterFileError
+    """
+    logging.info("pids_and_their_records %s %s" % (db_file_path, db_type))
+    master_file = MasterFile(db_file_path)
+    # abre e verifica a base antes de retornar o gerador
+    # para que os erros de formato sejam identificados imediatamente,
+    # e não durante a iteração
+    try:
+        master_file.validate()
+    except Exception:
+        master_file.close()
+        raise
+    return _pids_and_their_records(master_file, id2json3.get_id_function(db_type))
+
+
+def _pids_and_their_records(master_file, id_function):
+    with master_file:
+        yield from id2json3.group_records_by_id(master_file.records(), id_function)
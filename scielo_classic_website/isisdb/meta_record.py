@@ -1,4 +1,6 @@
+import sys
 from copy import deepcopy
+from functools import wraps
 
 
 def build_object(obj, record_as_dict):
@@ -9,32 +11,117 @@ def build_object(obj, record_as_dict):
         setattr(obj, name, data)
 
 
-def _get_tag_content(record, tag):
-    # v10 or v010
+# grafias das tags ("v10", "v010") e a sua forma canônica ("v010")
+_CANONICAL_TAGS = {}
+
+
+def get_canonical_tag(tag):
+    """
+    Retorna a tag na forma canônica: "v10" -> "v010"
+    """
     try:
-        return record[tag]
+        return _CANONICAL_TAGS[tag]
     except KeyError:
-        number = str(int(tag[1:]))
-        return record.get("v" + number) or record.get("v" + number.zfill(3))
+        canonical = tag
+        if tag[:1] == "v" and tag[1:].isdigit():
+            canonical = sys.intern("v" + str(int(tag[1:])).zfill(3))
+        _CANONICAL_TAGS[tag] = canonical
+        return canonical
+
+
+def normalize_tags(record):
+    """
+    Retorna `record` com as tags na forma canônica.
+    O próprio `record` é retornado se as tags já estão na forma canônica
+    """
+    if not record or all(get_canonical_tag(tag) == tag for tag in record):
+        return record
+    normalized = {}
+    for tag, content in record.items():
+        canonical = get_canonical_tag(tag)
+        # v10 or v010
+        if not normalized.get(canonical):
+            normalized[canonical] = content
+    return normalized
+
+
+def get_tag_content(record, tag):
+    """
+    Retorna o conteúdo do campo `tag` ("v10" ou "v010")
+    de `record`, cujas tags estão na forma canônica
+    """
+    return record.get(get_canonical_tag(tag))
+
+
+def get_rec_type(record):
+    """
+    Retorna o tipo do registro (v706)
+    """
+    try:
+        return record["v706"][0]["_"]
+    except (KeyError, IndexError, TypeError):
+        return
+
+
+def field_property(get_value):
+    """
+    Property calculada uma única vez por instância de `MetaRecord`.
+    O valor é descartado quando `MetaRecord.record` é substituído
+    ou `MetaRecord.clear_field_values` é chamado.
+    Todas as chamadas retornam o mesmo objeto (list, dict), que não
+    deve ser alterado
+    """
+    name = get_value.__name__
+
+    @wraps(get_value)
+    def getter(self):
+        field_values = self._field_values
+        if field_values is None:
+            field_values = self._field_values = {}
+        try:
+            return field_values[name]
+        except KeyError:
+            value = field_values[name] = get_value(self)
+            return value
+
+    return property(getter)
 
 
 class MetaRecord:
+    # um objeto por registro; `_field_values` é criado no primeiro
+    # acesso a um `field_property`
+    __slots__ = ("_record", "_multi_val_tags", "_data_dictionary", "_field_values")
+
     def __init__(
         self,
         record,
         multi_val_tags=None,
         data_dictionary=None,
     ):
-        self._record = record
-        self._multi_val_tags = multi_val_tags or []
-        self._data_dictionary = data_dictionary or {}
+        self._record = normalize_tags(record)
+        self._multi_val_tags = multi_val_tags or ()
+        self._data_dictionary = data_dictionary
+        self._field_values = None
+
+    @property
+    def record(self):
+        return self._record
+
+    @record.setter
+    def record(self, record):
+        self._record = normalize_tags(record)
+        self.clear_field_values()
+
+    def clear_field_values(self):
+        """
+        Descarta os valores de `field_property` já calculados,
+        por exemplo, após alterar o conteúdo do registro
+        """
+        self._field_values = None
 
     @property
     def rec_type(self):
-        try:
-            return self._record["v706"][0]["_"]
-        except:
-            return
+        return get_rec_type(self._record)
 
     def get_single_value(self, tag):
         """
@@ -96,7 +183,7 @@ class MetaRecord:
             simple = False
 
         # v10 or v010
-        tag_content = _get_tag_content(self._record, tag)
+        tag_content = get_tag_content(self._record, tag)
         if not tag_content:
             if single and simple:
                 return None
@@ -275,7 +362,7 @@ class MetaRecord:
         """
         data_dict = data_dict or self._data_dictionary
         if not data_dict:
-            return deepcopy(self._record)
+            return deepcopy(dict(self._record))
 
         record = {}
         for tag in self._record.keys():
@@ -4,5 +4,7 @@ from scielo_classic_website.isisdb.base_p_record import BaseParagraphRecord
 
 # generated by ModelBuilder
 class ParagraphRecord(BaseParagraphRecord):
+    __slots__ = ()
+
     def __init__(self, record, multi_val_tags=None, data_dictionary=None):
         super().__init__(record, multi_val_tags, data_dictionary)
@@ -0,0 +1,131 @@
+"""
+Índice persistente PID -> intervalos de MFN de uma base de dados ISIS.
+
+O índice é criado uma única vez, a partir dos campos que identificam
+o documento (v706, v880 ou v702), e gravado em um arquivo JSON.
+Com ele, os registros de um documento são obtidos diretamente pelo MFN,
+usando os ponteiros do `.xrf`, sem consultar o arquivo invertido com `mx`.
+
+```
+{
+    "source": {"mst": [mtime_ns, size], "xrf": [mtime_ns, size]},
+    "pids": {"S0044-59672019000300242": [[1, 35]]}
+}
+```
+"""
+import json
+import logging
+import os
+
+from scielo_classic_website.iid2json import id2json3
+from scielo_classic_website.isisdb import master_file as isis_master_file
+
+# campos necessários para obter o ID do registro (`id2json3.article_id`)
+ID_TAGS = {35, 36, 702, 706, 880}
+
+
+class PidIndex:
+    """
+    Parameters
+    ----------
+    master_file: isisdb.master_file.MasterFile
+    index_file_path: str
+        arquivo JSON do índice. Padrão: `<db_file_path>.pid_index.json`
+    id_function: callable
+        função que obtém o ID do registro
+    """
+
+    def __init__(self, master_file, index_file_path=None, id_function=None):
+        self.master_file = master_file
+        self.index_file_path = (
+            index_file_path or master_file.db_file_path + ".pid_index.json"
+        )
+        self.id_function = id_function or id2json3.article_id
+        self._pids = None
+
+    @property
+    def pids(self):
+        if self._pids is None:
+            self._pids = self._read()
+        if self._pids is None:
+            # um índice vazio (base sem registros) é válido
+            self._pids = self.build()
+        return self._pids
+
+    def _read(self):
+        try:
+            with open(self.index_file_path, encoding="utf-8") as fp:
+                content = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        signature = isis_master_file.get_db_signature(self.master_file.db_file_path)
+        if content.get("source") != signature:
+            logging.info("PID index is outdated: %s" % self.index_file_path)
+            return None
+        return content.get("pids")
+
+    def build(self):
+        """
+        Percorre a base de dados e grava o índice
+
+        Returns
+        -------
+        dict
+            keys: pid, values: lista de intervalos [first_mfn, last_mfn]
+        """
+        master_file = self.master_file
+        signature = isis_master_file.get_db_signature(master_file.db_file_path)
+        master_file.open()
+
+        pids = {}
+        _id = None
+        for mfn in range(1, master_file.next_mfn):
+            fields = master_file.get_fields(mfn, ID_TAGS)
+            if not fields:
+                continue
+            _next_id = self.id_function(isis_master_file._build_record(fields) or {})
+            if not _next_id:
+                # registro sem ID pertence ao grupo do registro anterior
+                _next_id = _id
+            if not _next_id:
+                continue
+            ranges = pids.setdefault(_next_id, [])
+            if _next_id == _id and ranges:
+                ranges[-1][1] = mfn
+            else:
+                ranges.append([mfn, mfn])
+            _id = _next_id
+        self._write(signature, pids)
+        self._pids = pids
+        return pids
+
+    def _write(self, signature, pids):
+        content = json.dumps({"source": signature, "pids": pids})
+        temp_file_path = self.index_file_path + ".tmp"
+        try:
+            with open(temp_file_path, "w", encoding="utf-8") as fp:
+                fp.write(content)
+            os.replace(temp_file_path, self.index_file_path)
+        except OSError as e:
+            # o índice continua disponível em memória
+            logging.exception(e)
+
+    def get_mfn_ranges(self, pid):
+        return self.pids.get(pid) or []
+
+    def get_records(self, pid):
+        """
+        Obtém os registros do documento `pid`
+
+        Parameters
+        ----------
+        pid: str
+
+        Returns
+        -------
+        list of dict
+        """
+        records = []
+        for first_mfn, last_mfn in self.get_mfn_ranges(pid):
+            records.extend(self.master_file.records(first_mfn, last_mfn))
+        return records
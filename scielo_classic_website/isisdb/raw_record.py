@@ -1,5 +1,7 @@
 from copy import deepcopy
 
+from scielo_classic_website.isisdb.meta_record import get_tag_content, normalize_tags
+
 
 def build_object(obj, record_as_dict):
     """
@@ -9,19 +11,18 @@ def build_object(obj, record_as_dict):
         setattr(obj, name, data)
 
 
-def _get_tag_content(record, tag):
-    # v10 or v010
-    try:
-        return record[tag]
-    except KeyError:
-        number = str(int(tag[1:]))
-        return record.get("v" + number) or record.get("v" + number.zfill(3))
+def _keep_value(value):
+    return value
 
 
 class RawRecord:
+    # as subclasses geradas por `cli.build` guardam os valores já obtidos
+    # em atributos da instância e, por isso, não declaram `__slots__`
+    __slots__ = ("_record", "_fix_function")
+
     def __init__(self, record):
-        self._record = record
-        self._fix_function = lambda x: x
+        self._record = normalize_tags(record)
+        self._fix_function = _keep_value
 
     @property
     def fix_function(self):
@@ -39,9 +40,10 @@ class RawRecord:
             return
 
     def get_items(self, tag, subfields):
-        if not self._record.get(tag):
+        tag_content = get_tag_content(self._record, tag)
+        if not tag_content:
             return []
-        for item in self._record[tag]:
+        for item in tag_content:
             if isinstance(item, dict):
                 _item = {}
                 for k, v in item.items():
@@ -1,4 +1,8 @@
 from scielo_classic_website import config, controller
+from scielo_classic_website.incremental_migration import (
+    HighWaterMark,
+    IncrementalMigration,
+)
 from scielo_classic_website.models.document import Document
 from scielo_classic_website.models.issue import Issue
 from scielo_classic_website.models.issue_files import IssueFiles
@@ -11,6 +15,13 @@ def get_document_pids(from_date, to_date):
     return controller.isis_cmd.get_document_pids(from_date, to_date)
 
 
+def migrate_changed_documents(collection, high_water_mark_file_path, to_date=None):
+    migration = IncrementalMigration(
+        collection, HighWaterMark(high_water_mark_file_path)
+    )
+    return migration.run(to_date)
+
+
 def get_paragraphs_records(pid):
     id_file_path = config.get_paragraphs_id_file_path(pid)
     return controller.pids_and_their_records(id_file_path, "artigo")
@@ -0,0 +1,234 @@
+"""
+Catálogo dos periódicos (base `title`) e fascículos (base `issue`).
+
+As bases são lidas uma única vez e os registros são indexados para
+consultas diretas:
+
+- periódicos por `v400`, por qualquer ISSN (`v435`) e pelo acrônimo (`v068`)
+- fascículos por PID e por `(acron, issue_folder)`
+
+O catálogo pode ser gravado em um arquivo pickle (snapshot), que é
+reaproveitado enquanto as bases de origem não mudam.
+"""
+import logging
+import os
+import pickle
+
+from scielo_classic_website.isisdb import master_file
+from scielo_classic_website.models.issue import Issue
+from scielo_classic_website.models.issue_context import IssueContext
+from scielo_classic_website.models.journal import Journal
+
+
+def get_source_signature(source_file_path):
+    """
+    Obtém a data de modificação e o tamanho da base ISIS ou do arquivo
+    `source_file_path`, que identificam o seu estado atual
+
+    Raises
+    ------
+    FileNotFoundError
+    """
+    if master_file.is_isis_db(source_file_path):
+        return master_file.get_db_signature(source_file_path)
+    stat = os.stat(source_file_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _get_first_records(pids_and_records):
+    for pid, records in pids_and_records:
+        if pid and records:
+            yield pid, records[0]
+
+
+class Catalog:
+    """
+    Parameters
+    ----------
+    journals_pids_and_records: iterable of tuple (pid, list of dict)
+        por exemplo, o retorno de `ClassicWebsite.get_journals_pids_and_records`
+    issues_pids_and_records: iterable of tuple (pid, list of dict)
+        por exemplo, o retorno de `ClassicWebsite.get_issues_pids_and_records`
+    """
+
+    def __init__(self, journals_pids_and_records=(), issues_pids_and_records=()):
+        self._journal_records = {}
+        self._journal_pids = {}
+        self._issue_records = {}
+        self._issue_pids = {}
+        self._clear_objects()
+        for pid, record in _get_first_records(journals_pids_and_records):
+            self._add_journal(pid, record)
+        for pid, record in _get_first_records(issues_pids_and_records):
+            self._add_issue(pid, record)
+
+    def __getstate__(self):
+        # `Journal`, `Issue` e `IssueContext` são recriados quando usados
+        state = self.__dict__.copy()
+        del state["_journals"]
+        del state["_issues"]
+        del state["_issue_contexts"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._clear_objects()
+
+    def _clear_objects(self):
+        self._journals = {}
+        self._issues = {}
+        self._issue_contexts = {}
+
+    def _add_journal(self, pid, record):
+        self._journal_records[pid] = record
+        journal = Journal(record)
+        keys = [pid, journal.scielo_issn, journal.acronym]
+        keys.extend(item.get("value") for item in journal.issns or [])
+        for key in keys:
+            if key:
+                self._journal_pids.setdefault(key.lower(), pid)
+
+    def _add_issue(self, pid, record):
+        self._issue_records[pid] = record
+        issue = Issue(record)
+        try:
+            journal = self.get_journal(issue.journal)
+            issue_folder = issue.issue_label
+        except Exception as e:
+            logging.info("Unable to index issue %s by issue folder: %s" % (pid, e))
+            return
+        if journal and journal.acronym and issue_folder:
+            self._issue_pids.setdefault((journal.acronym.lower(), issue_folder), pid)
+
+    @property
+    def journals_total(self):
+        return len(self._journal_records)
+
+    @property
+    def issues_total(self):
+        return len(self._issue_records)
+
+    def get_journal(self, key):
+        """
+        Obtém o periódico pelo `v400`, por qualquer um de seus ISSN
+        ou pelo acrônimo
+
+        Returns
+        -------
+        Journal or None
+        """
+        try:
+            pid = self._journal_pids[key.lower()]
+        except (KeyError, AttributeError):
+            return None
+        try:
+            return self._journals[pid]
+        except KeyError:
+            journal = self._journals[pid] = Journal(self._journal_records[pid])
+            return journal
+
+    def get_issue(self, pid):
+        """
+        Obtém o fascículo pelo PID (ISSN + ano + número de ordem)
+
+        Returns
+        -------
+        Issue or None
+        """
+        try:
+            return self._issues[pid]
+        except KeyError:
+            pass
+        try:
+            record = self._issue_records[pid]
+        except KeyError:
+            return None
+        issue = self._issues[pid] = Issue(record)
+        return issue
+
+    def get_issue_pid(self, acron, issue_folder):
+        """
+        Obtém o PID do fascículo `issue_folder` (por exemplo, `v10n2`)
+        do periódico `acron`
+
+        Returns
+        -------
+        str or None
+        """
+        return self._issue_pids.get((acron.lower(), issue_folder))
+
+    def get_issue_by_folder(self, acron, issue_folder):
+        """
+        Returns
+        -------
+        Issue or None
+        """
+        pid = self.get_issue_pid(acron, issue_folder)
+        return pid and self.get_issue(pid)
+
+    def get_issue_context(self, pid):
+        """
+        Obtém o `IssueContext` do fascículo `pid`, com o seu periódico,
+        criado uma única vez
+
+        Returns
+        -------
+        IssueContext or None
+        """
+        try:
+            return self._issue_contexts[pid]
+        except KeyError:
+            pass
+        issue = self.get_issue(pid)
+        if issue is None:
+            return None
+        issue_context = IssueContext()
+        issue_context.issue = issue
+        issue_context.journal = self.get_journal(issue.journal)
+        self._issue_contexts[pid] = issue_context
+        return issue_context
+
+    def write_snapshot(self, file_path, signature=None):
+        """
+        Grava o catálogo em `file_path`
+
+        Parameters
+        ----------
+        signature: object
+            estado das bases de origem (`get_source_signature`),
+            comparado na leitura do snapshot
+        """
+        temp_file_path = file_path + ".tmp"
+        with open(temp_file_path, "wb") as fp:
+            pickle.dump(
+                {"signature": signature, "catalog": self},
+                fp,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_file_path, file_path)
+
+    @classmethod
+    def read_snapshot(cls, file_path, signature=None):
+        """
+        Lê o catálogo gravado por `write_snapshot`
+
+        Returns
+        -------
+        Catalog or None
+            `None` se o arquivo não existe, não é válido
+            ou foi gravado com outro `signature`
+        """
+        try:
+            with open(file_path, "rb") as fp:
+                snapshot = pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.info("Unable to read catalog snapshot %s: %s" % (file_path, e))
+            return None
+        if snapshot.get("signature") != signature:
+            logging.info("Catalog snapshot is outdated: %s" % file_path)
+            return None
+        if not isinstance(snapshot.get("catalog"), cls):
+            return None
+        return snapshot["catalog"]
@@ -3,7 +3,7 @@ import logging
 from scielo_classic_website.htmlbody.html_body import BodyFromHTMLFile, BodyFromISIS
 from scielo_classic_website.isisdb.c_record import ReferenceRecord
 from scielo_classic_website.isisdb.h_record import DocumentRecord
-from scielo_classic_website.isisdb.meta_record import MetaRecord
+from scielo_classic_website.isisdb.meta_record import MetaRecord, get_rec_type
 from scielo_classic_website.isisdb.p_record import ParagraphRecord
 from scielo_classic_website.models.issue import Issue
 from scielo_classic_website.models.journal import Journal
@@ -37,7 +37,7 @@ def _get_value(data, tag):
 
 
 class Document:
-    def __init__(self, data, _id=None):
+    def __init__(self, data, _id=None, issue_context=None):
         """
         Parameters
         ----------
@@ -47,6 +47,10 @@ class Document:
                     title
                     issue
                     fulltexts (list of dict: uri, uri_text, lang, )
+            issue_context : IssueContext
+                `Journal` e `Issue` compartilhados pelos documentos
+                do fascículo; se informado, `title` e `issue` de `data`
+                não são usados
         """
         self.data = {}
         try:
@@ -60,23 +64,29 @@ class Document:
             self.document_records.get_record("p")
         ).parts
         logging.info([(k, len(v)) for k, v in self.main_html_paragraphs.items()])
-        try:
-            self._journal = Journal(data["title"])
-        except KeyError:
-            self._journal = None
-        try:
-            self._issue = Issue(data["issue"])
-        except KeyError:
-            self._issue = None
+        if issue_context is not None:
+            self._journal = issue_context.journal
+            self._issue = issue_context.issue
+        else:
+            try:
+                self._journal = Journal(data["title"])
+            except KeyError:
+                self._journal = None
+            try:
+                self._issue = Issue(data["issue"])
+            except KeyError:
+                self._issue = None
         self.xml_from_html = None
 
     def __getattr__(self, name):
         # desta forma Document não precisa herdar de DocumentRecord
         # fica menos acoplado
 
-        if hasattr(self._h_record, name):
-            return getattr(self._h_record, name)
-        raise AttributeError(f"{type(self._h_record)}.{name} does not exist")
+        # `_h_record` ainda não existe durante `pickle.loads`
+        h_record = self.__dict__.get("_h_record")
+        if hasattr(h_record, name):
+            return getattr(h_record, name)
+        raise AttributeError(f"{type(h_record)}.{name} does not exist")
 
     @property
     def translated_html_by_lang(self):
@@ -162,19 +172,11 @@ class Document:
         return self.page.get("elocation")
 
     def get_section(self, lang):
-        if not hasattr(self, "_sections") or not self._sections:
-            self._sections = {}
-            logging.info("issue %s" % type(self.issue))
-            logging.info("self.section_code %s" % self.section_code)
-
-            for item in self.issue.get_sections(self.section_code):
-                logging.info("lang %s" % item)
-                self._sections[item["language"]] = item
-
-        logging.info("get_section...")
-        logging.info("self._sections %s " % self._sections)
+        # o índice das seções é criado uma única vez por `Issue`,
+        # compartilhado pelos documentos do mesmo `IssueContext`
+        sections = self.issue.get_sections_by_language(self.section_code)
         try:
-            return self._sections[lang]["text"]
+            return sections[lang]["text"]
         except KeyError:
             return None
 
@@ -232,14 +234,14 @@ class Document:
     def authors_with_aff(self):
         affs = {item["id"]: item for item in self.affiliations}
         for author in self.authors:
-            author["affiliation"] = affs[author["xref"]]["orgname"]
-            yield author
+            # `authors` é memorizado, então não é alterado
+            yield dict(author, affiliation=affs[author["xref"]]["orgname"])
 
     @property
     def citations(self):
-        return self.document_records.get_record("c")
+        return self.document_records.get_record("c") or []
 
-    def generate_body_and_back_from_html(self, html_texts=None):
+    def generate_body_and_back_from_html(self, html_texts=None, snapshots=False):
         """
         Parameters
         ----------
@@ -249,6 +251,9 @@ class Document:
                 "after references": after,
                 }
             }
+        snapshots : bool
+            guarda também o XML das etapas intermediárias
+            em `xml_body_and_back`
         """
         if not self.main_html_paragraphs:
             logging.info("generate_body_and_back_from_html: No main HTML found")
@@ -261,7 +266,7 @@ class Document:
             self.add_translated_html(
                 lang, html_text["before references"], html_text["after references"]
             )
-        sps_xml_body_pipes.convert_html_to_xml(self)
+        sps_xml_body_pipes.convert_html_to_xml(self, snapshots=snapshots)
 
     def generate_full_xml(self, selected_xml_body=None):
         """
@@ -298,8 +303,7 @@ class DocumentRecords:
     def records(self, _records):
         self._records = {}
         for _record in _records:
-            meta_record = MetaRecord(_record)
-            rec_type = meta_record.rec_type
+            rec_type = get_rec_type(_record)
             try:
                 record = RECORD[rec_type](_record)
                 self._records[rec_type] = self._records.get(rec_type) or []
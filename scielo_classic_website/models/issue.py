@@ -7,12 +7,15 @@ class Issue:
     def __init__(self, _record):
         self._record = _record
         self.issue_record = IssueRecord(_record)
+        self._sections_by_code = None
 
     def __getattr__(self, name):
         # desta forma Issue não precisa herdar de IssueRecord
         # fica menos acoplado
-        if hasattr(self.issue_record, name):
-            return getattr(self.issue_record, name)
+        # `issue_record` ainda não existe durante `pickle.loads`
+        issue_record = self.__dict__.get("issue_record")
+        if hasattr(issue_record, name):
+            return getattr(issue_record, name)
         raise AttributeError(f"classic_website.Issue has no attribute {name}")
 
     @property
@@ -63,7 +66,28 @@ class Issue:
             ]
         )
 
+    def _get_sections_by_code(self):
+        if self._sections_by_code is None:
+            self._sections_by_code = {}
+            for item in self.sections or []:
+                sections = self._sections_by_code.setdefault(item.get("code"), {})
+                sections[item.get("language")] = item
+        return self._sections_by_code
+
     def get_sections(self, code):
         for item in self.sections:
             if item["code"] == code:
                 yield item
+
+    def get_sections_by_language(self, code):
+        """
+        Obtém as seções `code` do fascículo, indexadas por idioma.
+        O índice é criado uma única vez e compartilhado pelos documentos
+        que usam esta instância de `Issue`
+
+        Returns
+        -------
+        dict
+            {"en": {"code": code, "language": "en", "text": text}, ...}
+        """
+        return self._get_sections_by_code().get(code) or {}
@@ -0,0 +1,52 @@
+from scielo_classic_website.models.document import Document
+from scielo_classic_website.models.issue import Issue
+from scielo_classic_website.models.journal import Journal
+
+
+class IssueContext:
+    """
+    `Journal` e `Issue` de um fascículo, criados uma única vez
+    e compartilhados por todos os seus documentos, assim como os valores
+    já calculados dos registros e o índice das seções
+
+    Parameters
+    ----------
+    issue_record: dict
+        registro da base `issue`
+    journal_record: dict
+        registro da base `title`
+    """
+
+    def __init__(self, issue_record=None, journal_record=None):
+        self.journal = None
+        self.issue = None
+        if journal_record:
+            self.journal = Journal(journal_record)
+        if issue_record:
+            self.issue = Issue(issue_record)
+
+    def get_document(self, records, _id=None):
+        """
+        Cria o `Document` de `records`, registros da base `artigo`,
+        com o `Journal` e o `Issue` deste contexto
+
+        Returns
+        -------
+        Document
+        """
+        return Document({"article": records}, _id, issue_context=self)
+
+    def get_documents(self, pids_and_records):
+        """
+        Parameters
+        ----------
+        pids_and_records: iterable of tuple (pid, records)
+            por exemplo, o retorno de
+            `ClassicWebsite.get_documents_pids_and_records`
+
+        Returns
+        -------
+        generator of tuple (pid, Document)
+        """
+        for pid, records in pids_and_records:
+            yield pid, self.get_document(records, pid)
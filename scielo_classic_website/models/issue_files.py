@@ -1,8 +1,9 @@
-import glob
 import logging
 import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
-from scielo_classic_website.htmlbody.html_body import HTMLFile
+from scielo_classic_website.htmlbody.html_body import AssetLinks, HTMLFile
 from scielo_classic_website.utils.files_utils import create_zip_file
 
 
@@ -16,19 +17,133 @@ def _get_classic_website_rel_path(file_path):
             return path
 
 
+def _scandir(dir_path):
+    """
+    Obtém os itens (`os.DirEntry`) de `dir_path`,
+    exceto os ocultos, assim como `glob.glob(dir_path/*)`
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            return [entry for entry in entries if not entry.name.startswith(".")]
+    except OSError:
+        return []
+
+
+class HTMLFileInfo(Mapping):
+    """
+    Dados de um arquivo HTML de `IssueFiles.bases_translation_files`
+
+    Tem as mesmas chaves do dict criado anteriormente, inclusive
+    "replacements", mas as substituições dos links exigem ler e fazer
+    o parse do arquivo e, por isso, são obtidas somente no primeiro acesso
+    (`item["replacements"]`, `item.replacements`, `dict(item)` etc)
+    """
+
+    def __init__(self, data, asset_links_getter):
+        self._data = dict(data)
+        self._asset_links_getter = asset_links_getter
+        self._replacements = None
+
+    @property
+    def replacements(self):
+        """
+        Returns
+        -------
+        dict
+            keys: links do arquivo HTML; values: caminhos corrigidos
+        """
+        if self._replacements is None:
+            self._replacements = HTMLFile(
+                self._data["path"], self._asset_links_getter()
+            ).asset_path_fixes
+        return self._replacements
+
+    def __getitem__(self, key):
+        if key == "replacements":
+            return self.replacements
+        return self._data[key]
+
+    def __iter__(self):
+        yield from self._data
+        yield "replacements"
+
+    def __len__(self):
+        return len(self._data) + 1
+
+    def __contains__(self, key):
+        # não obtém `replacements`
+        return key == "replacements" or key in self._data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+
 class IssueFiles:
-    def __init__(self, acron, issue_folder, classic_website_paths):
+    """
+    Parameters
+    ----------
+    acron: str
+    issue_folder: str
+    classic_website_paths: ClassicWebsitePaths
+    max_workers: int
+        se informado, `files` lista as pastas bases/xml, bases/translation,
+        bases/pdf e htdocs/img/revistas em paralelo (veja `scan`)
+    """
+
+    def __init__(self, acron, issue_folder, classic_website_paths, max_workers=None):
         self.acron = acron
         self.issue_folder = issue_folder
+        self.max_workers = max_workers
         self._subdir_acron_issue = os.path.join(acron, issue_folder)
         self._htdocs_img_revistas_files = None
         self._bases_translation_files = None
         self._bases_pdf_files = None
         self._bases_xml_files = None
+        self._asset_links = None
         self._classic_website_paths = classic_website_paths
 
+    @property
+    def asset_links(self):
+        """
+        Resolve os links dos textos HTML do fascículo,
+        consultando primeiro os arquivos de htdocs/img/revistas/acron/volnum
+
+        Returns
+        -------
+        AssetLinks
+        """
+        if self._asset_links is None:
+            self._asset_links = AssetLinks(self.htdocs_img_revistas_files)
+        return self._asset_links
+
+    def _get_asset_links(self):
+        return self.asset_links
+
+    def scan(self, max_workers=4):
+        """
+        Lista, em paralelo, os arquivos de bases/xml, bases/translation,
+        bases/pdf e htdocs/img/revistas do fascículo
+
+        Returns
+        -------
+        IssueFiles
+        """
+        names = (
+            "bases_xml_files",
+            "bases_translation_files",
+            "bases_pdf_files",
+            "htdocs_img_revistas_files",
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(getattr, self, name) for name in names]
+            for future in futures:
+                future.result()
+        return self
+
     @property
     def files(self):
+        if self.max_workers:
+            self.scan(self.max_workers)
         if self.bases_xml_files:
             yield from self.bases_xml_files
         if self.bases_translation_files:
@@ -59,16 +174,16 @@ class IssueFiles:
         }
         """
         if self._bases_translation_files is None:
-            paths = glob.glob(
+            entries = _scandir(
                 os.path.join(
                     self._classic_website_paths.bases_translation_path,
                     self._subdir_acron_issue,
-                    "*",
                 )
             )
             files = []
-            for path in paths:
-                basename = os.path.basename(path)
+            for entry in entries:
+                path = entry.path
+                basename = entry.name
                 name, ext = os.path.splitext(basename)
                 lang = name[:2]
                 name = name[3:]
@@ -77,16 +192,18 @@ class IssueFiles:
                     name = name[1:]
                     label = "after"
                 files.append(
-                    {
-                        "type": "html",
-                        "key": name,
-                        "path": path,
-                        "name": basename,
-                        "relative_path": _get_classic_website_rel_path(path),
-                        "lang": lang,
-                        "part": label,
-                        "replacements": HTMLFile(path).asset_path_fixes,
-                    }
+                    HTMLFileInfo(
+                        {
+                            "type": "html",
+                            "key": name,
+                            "path": path,
+                            "name": basename,
+                            "relative_path": _get_classic_website_rel_path(path),
+                            "lang": lang,
+                            "part": label,
+                        },
+                        self._get_asset_links,
+                    )
                 )
             self._bases_translation_files = files
         return self._bases_translation_files
@@ -108,16 +225,16 @@ class IssueFiles:
             }
         """
         if self._bases_pdf_files is None:
-            paths = glob.glob(
+            entries = _scandir(
                 os.path.join(
                     self._classic_website_paths.bases_pdf_path,
                     self._subdir_acron_issue,
-                    "*",
                 )
             )
             files = []
-            for path in paths:
-                basename = os.path.basename(path)
+            for entry in entries:
+                path = entry.path
+                basename = entry.name
                 name, ext = os.path.splitext(basename)
                 if name[2] == "_":
                     # translations
@@ -159,50 +276,48 @@ class IssueFiles:
                 }
         """
         if self._htdocs_img_revistas_files is None:
-            paths = glob.glob(
+            entries = _scandir(
                 os.path.join(
                     self._classic_website_paths.htdocs_img_revistas_path,
                     self._subdir_acron_issue,
-                    "*",
                 )
             )
             files = []
-            for path in paths:
-                if os.path.isfile(path):
+            for entry in entries:
+                # DirEntry reaproveita o tipo obtido ao listar a pasta
+                if entry.is_file():
+                    items = [entry]
+                elif entry.is_dir():
+                    items = _scandir(entry.path)
+                else:
+                    continue
+                for item in items:
                     files.append(
                         {
                             "type": "asset",
-                            "path": path,
-                            "relative_path": _get_classic_website_rel_path(path),
-                            "name": os.path.basename(path),
+                            "path": item.path,
+                            "relative_path": _get_classic_website_rel_path(item.path),
+                            "name": item.name,
                         }
                     )
-                elif os.path.isdir(path):
-                    for item in glob.glob(os.path.join(path, "*")):
-                        files.append(
-                            {
-                                "type": "asset",
-                                "path": item,
-                                "relative_path": _get_classic_website_rel_path(item),
-                                "name": os.path.basename(item),
-                            }
-                        )
             self._htdocs_img_revistas_files = files
         return self._htdocs_img_revistas_files
 
     @property
     def bases_xml_files(self):
         if self._bases_xml_files is None:
-            paths = glob.glob(
+            entries = _scandir(
                 os.path.join(
                     self._classic_website_paths.bases_xml_path,
                     self._subdir_acron_issue,
-                    "*.xml",
                 )
             )
             files = []
-            for path in paths:
-                basename = os.path.basename(path)
+            for entry in entries:
+                if not entry.name.endswith(".xml"):
+                    continue
+                path = entry.path
+                basename = entry.name
                 name, ext = os.path.splitext(basename)
                 files.append(
                     {
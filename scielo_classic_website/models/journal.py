@@ -9,8 +9,10 @@ class Journal:
     def __getattr__(self, name):
         # desta forma Journal não precisa herdar de JournalRecord
         # fica menos acoplado
-        if hasattr(self.journal_record, name):
-            return getattr(self.journal_record, name)
+        # `journal_record` ainda não existe durante `pickle.loads`
+        journal_record = self.__dict__.get("journal_record")
+        if hasattr(journal_record, name):
+            return getattr(journal_record, name)
         raise AttributeError(f"classic_website.Journal has no attribute {name}")
 
     @property
@@ -1,10 +1,9 @@
 import plumber
 from lxml import etree as ET
 
-from scielo_classic_website.spsxml.sps_xml_attributes import (
-    CONTRIB_ROLES,
-    get_attribute_value,
-)
+from scielo_classic_website.spsxml import sps_xml_attributes
+from scielo_classic_website.spsxml.sps_xml_attributes import get_attribute_value
+from scielo_classic_website.spsxml.utils import get_xpath
 
 
 def _create_date_element(element_name, attributes, date_text):
@@ -179,7 +178,9 @@ class XMLArticleMetaContribGroupPipe(plumber.Pipe):
             # cria o elemento contrib e seu atributo contrib-type
             contrib = ET.Element("contrib")
             try:
-                contrib_type = CONTRIB_ROLES.get_sps_value(author["role"])
+                contrib_type = sps_xml_attributes.CONTRIB_ROLES.get_sps_value(
+                    author["role"]
+                )
             except KeyError:
                 contrib_type = "author"
             contrib.set("contrib-type", contrib_type)
@@ -546,6 +547,23 @@ class XMLArticleMetaSelfUriPipe(plumber.Pipe):
         return data
 
 
+BODY_COUNTS = (
+    ("fig-count", "count(.//fig[@id] | .//fig-group[@id])"),
+    ("table-count", "count(.//table-wrap[@id] | .//table-wrap-group[@id])"),
+    ("equation-count", "count(.//disp-formula[@id])"),
+)
+
+
+def _get_body_counts(body_node):
+    if body_node is None:
+        # documento sem `body`
+        return [(elem_name, 0) for elem_name, expression in BODY_COUNTS]
+    return [
+        (elem_name, int(get_xpath(expression)(body_node)))
+        for elem_name, expression in BODY_COUNTS
+    ]
+
+
 class XMLArticleMetaCountsPipe(plumber.Pipe):
     def transform(self, data):
         raw, xml = data
@@ -558,19 +576,7 @@ class XMLArticleMetaCountsPipe(plumber.Pipe):
 
         body_node = xml.find("./body")
 
-        elems = [
-            (
-                "fig-count",
-                len(body_node.findall(".//fig[@id]"))
-                + len(body_node.findall(".//fig-group[@id]")),
-            ),
-            (
-                "table-count",
-                len(body_node.findall(".//table-wrap[@id]"))
-                + len(body_node.findall(".//table-wrap-group[@id]")),
-            ),
-            ("equation-count", len(body_node.findall(".//disp-formula[@id]"))),
-        ]
+        elems = _get_body_counts(body_node)
 
         for elem_name, count in elems:
             count_elem = counts.find(elem_name)
@@ -607,22 +613,6 @@ class XMLArticleMetaCountsPipe(plumber.Pipe):
             if counts is None:
                 counts = ET.Element("counts")
 
-            body_node = xml.find("./body")
-
-            elems = [
-                (
-                    "fig-count",
-                    len(body_node.findall(".//fig[@id]"))
-                    + len(body_node.findall(".//fig-group[@id]")),
-                ),
-                (
-                    "table-count",
-                    len(body_node.findall(".//table-wrap[@id]"))
-                    + len(body_node.findall(".//table-wrap-group[@id]")),
-                ),
-                ("equation-count", len(body_node.findall(".//disp-formula[@id]"))),
-            ]
-
             for elem_name, count in elems:
                 count_elem = counts.find(elem_name)
                 if count_elem is None:
@@ -1,8 +1,26 @@
+"""
+Tabelas de valores de atributos do XML SPS.
+
+`ARTICLE_TYPES`, `CONTRIB_ROLES` e `COUNTRY_ITEMS` são carregados dos
+arquivos CSV de `ATTRIBUTES_PATH` somente no primeiro acesso.
+
+Se `ATTRIBUTES_SNAPSHOT_PATH` está configurado, as tabelas são lidas
+deste arquivo (pickle), gerado por `write_snapshot`, enquanto os arquivos
+CSV não mudam.
+"""
 import csv
+import logging
 import os
+import pickle
 
 from scielo_classic_website.attr_values import AttrValues
-from scielo_classic_website.config import ATTRIBUTES_PATH
+from scielo_classic_website.config import ATTRIBUTES_PATH, ATTRIBUTES_SNAPSHOT_PATH
+
+FILENAMES = {
+    "ARTICLE_TYPES": "isis2sps_article_types.csv",
+    "CONTRIB_ROLES": "contrib_roles.csv",
+    "COUNTRY_ITEMS": "country.csv",
+}
 
 
 def _read_csv_file(file_path):
@@ -63,21 +81,87 @@ class Country:
             return country
 
 
-ARTICLE_TYPES = _load_values("isis2sps_article_types.csv")
-
-CONTRIB_ROLES = AttrValues(_read_csv_file(_get_file_path("contrib_roles.csv")))
-
-file_path = _get_file_path("country.csv")
-COUNTRY_ITEMS = Country(_read_csv_file(file_path))
+def _load_tables():
+    return {
+        "ARTICLE_TYPES": _load_values(FILENAMES["ARTICLE_TYPES"]),
+        "CONTRIB_ROLES": AttrValues(
+            list(_read_csv_file(_get_file_path(FILENAMES["CONTRIB_ROLES"])))
+        ),
+        "COUNTRY_ITEMS": Country(
+            _read_csv_file(_get_file_path(FILENAMES["COUNTRY_ITEMS"]))
+        ),
+    }
+
+
+def _get_signature():
+    # identifica o estado dos arquivos CSV usados no snapshot
+    signature = []
+    for filename in sorted(FILENAMES.values()):
+        stat = os.stat(_get_file_path(filename))
+        signature.append((filename, stat.st_mtime_ns, stat.st_size))
+    return signature
+
+
+def write_snapshot(file_path=None):
+    """
+    Grava as tabelas em `file_path` (padrão: `ATTRIBUTES_SNAPSHOT_PATH`)
+    """
+    file_path = file_path or ATTRIBUTES_SNAPSHOT_PATH
+    temp_file_path = file_path + ".tmp"
+    with open(temp_file_path, "wb") as fp:
+        pickle.dump(
+            {"signature": _get_signature(), "tables": _load_tables()},
+            fp,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(temp_file_path, file_path)
+
+
+def _read_snapshot(file_path):
+    try:
+        with open(file_path, "rb") as fp:
+            snapshot = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.info("Unable to read attributes snapshot %s: %s" % (file_path, e))
+        return None
+    if snapshot.get("signature") != _get_signature():
+        return None
+    return snapshot["tables"]
+
+
+def _get_tables():
+    tables = None
+    if ATTRIBUTES_SNAPSHOT_PATH:
+        tables = _read_snapshot(ATTRIBUTES_SNAPSHOT_PATH)
+    return tables or _load_tables()
+
+
+def __getattr__(name):
+    if name not in FILENAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # carrega todas as tabelas de uma vez e as mantém no módulo,
+    # de forma que os próximos acessos não passam por __getattr__
+    tables = _get_tables()
+    globals().update(tables)
+    return tables[name]
 
 
 def get_attribute_value(attribute_name, code, lang=None):
     if attribute_name == "country":
-        return COUNTRY_ITEMS.get(code)
+        return _get_table("COUNTRY_ITEMS").get(code)
     if attribute_name == "country_name":
-        return COUNTRY_ITEMS.name(code, lang)
+        return _get_table("COUNTRY_ITEMS").name(code, lang)
     if attribute_name == "role":
-        return CONTRIB_ROLES.get_sps_value(code)
+        return _get_table("CONTRIB_ROLES").get_sps_value(code)
     if attribute_name == "article-type":
-        return ARTICLE_TYPES.get(code)
+        return _get_table("ARTICLE_TYPES").get(code)
     return code
+
+
+def _get_table(name):
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
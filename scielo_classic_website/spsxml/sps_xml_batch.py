@@ -0,0 +1,109 @@
+"""
+Geração do XML SPS de vários documentos em processos paralelos.
+
+Cada processo reutiliza o seu pipeline de `sps_xml_pipes`.
+Os documentos são recebidos como `Document`, criados com o `IssueContext`
+do fascículo (por exemplo, `ClassicWebsite.get_documents`), ou como os
+dados de `Document` (`{"article": records, "title": record, "issue": record}`),
+que são convertidos em `Document` no próprio processo.
+"""
+import logging
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from scielo_classic_website.models.document import Document
+
+
+def generate_full_xml(item):
+    """
+    Gera o XML de `item`, `Document` ou dados de `Document`
+
+    Raises
+    ------
+    ValueError
+        se `item` não tem os registros do periódico e do fascículo
+    """
+    document = item
+    if not isinstance(item, Document):
+        if not isinstance(item, dict) or not item.get("title") or not item.get("issue"):
+            raise ValueError(
+                "Unable to generate XML: title and issue records are required"
+            )
+        document = Document(item)
+    return document.generate_full_xml()
+
+
+def _convert(convert, key, item):
+    try:
+        return key, convert(item), None
+    except Exception as e:
+        logging.exception("Unable to generate XML %s: %s" % (key, e))
+        return key, None, e
+
+
+def _get_keys_and_items(items):
+    for i, item in enumerate(items):
+        if isinstance(item, Document):
+            yield i, item
+        else:
+            # (pid, Document) ou (pid, dados de Document)
+            yield item
+
+
+def generate_full_xml_in_batch(
+    items, max_workers=None, ordered=True, max_in_flight=None, convert=None
+):
+    """
+    Gera o XML SPS dos documentos em processos paralelos
+
+    Parameters
+    ----------
+    items: iterable
+        `Document`, `(pid, Document)` ou `(pid, dict)`, sendo `dict`
+        os dados de `Document`, com os registros `article`, `title` e `issue`
+    max_workers: int
+        quantidade de processos (padrão: quantidade de CPUs)
+    ordered: bool
+        `True` retorna os resultados na ordem de `items`;
+        `False`, na ordem de finalização
+    max_in_flight: int
+        quantidade máxima de documentos submetidos e ainda não retornados
+        (padrão: 2 * max_workers)
+    convert: callable
+        função que gera o XML de um item (padrão: `generate_full_xml`)
+
+    Returns
+    -------
+    generator of tuple (key, xml, error)
+        `key` é o `pid` de `(pid, ...)` ou a posição do `Document`
+        em `items`. Se a geração falha, `xml` é `None` e `error`
+        é a exceção ocorrida
+    """
+    convert = convert or generate_full_xml
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * max_workers
+    keys_and_items = _get_keys_and_items(items)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        if ordered:
+            running = deque()
+            for key, item in keys_and_items:
+                running.append(executor.submit(_convert, convert, key, item))
+                if len(running) >= max_in_flight:
+                    yield running.popleft().result()
+            while running:
+                yield running.popleft().result()
+            return
+
+        running = set()
+        while True:
+            for key, item in keys_and_items:
+                running.add(executor.submit(_convert, convert, key, item))
+                if len(running) >= max_in_flight:
+                    break
+            if not running:
+                break
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -4,16 +4,64 @@ from io import StringIO
 import plumber
 from lxml import etree as ET
 
+from scielo_classic_website.spsxml.utils import get_html_parser, get_xpath
 
-def convert_html_to_xml(document):
+
+def convert_html_to_xml(document, snapshots=False):
     """
     document está em scielo_classic_website.models.document.Document.
-    """
 
+    Executa as etapas 1, 2 e 3 em um único pipeline, mantendo a árvore
+    XML em memória entre as etapas e serializando somente no final.
+    O resultado fica em `document.xml_body_and_back[-1]`.
+
+    Parameters
+    ----------
+    document: Document
+    snapshots: bool
+        `True` guarda também em `document.xml_body_and_back`
+        o XML resultante das etapas 1 e 2 (para depuração)
+    """
     document.xml_body_and_back = []
-    document.xml_body_and_back.append(convert_html_to_xml_step_1(document))
-    document.xml_body_and_back.append(convert_html_to_xml_step_2(document))
-    document.xml_body_and_back.append(convert_html_to_xml_step_3(document))
+
+    pipes = _get_step_1_pipes()
+    if snapshots:
+        pipes.append(SnapshotPipe())
+    pipes.append(CDATAToTextPipe())
+    pipes.extend(_get_step_2_pipes())
+    if snapshots:
+        pipes.append(SnapshotPipe())
+    pipes.extend(_get_step_3_pipes())
+    pipes.append(EndPipe())
+
+    ppl = plumber.Pipeline(*pipes)
+    transformed_data = ppl.run(document, rewrap=True)
+    document.xml_body_and_back.append(next(transformed_data))
+
+
+def _get_step_1_pipes():
+    return [
+        SetupPipe(),
+        MainHTMLPipe(),
+        TranslatedHTMLPipe(),
+    ]
+
+
+def _get_step_2_pipes():
+    return [
+        RemoveCDATAPipe(),
+        RemoveCommentPipe(),
+        FontSymbolPipe(),
+        RemoveTagsPipe(),
+        ConvertElementsPipe(),
+    ]
+
+
+def _get_step_3_pipes():
+    return [
+        XRefTypePipe(),
+        TableWrapFigPipe(),
+    ]
 
 
 def convert_html_to_xml_step_1(document):
@@ -27,12 +75,7 @@ def convert_html_to_xml_step_1(document):
     ----------
     document: Document
     """
-    ppl = plumber.Pipeline(
-        SetupPipe(),
-        MainHTMLPipe(),
-        TranslatedHTMLPipe(),
-        EndPipe(),
-    )
+    ppl = plumber.Pipeline(*_get_step_1_pipes(), EndPipe())
     transformed_data = ppl.run(document, rewrap=True)
     return next(transformed_data)
 
@@ -55,23 +98,7 @@ def convert_html_to_xml_step_2(document):
     tex-math | mml:math | p | related-article | related-object | disp-quote |
     speech | statement | verse-group)*, (sec)*, sig-block?)
     """
-    ppl = plumber.Pipeline(
-        StartPipe(),
-        RemoveCDATAPipe(),
-        RemoveCommentPipe(),
-        FontSymbolPipe(),
-        RemoveTagsPipe(),
-        RenameElementsPipe(),
-        StylePipe(),
-        OlPipe(),
-        UlPipe(),
-        TagsHPipe(),
-        ASourcePipe(),
-        AHrefPipe(),
-        ANamePipe(),
-        ImgSrcPipe(),
-        EndPipe(),
-    )
+    ppl = plumber.Pipeline(StartPipe(), *_get_step_2_pipes(), EndPipe())
     transformed_data = ppl.run(document, rewrap=True)
     return next(transformed_data)
 
@@ -94,12 +121,7 @@ def convert_html_to_xml_step_3(document):
     tex-math | mml:math | p | related-article | related-object | disp-quote |
     speech | statement | verse-group)*, (sec)*, sig-block?)
     """
-    ppl = plumber.Pipeline(
-        StartPipe(),
-        XRefTypePipe(),
-        TableWrapFigPipe(),
-        EndPipe(),
-    )
+    ppl = plumber.Pipeline(StartPipe(), *_get_step_3_pipes(), EndPipe())
     transformed_data = ppl.run(document, rewrap=True)
     return next(transformed_data)
 
@@ -131,11 +153,62 @@ def convert_html_to_xml_step_4(document):
 
 
 def _process(xml, tag, func):
-    nodes = xml.findall(".//%s" % tag)
+    nodes = get_xpath(".//%s" % tag)(xml)
     for node in nodes:
         func(node)
 
 
+class NodeHandlers:
+    """
+    Funções registradas por tag (e, opcionalmente, atributo),
+    aplicadas aos elementos percorrendo a árvore uma única vez
+
+    As funções são aplicadas na ordem de registro. Se uma função muda a tag
+    do elemento, as funções registradas depois dela para a nova tag também
+    são aplicadas, como ocorre ao executar os pipes um após o outro
+    """
+
+    def __init__(self):
+        # tag: [(ordem, atributo, valor, função)]
+        self._handlers = {}
+        self._total = 0
+
+    def register(self, tag, func, attribute=None, value=None):
+        """
+        Registra `func` para os elementos `tag`,
+        que tenham `attribute` (com `value`, se informado)
+        """
+        self._handlers.setdefault(tag, []).append((self._total, attribute, value, func))
+        self._total += 1
+
+    def _get_handler(self, node, order):
+        for handler_order, attribute, value, func in self._handlers.get(node.tag, ()):
+            if handler_order < order:
+                continue
+            if attribute is None:
+                return handler_order, func
+            attribute_value = node.get(attribute)
+            if attribute_value is None:
+                continue
+            if value is None or value == attribute_value:
+                return handler_order, func
+
+    def process(self, xml):
+        # xml.iter filtra as tags sem criar objetos Python para
+        # os demais elementos; xml não é incluído, assim como em `.//tag`
+        for node in xml.iter(*self._handlers):
+            if node is xml:
+                continue
+            order = 0
+            while True:
+                handler = self._get_handler(node, order)
+                if handler is None:
+                    break
+                handler_order, func = handler
+                func(node)
+                order = handler_order + 1
+
+
 class StartPipe(plumber.Pipe):
     """
     raw.xml_body_and_back é o atributo que guarda os resultados
@@ -186,6 +259,41 @@ class EndPipe(plumber.Pipe):
         return data
 
 
+class SnapshotPipe(plumber.Pipe):
+    """
+    Guarda em raw.xml_body_and_back o XML serializado da etapa atual,
+    sem interromper a conversão, que continua com a mesma árvore
+    """
+
+    def transform(self, data):
+        raw, xml = data
+        raw.xml_body_and_back.append(
+            ET.tostring(
+                xml,
+                encoding="utf-8",
+                method="xml",
+            )
+        )
+        return data
+
+
+class CDATAToTextPipe(plumber.Pipe):
+    """
+    Converte o conteúdo CDATA em texto, como ocorre ao serializar
+    e fazer o parse novamente entre as etapas (StartPipe).
+    Elementos com filhos não são tratados por RemoveCDATAPipe
+    e passariam a ter o texto escapado
+    """
+
+    def transform(self, data):
+        raw, xml = data
+        for node in xml.iter():
+            if node.text:
+                # atribuir str substitui o nó CDATA por texto
+                node.text = node.text
+        return data
+
+
 class MainHTMLPipe(plumber.Pipe):
     """
     O texto completo principal é dividido em 3 partes
@@ -325,8 +433,7 @@ class TranslatedHTMLPipe(plumber.Pipe):
 def html_body_tree(html_text):
     # html_text = "<html><head><title>test<body><h1>page title</h3>"
     try:
-        parser = ET.HTMLParser()
-        h = ET.parse(StringIO(html_text), parser)
+        h = ET.parse(StringIO(html_text), get_html_parser())
         return h.getroot().find(".//body")
     except AttributeError:
         logging.info("html_body_tree: %s" % html_text)
@@ -360,7 +467,7 @@ class RemoveCommentPipe(plumber.Pipe):
 
     def transform(self, data):
         raw, xml = data
-        comments = xml.xpath("//comment()")
+        comments = get_xpath("//comment()")(xml)
         for comment in comments:
             parent = comment.getparent()
             if parent is not None:
@@ -397,12 +504,21 @@ class RenameElementsPipe(plumber.Pipe):
         ("i", "italic"),
     )
 
+    def _rename(self, new):
+        def rename(node):
+            node.tag = new
+
+        return rename
+
+    def register(self, node_handlers):
+        for old, new in self.from_to:
+            node_handlers.register(old, self._rename(new))
+
     def transform(self, data):
         raw, xml = data
 
         for old, new in self.from_to:
-            xpath = f".//{old}"
-            for node in xml.findall(xpath):
+            for node in get_xpath(f".//{old}")(xml):
                 node.tag = new
         return data
 
@@ -410,18 +526,30 @@ class RenameElementsPipe(plumber.Pipe):
 class FontSymbolPipe(plumber.Pipe):
     def transform(self, data):
         raw, xml = data
-        xpath = f".//font[@face='symbol']"
-        for node in xml.xpath(xpath):
+        for node in get_xpath(".//font[@face='symbol']")(xml):
             node.tag = "font-face-symbol"
         return data
 
 
 class StylePipe(plumber.Pipe):
+    STYLES = ("bold", "italic", "sup", "sub", "underline")
+
+    def _rename(self, style):
+        def rename(node):
+            node.tag = style
+
+        return rename
+
+    def register(self, node_handlers):
+        for style in self.STYLES:
+            node_handlers.register(
+                "span", self._rename(style), "name", f"style_{style}"
+            )
+
     def transform(self, data):
         raw, xml = data
-        for style in ("bold", "italic", "sup", "sub", "underline"):
-            xpath = f".//span[@name='style_{style}']"
-            for node in xml.xpath(xpath):
+        for style in self.STYLES:
+            for node in get_xpath(f".//span[@name='style_{style}']")(xml):
                 node.tag = style
         return data
 
@@ -431,6 +559,9 @@ class OlPipe(plumber.Pipe):
         node.tag = "list"
         node.set("list-type", "order")
 
+    def register(self, node_handlers):
+        node_handlers.register("ol", self.parser_node)
+
     def transform(self, data):
         raw, xml = data
         _process(xml, "ol", self.parser_node)
@@ -443,6 +574,9 @@ class UlPipe(plumber.Pipe):
         node.set("list-type", "bullet")
         node.attrib.pop("list", None)
 
+    def register(self, node_handlers):
+        node_handlers.register("ul", self.parser_node)
+
     def transform(self, data):
         raw, xml = data
         _process(xml, "ul", self.parser_node)
@@ -456,10 +590,15 @@ class TagsHPipe(plumber.Pipe):
         node.tag = "title"
         node.set("content-type", org_tag)
 
+    TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
+    def register(self, node_handlers):
+        for tag in self.TAGS:
+            node_handlers.register(tag, self.parser_node)
+
     def transform(self, data):
         raw, xml = data
-        tags = ["h1", "h2", "h3", "h4", "h5", "h6"]
-        for tag in tags:
+        for tag in self.TAGS:
             _process(xml, tag, self.parser_node)
         return data
 
@@ -471,6 +610,9 @@ class ASourcePipe(plumber.Pipe):
         if not href and src:
             node.attrib["href"] = node.attrib.pop("src")
 
+    def register(self, node_handlers):
+        node_handlers.register("a", self._change_src_to_href, "src")
+
     def transform(self, data):
         raw, xml = data
         _process(xml, "a[@src]", self._change_src_to_href)
@@ -548,12 +690,18 @@ class AHrefPipe(plumber.Pipe):
         _process(xml, "a[@href]", self.parser_node)
         return data
 
+    def register(self, node_handlers):
+        node_handlers.register("a", self.parser_node, "href")
+
 
 class ANamePipe(plumber.Pipe):
     def parser_node(self, node):
         node.tag = "div"
         node.set("id", node.attrib.pop("name"))
 
+    def register(self, node_handlers):
+        node_handlers.register("a", self.parser_node, "name")
+
     def transform(self, data):
         raw, xml = data
         _process(xml, "a[@name]", self.parser_node)
@@ -581,12 +729,47 @@ class ImgSrcPipe(plumber.Pipe):
         node.attrib.clear()
         node.set("{http://www.w3.org/1999/xlink}href", href)
 
+    def register(self, node_handlers):
+        node_handlers.register("img", self.parser_node, "src")
+
     def transform(self, data):
         raw, xml = data
         _process(xml, "img[@src]", self.parser_node)
         return data
 
 
+class ConvertElementsPipe(plumber.Pipe):
+    """
+    Executa RenameElementsPipe, StylePipe, OlPipe, UlPipe, TagsHPipe,
+    ASourcePipe, AHrefPipe, ANamePipe e ImgSrcPipe, nesta ordem,
+    percorrendo a árvore uma única vez
+
+    Deve ser executado após FontSymbolPipe e RemoveTagsPipe
+    """
+
+    PIPES = (
+        RenameElementsPipe,
+        StylePipe,
+        OlPipe,
+        UlPipe,
+        TagsHPipe,
+        ASourcePipe,
+        AHrefPipe,
+        ANamePipe,
+        ImgSrcPipe,
+    )
+
+    def __init__(self):
+        self.node_handlers = NodeHandlers()
+        for pipe in self.PIPES:
+            pipe().register(self.node_handlers)
+
+    def transform(self, data):
+        raw, xml = data
+        self.node_handlers.process(xml)
+        return data
+
+
 class XRefTypePipe(plumber.Pipe):
     def parser_node(self, node):
         rid_first_char = node.get("rid")[0]
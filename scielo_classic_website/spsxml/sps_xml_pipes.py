@@ -1,9 +1,11 @@
 import logging
+import threading
 from copy import deepcopy
 
 import plumber
 from lxml import etree as ET
 
+from scielo_classic_website.spsxml import sps_xml_attributes
 from scielo_classic_website.spsxml.sps_xml_article_meta import (
     XMLArticleMetaAbstractsPipe,
     XMLArticleMetaAffiliationPipe,
@@ -23,10 +25,6 @@ from scielo_classic_website.spsxml.sps_xml_article_meta import (
     XMLArticleMetaTitleGroupPipe,
     XMLArticleMetaTranslatedTitleGroupPipe,
 )
-from scielo_classic_website.spsxml.sps_xml_attributes import (
-    ARTICLE_TYPES,
-    COUNTRY_ITEMS,
-)
 from scielo_classic_website.spsxml.sps_xml_refs import XMLArticleMetaCitationsPipe
 
 
@@ -41,6 +39,19 @@ def get_xml_rsps(document):
     return _process(document)
 
 
+# um pipeline por thread, reutilizado por todos os documentos,
+# pois os pipes guardam os dados recebidos durante a execução
+_local = threading.local()
+
+
+def _get_pipeline():
+    try:
+        return _local.pipeline
+    except AttributeError:
+        _local.pipeline = _create_pipeline()
+        return _local.pipeline
+
+
 def _process(document):
     """
     Aplica as transformações
@@ -49,7 +60,27 @@ def _process(document):
     ----------
     document: dict
     """
-    ppl = plumber.Pipeline(
+    transformed_data = _get_pipeline().run(document, rewrap=True)
+    try:
+        return next(transformed_data)
+    finally:
+        # não mantém a árvore do documento em memória após a conversão
+        _local.converted_html_body = None
+
+
+def _get_converted_html_body(xml_body):
+    """
+    Faz o parse de `xml_body` uma única vez para XMLBodyPipe, XMLBackPipe
+    e XMLSubArticlePipe, que copiam os elementos sem alterar a árvore
+    """
+    cached = getattr(_local, "converted_html_body", None)
+    if cached is None or cached[0] is not xml_body:
+        cached = _local.converted_html_body = (xml_body, ET.fromstring(xml_body))
+    return cached[1]
+
+
+def _create_pipeline():
+    return plumber.Pipeline(
         SetupArticlePipe(),
         XMLArticlePipe(),
         XMLFrontPipe(),
@@ -80,8 +111,6 @@ def _process(document):
         XMLArticleMetaCountsPipe(),
         XMLClosePipe(),
     )
-    transformed_data = ppl.run(document, rewrap=True)
-    return next(transformed_data)
 
 
 class SetupArticlePipe(plumber.Pipe):
@@ -135,7 +164,7 @@ class XMLArticlePipe(plumber.Pipe):
     def transform(self, data):
         raw, xml = data
 
-        document_type = ARTICLE_TYPES.get(raw.document_type)
+        document_type = sps_xml_attributes.ARTICLE_TYPES.get(raw.document_type)
         xml.set("{http://www.w3.org/XML/1998/namespace}lang", raw.original_language)
         xml.set("article-type", document_type)
 
@@ -221,7 +250,7 @@ class XMLJournalMetaPublisherPipe(plumber.Pipe):
 
         if raw.journal.publisher_country:
             countrycode = raw.journal.publisher_country
-            countryname = COUNTRY_ITEMS.name(countrycode)
+            countryname = sps_xml_attributes.COUNTRY_ITEMS.name(countrycode)
             publishercountry = countryname or countrycode
 
         publisherloc = [
@@ -251,7 +280,7 @@ class XMLBodyPipe(plumber.Pipe):
     def transform(self, data):
         raw, xml = data
 
-        converted_html_body = ET.fromstring(raw.xml_body)
+        converted_html_body = _get_converted_html_body(raw.xml_body)
         body = deepcopy(converted_html_body.find(".//body"))
         body.set("specific-use", "quirks-mode")
         xml.append(body)
@@ -269,7 +298,7 @@ class XMLBackPipe(plumber.Pipe):
     def transform(self, data):
         raw, xml = data
 
-        converted_html_body = ET.fromstring(raw.xml_body)
+        converted_html_body = _get_converted_html_body(raw.xml_body)
         back = converted_html_body.find(".//back")
         if back is not None:
             xml.append(deepcopy(back))
@@ -287,7 +316,7 @@ class XMLSubArticlePipe(plumber.Pipe):
     def transform(self, data):
         raw, xml = data
 
-        converted_html_body = ET.fromstring(raw.xml_body)
+        converted_html_body = _get_converted_html_body(raw.xml_body)
         for subart in converted_html_body.findall(".//sub-article"):
             subarticle = deepcopy(subart)
             xml.append(subarticle)
@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import datetime
 from io import StringIO
 
@@ -62,28 +63,85 @@ class XMLArticleMetaCitationsPipe(plumber.Pipe):
 
         refs = ET.Element("ref-list")
 
-        cit = XMLCitation()
-        for i, citation in enumerate(raw.citations):
-            try:
-                citation.fix_function = html_decode
-                ref = cit.deploy(xylose_adapters.ReferenceXyloseAdapter(citation))[1]
-                if ref is not None:
-                    if ref.find(".//mixed-citation") is None:
-                        ref_id = ref.get("id")
-                        r = reflist.find(f".//ref[@id='{ref_id}']")
-                        if r is not None:
-                            mixed_citation = r.find(".//mixed-citation")
-                            if mixed_citation is not None:
-                                ref.insert(0, mixed_citation)
-                    refs.append(ref)
-            except Exception as e:
-                logging.info(i)
-                logging.exception(e)
-                raise e
+        refs_by_id = None
+        for ref in render_references(raw.citations):
+            if ref is None:
+                continue
+            if ref.find(".//mixed-citation") is None:
+                if refs_by_id is None:
+                    refs_by_id = get_refs_by_id(reflist)
+                r = refs_by_id.get(ref.get("id"))
+                if r is not None:
+                    mixed_citation = r.find(".//mixed-citation")
+                    if mixed_citation is not None:
+                        ref.insert(0, mixed_citation)
+            refs.append(ref)
         back.replace(reflist, refs)
         return data
 
 
+_local = threading.local()
+
+
+def get_xml_citation():
+    """
+    Obtém o `XMLCitation` da thread atual, criado uma única vez
+
+    O pipeline guarda estado durante a execução,
+    então não é compartilhado entre threads
+    """
+    try:
+        return _local.xml_citation
+    except AttributeError:
+        _local.xml_citation = XMLCitation()
+        return _local.xml_citation
+
+
+def get_refs_by_id(reflist):
+    """
+    Indexa os elementos `ref` de `reflist` pelo atributo `id`
+
+    Se houver `id` repetido, mantém o primeiro, como `find` faria
+    """
+    refs_by_id = {}
+    for ref in reflist.iter("ref"):
+        refs_by_id.setdefault(ref.get("id"), ref)
+    return refs_by_id
+
+
+def _get_adapted_references(citations):
+    for citation in citations:
+        citation.fix_function = html_decode
+        yield xylose_adapters.ReferenceXyloseAdapter(citation)
+
+
+def render_references(citations):
+    """
+    Gera os elementos `ref` de `citations` usando um único pipeline
+
+    Parameters
+    ----------
+    citations: iterable of ReferenceRecord
+
+    Returns
+    -------
+    generator of lxml.etree.Element
+        `ref` de cada citação ou `None`
+    """
+    # posição da citação em processamento, registrada em caso de erro
+    i = 0
+    try:
+        for raw, ref in get_xml_citation().deploy_many(
+            _get_adapted_references(citations)
+        ):
+            yield ref
+            i += 1
+    except Exception as e:
+        logging.info(i)
+        logging.exception(e)
+        raise e
+
+
 class XMLCitation(object):
     def __init__(self):
         self._ppl = plumber.Pipeline(
@@ -897,3 +955,13 @@ class XMLCitation(object):
         transformed_data = self._ppl.run(raw, rewrap=True)
 
         return next(transformed_data)
+
+    def deploy_many(self, raws):
+        """
+        Executa o pipeline para cada item de `raws`
+
+        Returns
+        -------
+        generator of tuple (raw, xml)
+        """
+        return self._ppl.run(raws)
@@ -1,3 +1,45 @@
+import threading
+
+from lxml import etree as ET
+
+# objetos XPath e parsers reutilizados, um conjunto por thread
+_local = threading.local()
+
+
+def get_xpath(expression):
+    """
+    Obtém o `ET.XPath` de `expression`, compilado uma única vez por thread
+
+    Parameters
+    ----------
+    expression: str
+
+    Returns
+    -------
+    lxml.etree.XPath
+    """
+    try:
+        xpaths = _local.xpaths
+    except AttributeError:
+        xpaths = _local.xpaths = {}
+    try:
+        return xpaths[expression]
+    except KeyError:
+        xpaths[expression] = ET.XPath(expression)
+        return xpaths[expression]
+
+
+def get_html_parser():
+    """
+    Obtém o `ET.HTMLParser` da thread atual, criado uma única vez
+    """
+    try:
+        return _local.html_parser
+    except AttributeError:
+        _local.html_parser = ET.HTMLParser()
+        return _local.html_parser
+
+
 def convert_ahref_to_extlink(xml_etree):
     """
     This methods receives an etree node and replace all "a href" elements to
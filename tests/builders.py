@@ -0,0 +1,119 @@
+"""
+Dados e funções compartilhados pelos testes: bases ISIS (`.mst` e `.xrf`)
+e registros de um documento com o seu periódico e fascículo
+"""
+import struct
+
+
+def write_isis_db(db_file_path, records, leader_format="<ihiHHHH"):
+    """
+    Cria uma base ISIS (`.mst` e `.xrf`) com os `records`,
+    lista de campos `(tag, content)`. `None` representa registro apagado
+    """
+    leader = struct.Struct(leader_format)
+    mst = bytearray(64)
+    pointers = []
+    for mfn, fields in enumerate(records, 1):
+        if fields is None:
+            pointers.append(-1)
+            continue
+        directory = b""
+        data = b""
+        for tag, content in fields:
+            encoded = content.encode("iso-8859-1")
+            directory += struct.pack("<HHH", tag, len(data), len(encoded))
+            data += encoded
+        base = leader.size + len(directory)
+        mfrl = base + len(data)
+        if mfrl % 2:
+            data += b" "
+            mfrl += 1
+        if 512 - len(mst) % 512 < leader.size:
+            mst += b"\0" * (512 - len(mst) % 512)
+        mfb, mfp = divmod(len(mst), 512)
+        pointers.append((mfb + 1) * 2048 + mfp)
+        mst += leader.pack(mfn, mfrl, 0, 0, base, len(fields), 0)
+        mst += directory + data
+    mst[:32] = struct.pack("<iiiHHiiii", 0, len(records) + 1, 1, 64, 0, 0, 0, 0, 0)
+
+    xrf = b""
+    blocks = [pointers[i : i + 127] for i in range(0, len(pointers), 127)] or [[]]
+    for i, block in enumerate(blocks, 1):
+        xrfpos = -i if i == len(blocks) else i
+        block = block + [0] * (127 - len(block))
+        xrf += struct.pack("<128i", xrfpos, *block)
+
+    with open(db_file_path + ".mst", "wb") as fp:
+        fp.write(mst)
+    with open(db_file_path + ".xrf", "wb") as fp:
+        fp.write(xrf)
+
+
+RECORDS = [
+    [
+        (706, "h"),
+        (880, "S0044-59672019000300242"),
+        (10, "^1aff1 aff2^k0000-0002-3193-6659^nYardany^rND^sRAMOS-PASTRANA"),
+        (10, "^1aff2^nMarta^rND^sWOLFF"),
+        (12, "Título^lpt"),
+    ],
+    None,
+    [
+        (706, "c"),
+        (880, "S0044-59672019000300242"),
+        (30, "Acta Amaz.   "),
+    ],
+    [
+        (706, "h"),
+        (880, "S0044-59672019000300250"),
+    ],
+]
+
+
+JOURNAL_RECORD = {
+    "v400": [{"_": "0044-5967"}],
+    "v068": [{"_": "aa"}],
+    "v100": [{"_": "Acta Amazonica"}],
+    "v150": [{"_": "Acta Amaz."}],
+    "v435": [{"_": "0044-5967", "t": "PRINT"}],
+    "v480": [{"_": "INPA"}],
+    "v490": [{"_": "Manaus"}],
+    "v320": [{"_": "AM"}],
+    "v310": [{"_": "BR"}],
+}
+ISSUE_RECORD = {
+    "v035": [{"_": "0044-5967"}],
+    "v036": [{"_": "20193"}],
+    "v031": [{"_": "49"}],
+    "v032": [{"_": "3"}],
+    "v065": [{"_": "20190900"}],
+}
+
+
+def get_article_records(pid):
+    """
+    Registros `o`, `h`, `f` e `p` de um documento da base artigo
+    """
+    base = {"v880": [{"_": pid}], "v702": [{"_": f"aa/v49n3/{pid[-5:]}.htm"}]}
+    h = dict(
+        base,
+        v706=[{"_": "h"}],
+        v012=[{"_": "Título", "l": "pt"}],
+        v040=[{"_": "pt"}],
+        v010=[{"n": "Marta", "s": "WOLFF"}],
+        v065=[{"_": "20190900"}],
+        v014=[{"f": "242", "l": "250"}],
+    )
+    return [
+        dict(base, v706=[{"_": "o"}]),
+        h,
+        dict(h, v706=[{"_": "f"}]),
+        dict(base, v706=[{"_": "p"}], v701=[{"_": "1"}], v704=[{"_": "<p>Texto</p>"}]),
+        dict(
+            base,
+            v706=[{"_": "p"}],
+            v701=[{"_": "2"}],
+            v888=[{"_": "1"}],
+            v704=[{"_": "<p>1. Silva A. Título. 2001.</p>"}],
+        ),
+    ]
@@ -0,0 +1,206 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from tests.builders import ISSUE_RECORD, JOURNAL_RECORD, get_article_records
+
+from scielo_classic_website import exceptions
+from scielo_classic_website.async_classic_ws import AsyncClassicWebsite
+from scielo_classic_website.models.catalog import Catalog
+
+
+def fake_convert(document):
+    records = document.data["article"]
+    if not records:
+        raise ValueError("no records")
+    return records[0]["xml"]
+
+
+def get_journal_id(document):
+    return id(document.journal)
+
+
+def get_issue_record(issue_pid):
+    return dict(
+        ISSUE_RECORD,
+        v035=[{"_": issue_pid[:9]}],
+        v036=[{"_": issue_pid[9:13] + str(int(issue_pid[13:]))}],
+    )
+
+
+ISSUE_PIDS = ["0001-37141998000%i" % i for i in range(4)]
+
+
+class FakeClassicWebsite:
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.catalogs = 0
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def _wait(self):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+
+    def get_documents_pids_and_records(self, acron, issue_folder, issue_pid):
+        self._wait()
+        if acron == "error":
+            raise FileNotFoundError(issue_folder)
+        yield issue_pid + "00001", [{"xml": f"<article>{issue_folder}</article>"}]
+        yield issue_pid + "00002", []
+
+    def get_issue_files(self, acron, issue_folder):
+        self._wait()
+        yield {"key": issue_folder}
+
+    def get_catalog(self, snapshot_path=None):
+        self.catalogs += 1
+        return Catalog(
+            [("0001-3714", [dict(JOURNAL_RECORD, v400=[{"_": "0001-3714"}])])],
+            [(issue_pid, [get_issue_record(issue_pid)]) for issue_pid in ISSUE_PIDS],
+        )
+
+
+class ArticleClassicWebsite(FakeClassicWebsite):
+    def get_documents_pids_and_records(self, acron, issue_folder, issue_pid):
+        pid = f"S{issue_pid}00242"
+        yield pid, get_article_records(pid)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def migrate_issues(website, issues, **kwargs):
+    async with website:
+        return [item async for item in website.migrate_issues(issues, **kwargs)]
+
+
+class TestAsyncClassicWebsite(TestCase):
+    def test_migrate_issue(self):
+        async def migrate_issue(website):
+            async with website:
+                return await website.migrate_issue("acta", "v1n1", "0001-371419980001")
+
+        website = AsyncClassicWebsite(
+            FakeClassicWebsite(), xml_workers=1, convert=fake_convert
+        )
+        result = run(migrate_issue(website))
+        self.assertEqual([{"key": "v1n1"}], result["issue_files"])
+        documents = result["documents"]
+        self.assertEqual(
+            ("0001-37141998000100001", "<article>v1n1</article>", None),
+            documents[0],
+        )
+        self.assertEqual("0001-37141998000100002", documents[1][0])
+        self.assertIsNone(documents[1][1])
+        self.assertIsInstance(documents[1][2], ValueError)
+
+    def test_migrate_issues(self):
+        issues = [
+            ("acta", "v1n1", "0001-371419980001"),
+            ("error", "v1n2", "0001-371419980002"),
+            ("acta", "v1n3", "0001-371419980003"),
+        ]
+        website = AsyncClassicWebsite(
+            FakeClassicWebsite(), xml_workers=2, convert=fake_convert
+        )
+        result = {
+            issue[1]: (r, e) for issue, r, e in run(migrate_issues(website, issues))
+        }
+        self.assertEqual(
+            "<article>v1n3</article>", result["v1n3"][0]["documents"][0][1]
+        )
+        self.assertIsNone(result["v1n2"][0])
+        self.assertIsInstance(result["v1n2"][1], FileNotFoundError)
+
+    def test_stages_run_at_the_same_time(self):
+        classic_website = FakeClassicWebsite(delay=0.2)
+        website = AsyncClassicWebsite(
+            classic_website,
+            records_concurrency=2,
+            files_concurrency=2,
+            xml_workers=1,
+            convert=fake_convert,
+        )
+        issues = [("acta", f"v1n{i}", "0001-37141998000%i" % i) for i in range(2)]
+        start = time.monotonic()
+        run(migrate_issues(website, issues))
+        # 2 fascículos x 2 leituras de 0.2 s
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertEqual(4, classic_website.max_running)
+
+    def test_concurrency_limits(self):
+        classic_website = FakeClassicWebsite(delay=0.05)
+        website = AsyncClassicWebsite(
+            classic_website,
+            records_concurrency=1,
+            files_concurrency=1,
+            xml_workers=1,
+            convert=fake_convert,
+        )
+        issues = [("acta", f"v1n{i}", "0001-37141998000%i" % i) for i in range(4)]
+        result = run(migrate_issues(website, issues, max_in_flight=4))
+        self.assertEqual(4, len(result))
+        self.assertEqual(2, classic_website.max_running)
+
+    def test_requires_async_with(self):
+        website = AsyncClassicWebsite(FakeClassicWebsite(), convert=fake_convert)
+        with self.assertRaises(RuntimeError):
+            run(website.get_issue_files("acta", "v1n1"))
+
+    def test_catalog_is_read_once(self):
+        classic_website = FakeClassicWebsite()
+        website = AsyncClassicWebsite(
+            classic_website, xml_workers=1, convert=fake_convert
+        )
+        issues = [("acta", f"v1n{i}", "0001-37141998000%i" % i) for i in range(4)]
+        run(migrate_issues(website, issues))
+        self.assertEqual(1, classic_website.catalogs)
+
+    def test_migrate_issue_raises_error_if_issue_does_not_exist(self):
+        async def migrate_issue(website):
+            async with website:
+                return await website.migrate_issue("acta", "v1n9", "0001-371419980009")
+
+        website = AsyncClassicWebsite(
+            FakeClassicWebsite(), xml_workers=1, convert=fake_convert
+        )
+        with self.assertRaises(exceptions.IssueNotFoundError):
+            run(migrate_issue(website))
+
+    def test_migrate_issue_generates_full_xml(self):
+        async def migrate_issue(website):
+            async with website:
+                return await website.migrate_issue("acta", "v1n1", "0001-371419980001")
+
+        website = AsyncClassicWebsite(ArticleClassicWebsite(), xml_workers=1)
+        result = run(migrate_issue(website))
+        pid, xml, error = result["documents"][0]
+        self.assertEqual("S0001-37141998000100242", pid)
+        self.assertIsNone(error)
+        xml = xml.decode("utf-8")
+        self.assertIn('<journal-id journal-id-type="publisher-id">aa</journal-id>', xml)
+        self.assertIn(f'specific-use="scielo-v2">{pid}</article-id>', xml)
+
+    def test_documents_of_an_issue_share_journal_in_the_worker(self):
+        async def migrate_issue(website):
+            async with website:
+                return await website.migrate_issue("acta", "v1n1", "0001-371419980001")
+
+        website = AsyncClassicWebsite(
+            FakeClassicWebsite(), xml_workers=2, convert=get_journal_id
+        )
+        documents = run(migrate_issue(website))["documents"]
+        self.assertEqual(2, len(documents))
+        self.assertEqual(documents[0][1], documents[1][1])
@@ -0,0 +1,173 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from scielo_classic_website.classic_ws import ClassicWebsite
+from scielo_classic_website.models.catalog import Catalog
+
+JOURNALS = [
+    (
+        "0001-3714",
+        [
+            {
+                "v400": [{"_": "0001-3714"}],
+                "v068": [{"_": "ACTA"}],
+                "v100": [{"_": "Acta Scientiarum"}],
+                "v435": [
+                    {"_": "0001-3714", "t": "PRINT"},
+                    {"_": "1807-8621", "t": "ONLIN"},
+                ],
+            }
+        ],
+    ),
+    (
+        "0002-1234",
+        [{"v400": [{"_": "0002-1234"}], "v068": [{"_": "bjb"}]}],
+    ),
+]
+ISSUES = [
+    (
+        "0001-371419980003",
+        [
+            {
+                "v035": [{"_": "0001-3714"}],
+                "v036": [{"_": "19983"}],
+                "v031": [{"_": "10"}],
+                "v032": [{"_": "2"}],
+            }
+        ],
+    ),
+    (
+        "0002-123420010001",
+        [
+            {
+                "v035": [{"_": "0002-1234"}],
+                "v036": [{"_": "20011"}],
+                "v031": [{"_": "61"}],
+                "v131": [{"_": "1"}],
+            }
+        ],
+    ),
+]
+
+
+def write_id_file(file_path, records):
+    with open(file_path, "w", encoding="iso-8859-1") as fp:
+        for i, record in enumerate(records, 1):
+            fp.write(f"!ID {str(i).zfill(7)}\n")
+            for tag, content in record:
+                fp.write(f"!v{tag}!{content}\n")
+
+
+class TestCatalog(TestCase):
+    def setUp(self):
+        self.catalog = Catalog(JOURNALS, ISSUES)
+
+    def test_get_journal_by_any_key(self):
+        for key in ("0001-3714", "1807-8621", "acta", "ACTA"):
+            with self.subTest(key=key):
+                self.assertEqual(
+                    "Acta Scientiarum", self.catalog.get_journal(key).title
+                )
+        self.assertIs(
+            self.catalog.get_journal("acta"), self.catalog.get_journal("1807-8621")
+        )
+
+    def test_get_journal_returns_none(self):
+        self.assertIsNone(self.catalog.get_journal("xxxx"))
+        self.assertIsNone(self.catalog.get_journal(None))
+
+    def test_get_issue(self):
+        issue = self.catalog.get_issue("0001-371419980003")
+        self.assertEqual("10", issue.volume)
+        self.assertIs(issue, self.catalog.get_issue("0001-371419980003"))
+        self.assertIsNone(self.catalog.get_issue("0001-371419980004"))
+
+    def test_get_issue_by_folder(self):
+        self.assertEqual(
+            "0001-371419980003", self.catalog.get_issue_pid("acta", "v10n2")
+        )
+        self.assertIs(
+            self.catalog.get_issue("0002-123420010001"),
+            self.catalog.get_issue_by_folder("bjb", "v61s1"),
+        )
+        self.assertIsNone(self.catalog.get_issue_by_folder("bjb", "v61n1"))
+
+    def test_get_issue_context(self):
+        issue_context = self.catalog.get_issue_context("0001-371419980003")
+        self.assertIs(self.catalog.get_journal("acta"), issue_context.journal)
+        self.assertIs(self.catalog.get_issue("0001-371419980003"), issue_context.issue)
+        self.assertIs(
+            issue_context, self.catalog.get_issue_context("0001-371419980003")
+        )
+        self.assertIsNone(self.catalog.get_issue_context("0001-371419980004"))
+
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "catalog.pickle")
+            self.catalog.get_issue_context("0001-371419980003")
+            self.catalog.write_snapshot(file_path, signature=[1, 2])
+
+            self.assertIsNone(Catalog.read_snapshot(file_path, signature=[1, 3]))
+            catalog = Catalog.read_snapshot(file_path, signature=[1, 2])
+        self.assertEqual(2, catalog.journals_total)
+        self.assertEqual(2, catalog.issues_total)
+        self.assertEqual("Acta Scientiarum", catalog.get_journal("1807-8621").title)
+        self.assertEqual("0002-123420010001", catalog.get_issue_pid("bjb", "v61s1"))
+
+    def test_read_snapshot_returns_none_if_file_does_not_exist(self):
+        self.assertIsNone(Catalog.read_snapshot("/tmp/no/catalog.pickle"))
+
+
+class TestClassicWebsiteGetCatalog(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = self.tmpdir.name
+        self.title_path = os.path.join(path, "title.id")
+        self.issue_path = os.path.join(path, "issue.id")
+        self.snapshot_path = os.path.join(path, "catalog.pickle")
+        write_id_file(
+            self.title_path,
+            [[("400", "0001-3714"), ("068", "acta"), ("100", "Acta")]],
+        )
+        write_id_file(
+            self.issue_path,
+            [[("035", "0001-3714"), ("036", "19983"), ("031", "10")]],
+        )
+        self.classic_website = ClassicWebsite(
+            bases_path=os.path.join(path, "bases"),
+            bases_work_path=os.path.join(path, "bases-work"),
+            bases_translation_path=os.path.join(path, "translation"),
+            bases_pdf_path=os.path.join(path, "pdf"),
+            bases_xml_path=os.path.join(path, "xml"),
+            htdocs_img_revistas_path=os.path.join(path, "img"),
+            serial_path=os.path.join(path, "serial"),
+            cisis_path=os.path.join(path, "cisis"),
+            title_path=self.title_path,
+            issue_path=self.issue_path,
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_get_catalog(self):
+        catalog = self.classic_website.get_catalog()
+        self.assertEqual("Acta", catalog.get_journal("acta").title)
+        self.assertEqual("0001-371419980003", catalog.get_issue_pid("acta", "v10"))
+
+    def test_get_catalog_reads_snapshot(self):
+        self.classic_website.get_catalog(self.snapshot_path)
+        inode = os.stat(self.snapshot_path).st_ino
+
+        catalog = self.classic_website.get_catalog(self.snapshot_path)
+        self.assertEqual(inode, os.stat(self.snapshot_path).st_ino)
+        self.assertEqual("Acta", catalog.get_journal("0001-3714").title)
+
+    def test_get_catalog_rebuilds_outdated_snapshot(self):
+        self.classic_website.get_catalog(self.snapshot_path)
+        write_id_file(
+            self.title_path,
+            [[("400", "0001-3714"), ("068", "acta"), ("100", "Acta Scientiarum")]],
+        )
+        catalog = self.classic_website.get_catalog(self.snapshot_path)
+        self.assertEqual("Acta Scientiarum", catalog.get_journal("acta").title)
@@ -0,0 +1,63 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from scielo_classic_website import exceptions
+from scielo_classic_website.isisdb.cisis_runner import CisisRunner
+
+
+def create_command(cisis_path, name, script):
+    command_path = os.path.join(cisis_path, name)
+    with open(command_path, "w") as fp:
+        fp.write("#!/bin/sh\n" + script)
+    os.chmod(command_path, 0o755)
+
+
+class TestCisisRunner(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cisis_path = self.tmpdir.name
+        create_command(self.cisis_path, "i2id", 'printf "!ID 0000001\\n!v030!$1\\n"\n')
+        create_command(self.cisis_path, "mx", 'echo "fatal: $1" >&2\nexit 3\n')
+        create_command(self.cisis_path, "ifkeys", "exec sleep 5\n")
+        self.runner = CisisRunner(self.cisis_path, max_workers=2)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_run_writes_stdout_file(self):
+        output = os.path.join(self.cisis_path, "output.id")
+        self.runner.run("i2id", ["Acta"], stdout_file_path=output)
+        with open(output) as fp:
+            self.assertEqual("!ID 0000001\n!v030!Acta\n", fp.read())
+
+    def test_run_raises_error_with_exit_code_and_stderr(self):
+        with self.assertRaises(exceptions.CisisCommandError) as exc:
+            self.runner.run("mx", ["artigo"])
+        self.assertIn("returned 3", str(exc.exception))
+        self.assertIn("fatal: artigo", str(exc.exception))
+
+    def test_run_raises_error_if_timeout_expires(self):
+        with self.assertRaises(exceptions.CisisCommandError):
+            self.runner.run("ifkeys", [], timeout=0.1)
+
+    def test_run_raises_error_if_command_does_not_exist(self):
+        with self.assertRaises(FileNotFoundError):
+            self.runner.run("wxis", [])
+
+    def test_stream(self):
+        result = list(self.runner.stream("i2id", ["Acta"]))
+        self.assertEqual(["!ID 0000001\n", "!v030!Acta\n"], result)
+
+    def test_stream_raises_error_if_timeout_expires(self):
+        with self.assertRaises(exceptions.CisisCommandError):
+            list(self.runner.stream("ifkeys", [], timeout=0.1))
+
+    def test_run_many(self):
+        commands = [("i2id", ["a"]), ("mx", ["b"]), ("i2id", ["c"])]
+        result = dict(
+            (item[1][0], result) for item, result in self.runner.run_many(commands)
+        )
+        self.assertEqual(b"!ID 0000001\n!v030!a\n", result["a"].stdout)
+        self.assertIsInstance(result["b"], exceptions.CisisCommandError)
+        self.assertEqual(b"!ID 0000001\n!v030!c\n", result["c"].stdout)
@@ -0,0 +1,145 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from scielo_classic_website import exceptions
+from scielo_classic_website.classic_ws import ClassicWebsite
+
+
+def write_id_file(file_path, records):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w", encoding="iso-8859-1") as fp:
+        for i, record in enumerate(records, 1):
+            fp.write(f"!ID {str(i).zfill(7)}\n")
+            for tag, content in record:
+                fp.write(f"!v{tag}!{content}\n")
+
+
+def write_issue_id_files(serial_path, acron, issue_folder, issue_pid, pids):
+    id_path = os.path.join(serial_path, acron, issue_folder, "base_xml", "id")
+    write_id_file(
+        os.path.join(id_path, "i.id"),
+        [
+            [
+                ("706", "i"),
+                ("035", issue_pid[:9]),
+                ("036", issue_pid[9:13] + str(int(issue_pid[13:]))),
+            ]
+        ],
+    )
+    for pid in pids:
+        write_id_file(
+            os.path.join(id_path, pid[-5:] + ".id"),
+            [
+                [("706", "o"), ("880", pid)],
+                [("706", "h"), ("880", pid), ("012", "Título^lpt")],
+            ],
+        )
+
+
+class TestClassicWebsiteBatch(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = self.tmpdir.name
+        self.serial_path = os.path.join(path, "serial")
+        self.classic_website = ClassicWebsite(
+            bases_path=os.path.join(path, "bases"),
+            bases_work_path=os.path.join(path, "bases-work"),
+            bases_translation_path=os.path.join(path, "translation"),
+            bases_pdf_path=os.path.join(path, "pdf"),
+            bases_xml_path=os.path.join(path, "xml"),
+            htdocs_img_revistas_path=os.path.join(path, "img"),
+            serial_path=self.serial_path,
+            cisis_path=os.path.join(path, "cisis"),
+            title_path=os.path.join(path, "title.id"),
+            issue_path=os.path.join(path, "issue.id"),
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_get_documents_pids_and_records_in_batch(self):
+        write_issue_id_files(
+            self.serial_path,
+            "aa",
+            "v49n3",
+            "0044-596720190003",
+            ["S0044-59672019000300242", "S0044-59672019000300250"],
+        )
+        write_issue_id_files(
+            self.serial_path,
+            "bjmbr",
+            "v53n1",
+            "0100-879X20200001",
+            ["S0100-879X2020000100601"],
+        )
+        issues = [
+            ("aa", "v49n3", "0044-596720190003"),
+            ("bjmbr", "v53n1", "0100-879X20200001"),
+            ("xyz", "v1n1", "0000-000020200001"),
+        ]
+        result = {}
+        errors = {}
+        for (
+            issue,
+            pids_and_records,
+            error,
+        ) in self.classic_website.get_documents_pids_and_records_in_batch(
+            issues, max_workers=2, max_in_flight=1
+        ):
+            if error:
+                errors[issue] = error
+            else:
+                result.update(pids_and_records)
+        self.assertEqual([issues[2]], list(errors))
+        self.assertIsInstance(errors[issues[2]], exceptions.IsisDBNotFoundError)
+        self.assertEqual(
+            [
+                "0044-596720190003",
+                "0100-879X20200001",
+                "S0044-59672019000300242",
+                "S0044-59672019000300250",
+                "S0100-879X2020000100601",
+            ],
+            sorted(result),
+        )
+        self.assertEqual(
+            [{"_": "Título", "l": "pt"}],
+            result["S0044-59672019000300242"][1]["v012"],
+        )
+
+    def test_get_documents_pids_and_records_in_batch_returns_failed_issue(self):
+        write_issue_id_files(
+            self.serial_path,
+            "aa",
+            "v49n3",
+            "0044-596720190003",
+            ["S0044-59672019000300242"],
+        )
+        # registro sem o campo v121, necessário para obter o pid
+        write_id_file(
+            os.path.join(self.serial_path, "bad", "v1n1", "base_xml", "id", "i.id"),
+            [[("706", "h"), ("880", "S9999-99992019000300001")]],
+        )
+        issues = [
+            ("bad", "v1n1", "0044-596720190003"),
+            ("aa", "v49n3", "0044-596720190003"),
+        ]
+        with self.assertLogs(level="ERROR"):
+            result = {
+                issue: (pids_and_records, error)
+                for issue, pids_and_records, error in (
+                    self.classic_website.get_documents_pids_and_records_in_batch(
+                        issues, max_workers=1
+                    )
+                )
+            }
+        pids_and_records, error = result[issues[0]]
+        self.assertIsNone(pids_and_records)
+        self.assertIsInstance(error, IndexError)
+        pids_and_records, error = result[issues[1]]
+        self.assertIsNone(error)
+        self.assertEqual(
+            ["0044-596720190003", "S0044-59672019000300242"],
+            sorted(pid for pid, records in pids_and_records),
+        )
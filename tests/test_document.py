@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from scielo_classic_website.models.issue_context import IssueContext
+
+PID = "S0001-37141998000300001"
+
+
+def get_article_records():
+    return [
+        {"v706": [{"_": "o"}], "v880": [{"_": PID}], "v702": [{"_": "a.htm"}]},
+        {
+            "v706": [{"_": "f"}],
+            "v880": [{"_": PID}],
+            "v702": [{"_": "a.htm"}],
+            "v010": [{"1": "aff1", "n": "Marta", "s": "WOLFF"}],
+            "v070": [{"i": "aff1", "_": "Universidade"}],
+        },
+    ]
+
+
+class TestDocumentAuthorsWithAff(TestCase):
+    def setUp(self):
+        self.document = IssueContext().get_document(get_article_records(), PID)
+
+    def test_authors_with_aff(self):
+        self.assertEqual(
+            [
+                {
+                    "xref": "aff1",
+                    "given_names": "Marta",
+                    "surname": "WOLFF",
+                    "affiliation": "Universidade",
+                }
+            ],
+            list(self.document.authors_with_aff),
+        )
+
+    def test_authors_with_aff_does_not_change_authors(self):
+        list(self.document.authors_with_aff)
+        self.assertEqual(
+            [{"xref": "aff1", "given_names": "Marta", "surname": "WOLFF"}],
+            self.document.authors,
+        )
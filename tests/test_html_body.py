@@ -0,0 +1,114 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from scielo_classic_website.htmlbody.html_body import (
+    AssetLinks,
+    BodyFromISIS,
+    HTMLContent,
+)
+from scielo_classic_website.isisdb.p_record import ParagraphRecord
+
+
+def get_p_record(index, text=None, reference_index=None):
+    record = {"v706": [{"_": "p"}], "v701": [{"_": str(index)}]}
+    if text:
+        record["v704"] = [{"_": text}]
+    if reference_index:
+        record["v888"] = [{"_": str(reference_index)}]
+    return ParagraphRecord(record)
+
+
+class TestBodyFromISIS(TestCase):
+    def test_parts(self):
+        p_records = [
+            get_p_record(1, '<p>Texto <img src="/img/revistas/aa/f1.jpg"/></p>'),
+            get_p_record(2),
+            get_p_record(3, "<p>Ref 1</p>", 1),
+            get_p_record(4, "<p>Ref 2</p>", 2),
+            get_p_record(5, '<p><a href="#top">Topo</a></p>'),
+        ]
+        result = BodyFromISIS(p_records).parts
+        self.assertEqual(
+            [
+                {
+                    "text": '<p>Texto <img src="/img/revistas/aa/f1.jpg"/></p>',
+                    "index": "1",
+                    "reference_index": None,
+                }
+            ],
+            result["before references"],
+        )
+        self.assertEqual(
+            ["<p>Ref 1</p>", "<p>Ref 2</p>"],
+            [item["text"] for item in result["references"]],
+        )
+        self.assertEqual(
+            ['<p><a href="#top">Topo</a></p>'],
+            [item["text"] for item in result["after references"]],
+        )
+
+
+class AssetFilesTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.issue_path = os.path.join(
+            os.path.realpath(self.tmpdir.name),
+            "htdocs",
+            "img",
+            "revistas",
+            "aa",
+            "v1n1",
+        )
+        os.makedirs(self.issue_path)
+        self.image_path = os.path.join(self.issue_path, "f1.jpg")
+        with open(self.image_path, "w") as fp:
+            fp.write("")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+
+class TestAssetLinks(AssetFilesTestCase):
+    def test_get_new_link_of_existing_file(self):
+        asset_links = AssetLinks()
+        self.assertEqual(
+            "/img/revistas/aa/v1n1/f1.jpg", asset_links.get_new_link(self.image_path)
+        )
+
+    def test_get_new_link_returns_none_if_file_does_not_exist(self):
+        asset_links = AssetLinks()
+        self.assertIsNone(
+            asset_links.get_new_link(os.path.join(self.issue_path, "f2.jpg"))
+        )
+        self.assertIsNone(asset_links.get_new_link("http://www.scielo.br/f1.jpg"))
+
+    def test_get_new_link_is_cached(self):
+        asset_links = AssetLinks()
+        asset_links.get_new_link(self.image_path)
+        os.unlink(self.image_path)
+        self.assertEqual(
+            "/img/revistas/aa/v1n1/f1.jpg", asset_links.get_new_link(self.image_path)
+        )
+
+    def test_get_new_link_uses_asset_files_without_checking_the_file_system(self):
+        path = os.path.join(self.issue_path, "f2.jpg")
+        asset_links = AssetLinks([{"path": path}])
+        self.assertEqual("/img/revistas/aa/v1n1/f2.jpg", asset_links.get_new_link(path))
+
+
+class TestHTMLContent(AssetFilesTestCase):
+    def test_old_and_new_links_and_replace_old_and_new_links(self):
+        html_content = HTMLContent(
+            f'<p><img src="{self.image_path}"/><a href="#top">top</a></p>'
+        )
+        self.assertEqual(
+            [{"old_link": self.image_path, "new_link": "/img/revistas/aa/v1n1/f1.jpg"}],
+            list(html_content.old_and_new_links),
+        )
+        html_content.replace_old_and_new_links()
+        self.assertEqual(
+            '<p><img src="/img/revistas/aa/v1n1/f1.jpg" '
+            f'data-old-link="{self.image_path}"><a href="#top">top</a></p>',
+            html_content.content,
+        )
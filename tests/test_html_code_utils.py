@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from scielo_classic_website.htmlbody import html_code_utils
+
+
+class TestRemoveControlCharacters(TestCase):
+    def test_remove_control_characters(self):
+        self.assertEqual(
+            "ab c", html_code_utils.remove_control_characters("a\x00b \tc")
+        )
+
+    def test_remove_control_characters_returns_printable_text(self):
+        text = "Título"
+        self.assertIs(text, html_code_utils.remove_control_characters(text))
+
+
+class TestHTMLDecode(TestCase):
+    def test_html_decode(self):
+        self.assertEqual(
+            "a < b é", html_code_utils.html_decode("a &lt; b &eacute;\x00")
+        )
+
+    def test_html_decode_without_entities(self):
+        self.assertEqual("a b", html_code_utils.html_decode("a\x00 b"))
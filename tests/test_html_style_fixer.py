@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from lxml import etree as ET
+
+from scielo_classic_website.htmlbody import html_style_fixer
+
+TEXTS = [
+    '<p>1. Silva <B>A</B>. <i>Title</i> <em class="x">Journal</em></p>',
+    "<p><STRONG>2.</STRONG> <u>v. 1</u><sup>2</sup><SUB>3</SUB></p>",
+    '<p><u class="a">u</U> <Em>mixed</Em> <bold>b</bold> <i\n>i</i></p>',
+    "<p>< b>sem tags de estilo & texto</p>",
+    "",
+]
+
+
+def fix_styles_by_steps(html_str):
+    for old, new in html_style_fixer.STYLES:
+        html_str = html_str.replace(old, new)
+        html_str = html_str.replace(old.upper(), new)
+    return html_str
+
+
+class TestFixStyles(TestCase):
+    def test_fix_styles_returns_the_same_as_by_steps(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    fix_styles_by_steps(text), html_style_fixer.fix_styles(text)
+                )
+
+
+class TestGetMixedCitationNode(TestCase):
+    def test_get_mixed_citation_node(self):
+        node = html_style_fixer.get_mixed_citation_node(TEXTS[0])
+        self.assertEqual(
+            '<mixed-citation>1. Silva <span name="style_bold">A</span>. '
+            '<span name="style_italic">Title</span> '
+            '<span name="style_bold" class="x">Journal</span></mixed-citation>',
+            ET.tostring(node, encoding="unicode"),
+        )
+
+    def test_get_mixed_citation_node_returns_new_nodes(self):
+        first = html_style_fixer.get_mixed_citation_node(TEXTS[0])
+        second = html_style_fixer.get_mixed_citation_node(TEXTS[1])
+        self.assertIn("Title", ET.tostring(first, encoding="unicode"))
+        self.assertIn("style_sup", ET.tostring(second, encoding="unicode"))
+
+    def test_get_mixed_citation_node_of_blank_text(self):
+        self.assertIsNone(html_style_fixer.get_mixed_citation_node("  "))
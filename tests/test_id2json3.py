@@ -1,8 +1,52 @@
+import glob
+import pickle
+import random
 from unittest import TestCase
 
 from scielo_classic_website.iid2json import id2json3
 
 
+def legacy_parse_field_content(content):
+    # implementação original de `_parse_field_content`,
+    # mantida como referência para os testes de paridade
+    if not content:
+        return
+    if "^" not in content:
+        return {"_": content}
+    if not content.startswith("^"):
+        content = "^_" + content
+    content = content.replace("\\^", "ESCAPECIRC")
+    subfields = content.split("^")
+    items = []
+    for subf in subfields:
+        if not subf:
+            continue
+        s = subf[0]
+        if s in "_abcdefghijklmnopqrstuvwxyz123456789":
+            items.append([s, subf[1:]])
+        else:
+            items.append(["", "\\^" + s + subf[1:]])
+
+    for i, item in enumerate(items):
+        s, v = item
+        if s == "":
+            items[i - 1][1] += v
+            items[i][1] = ""
+
+    d = {}
+    for s, v in items:
+        if s and v:
+            d[s] = v
+    return d
+
+
+def legacy_parse_field(data):
+    second_excl_char_pos = data[1:].find("!") + 1
+    tag = data[1:second_excl_char_pos]
+    subfields = legacy_parse_field_content(data[second_excl_char_pos + 1 :])
+    return (tag, subfields)
+
+
 class TestIsisIdToJson3(TestCase):
     def test_build_record(self):
         expected = {
@@ -114,3 +158,171 @@ class TestIsisIdToJson3(TestCase):
             # executa apenas 1 vez, porque só há 1 registro
             self.assertEqual(expected_id, _id)
             self.assertEqual(expected_records, records)
+
+    def test_get_records_fields_returns_record_when_next_record_starts(self):
+        def rows():
+            yield "!ID 0000001"
+            yield "!v030!Acta Amaz."
+            yield "!v031!49\n"
+            yield "!ID 0000002"
+            raise AssertionError("must not read beyond the second record")
+
+        result = next(id2json3.get_records_fields(rows()))
+        self.assertEqual([("v030", {"_": "Acta Amaz."}), ("v031", {"_": "49"})], result)
+
+    def test_pids_and_their_records(self):
+        result = list(
+            id2json3.pids_and_their_records("tests/fixtures/record.id", "issue")
+        )
+        self.assertEqual(1, len(result))
+        self.assertEqual("0044-596720190003", result[0][0])
+        self.assertEqual([{"_": "Acta Amaz."}], result[0][1][0]["v030"])
+
+
+class TestParseFieldContentParity(TestCase):
+    EDGE_CASES = [
+        "",
+        "^",
+        "^^",
+        "bla",
+        "bla^",
+        "^abla",
+        "^a",
+        "^a^b",
+        "^aX^aY",
+        "^a^aY",
+        "^aX^a",
+        "bla^ssurname^nname^oxxx",
+        "^Xfoo",
+        "^Xfoo^abar",
+        "^abar^Xfoo",
+        "^abar^Xfoo^Ybaz^cqux",
+        "^abar^X",
+        "a\\^b^cd",
+        "a\\^b^c\\^d",
+        "\\^",
+        "^0zero^Aupper^ ^é",
+        "Título^lpt",
+        "   ^a  ^b  ",
+    ]
+
+    def assert_same_result(self, content):
+        self.assertEqual(
+            legacy_parse_field_content(content),
+            id2json3._parse_field_content(content),
+            repr(content),
+        )
+        # a ordem das chaves também é mantida
+        self.assertEqual(
+            list((legacy_parse_field_content(content) or {}).items()),
+            list((id2json3._parse_field_content(content) or {}).items()),
+            repr(content),
+        )
+
+    def test_edge_cases(self):
+        for content in self.EDGE_CASES:
+            with self.subTest(content=content):
+                self.assert_same_result(content)
+
+    def test_fixtures(self):
+        for file_path in glob.glob("tests/fixtures/*.id"):
+            for row in id2json3.get_id_file_rows(file_path):
+                if not row or row.startswith("!ID "):
+                    continue
+                with self.subTest(row=row):
+                    self.assertEqual(
+                        legacy_parse_field(row), id2json3._parse_field(row)
+                    )
+
+    def test_parse_field_without_content_separator(self):
+        for row in ("!v010", "!", "!!", "!v010!"):
+            with self.subTest(row=row):
+                self.assertEqual(legacy_parse_field(row), id2json3._parse_field(row))
+
+    def test_random_contents(self):
+        rnd = random.Random(2019)
+        alphabet = "^^^\\ab_1zAZ0! é"
+        for i in range(5000):
+            content = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12)))
+            self.assert_same_result(content)
+
+
+class TestBuildRecordTags(TestCase):
+    def test_build_record_shares_tag_keys_between_records(self):
+        first = id2json3._build_record([id2json3._parse_field("!v" + "030!Acta")])
+        second = id2json3._build_record([id2json3._parse_field("!v" + "030!Rev")])
+        self.assertIs(list(first)[0], list(second)[0])
+
+
+class TestCompactRecord(TestCase):
+    def get_records(self, rows):
+        return [
+            id2json3._build_compact_record(fields)
+            for fields in id2json3.get_records_fields(rows, id2json3._split_field)
+        ]
+
+    def get_dict_records(self, rows):
+        return [
+            id2json3._build_record(fields)
+            for fields in id2json3.get_records_fields(rows)
+        ]
+
+    def test_compact_record_has_the_same_content_as_build_record(self):
+        for file_path in glob.glob("tests/fixtures/*.id"):
+            rows = list(id2json3.get_id_file_rows(file_path))
+            expected = self.get_dict_records(rows)
+            result = self.get_records(rows)
+            with self.subTest(file_path=file_path):
+                self.assertEqual(len(expected), len(result))
+                for expected_record, record in zip(expected, result):
+                    self.assertEqual(expected_record, record)
+                    # a ordem das tags também é mantida
+                    self.assertEqual(list(expected_record), list(record))
+
+    def test_compact_record_skips_fields_without_subfields(self):
+        rows = ["!ID 0000001", "!v010!^a", "!v012!", "!v030!Acta", "!v010!^sSilva"]
+        self.assertEqual(self.get_dict_records(rows), self.get_records(rows))
+        self.assertEqual(
+            {"v030": [{"_": "Acta"}], "v010": [{"s": "Silva"}]},
+            dict(self.get_records(rows)[0]),
+        )
+
+    def test_has_subfields(self):
+        rnd = random.Random(2019)
+        alphabet = "^^^\\ab_1zAZ0! é"
+        contents = TestParseFieldContentParity.EDGE_CASES + [
+            "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12)))
+            for i in range(5000)
+        ]
+        for content in contents:
+            self.assertEqual(
+                bool(id2json3._parse_field_content(content)),
+                id2json3._has_subfields(content),
+                repr(content),
+            )
+
+    def test_records_with_the_same_fields_share_the_layout(self):
+        first, second = self.get_records(
+            ["!ID 1", "!v030!Acta", "!v031!49", "!ID 2", "!v030!Rev", "!v031!50"]
+        )
+        self.assertIs(first._layout, second._layout)
+        self.assertEqual([{"_": "Rev"}], second["v030"])
+
+    def test_changing_the_returned_list_does_not_change_the_record(self):
+        record = self.get_records(["!ID 1", "!v030!Acta"])[0]
+        record["v030"][0]["_"] = "Rev"
+        record["v030"].append({"_": "Rev"})
+        self.assertEqual([{"_": "Acta"}], record["v030"])
+
+    def test_compact_record_missing_tag(self):
+        record = self.get_records(["!ID 1", "!v030!Acta"])[0]
+        self.assertNotIn("v031", record)
+        self.assertIsNone(record.get("v031"))
+        with self.assertRaises(KeyError):
+            record["v031"]
+
+    def test_compact_record_can_be_pickled(self):
+        record = self.get_records(["!ID 1", "!v010!^sSilva^nJ", "!v030!Acta"])[0]
+        result = pickle.loads(pickle.dumps(record))
+        self.assertEqual(record, result)
+        self.assertIs(record._layout, result._layout)
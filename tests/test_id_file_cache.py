@@ -0,0 +1,125 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from tests.builders import RECORDS, write_isis_db
+
+from scielo_classic_website.classic_ws import ClassicWebsite
+from scielo_classic_website.isisdb.id_file_cache import IdFileCache
+
+
+class TestIdFileCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmpdir.name, "cache")
+        self.db_file_path = os.path.join(self.tmpdir.name, "artigo")
+        write_isis_db(self.db_file_path, RECORDS)
+        self.created = []
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def create_id_file(self, db_file_path, id_file_path):
+        self.created.append(db_file_path)
+        with open(id_file_path, "w") as fp:
+            fp.write("!ID 0000001\n!v706!h\n")
+
+    def test_get_id_file_path_creates_id_file_once(self):
+        cache = IdFileCache(self.cache_path)
+        first = cache.get_id_file_path(self.db_file_path, self.create_id_file)
+        second = cache.get_id_file_path(self.db_file_path, self.create_id_file)
+        self.assertEqual(first, second)
+        self.assertEqual([self.db_file_path], self.created)
+        with open(first) as fp:
+            self.assertEqual("!ID 0000001\n!v706!h\n", fp.read())
+
+    def test_get_id_file_path_recreates_id_file_if_database_changes(self):
+        cache = IdFileCache(self.cache_path)
+        first = cache.get_id_file_path(self.db_file_path, self.create_id_file)
+        write_isis_db(self.db_file_path, RECORDS[:1])
+        second = cache.get_id_file_path(self.db_file_path, self.create_id_file)
+        self.assertNotEqual(first, second)
+        self.assertEqual(2, len(self.created))
+        # a versão anterior é removida
+        self.assertFalse(os.path.isfile(first))
+
+    def test_get_id_file_path_keeps_nothing_if_creation_fails(self):
+        def create_id_file(db_file_path, id_file_path):
+            raise OSError("i2id failed")
+
+        cache = IdFileCache(self.cache_path)
+        with self.assertRaises(OSError):
+            cache.get_id_file_path(self.db_file_path, create_id_file)
+        self.assertEqual([], os.listdir(self.cache_path))
+
+    def test_evict_removes_least_recently_used(self):
+        other_db_file_path = os.path.join(self.tmpdir.name, "title")
+        write_isis_db(other_db_file_path, RECORDS)
+
+        cache = IdFileCache(self.cache_path)
+        first = cache.get_id_file_path(self.db_file_path, self.create_id_file)
+        os.utime(first, (0, 0))
+        cache.max_bytes = os.path.getsize(first)
+        second = cache.get_id_file_path(other_db_file_path, self.create_id_file)
+
+        self.assertFalse(os.path.isfile(first))
+        self.assertTrue(os.path.isfile(second))
+
+    def test_invalidate(self):
+        cache = IdFileCache(self.cache_path)
+        id_file_path = cache.get_id_file_path(self.db_file_path, self.create_id_file)
+        cache.invalidate(self.db_file_path)
+        self.assertFalse(os.path.isfile(id_file_path))
+
+        cache.get_id_file_path(self.db_file_path, self.create_id_file)
+        self.assertEqual(2, len(self.created))
+
+
+class TestClassicWebsiteUsesIdFileCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = self.tmpdir.name
+        cisis_path = os.path.join(path, "cisis")
+        os.makedirs(cisis_path)
+        self.calls_file_path = os.path.join(path, "calls")
+        # i2id registra cada execução
+        i2id = os.path.join(cisis_path, "i2id")
+        with open(i2id, "w") as fp:
+            fp.write(
+                "#!/bin/sh\n"
+                f'echo "$1" >> {self.calls_file_path}\n'
+                'printf "!ID 0000001\\n!v400!0001-3714\\n!v068!acta\\n"\n'
+            )
+        os.chmod(i2id, 0o755)
+
+        # base ISIS em formato não reconhecido pela leitura nativa
+        title_path = os.path.join(path, "title")
+        for ext in (".mst", ".xrf"):
+            with open(title_path + ext, "wb") as fp:
+                fp.write(b"x" * 512)
+
+        self.classic_website = ClassicWebsite(
+            bases_path=os.path.join(path, "bases"),
+            bases_work_path=os.path.join(path, "bases-work"),
+            bases_translation_path=os.path.join(path, "translation"),
+            bases_pdf_path=os.path.join(path, "pdf"),
+            bases_xml_path=os.path.join(path, "xml"),
+            htdocs_img_revistas_path=os.path.join(path, "img"),
+            serial_path=os.path.join(path, "serial"),
+            cisis_path=cisis_path,
+            title_path=title_path,
+            issue_path=os.path.join(path, "issue"),
+        )
+        self.classic_website.isis_commander.id_file_cache = IdFileCache(
+            os.path.join(path, "cache")
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_i2id_fallback_reuses_cached_id_file(self):
+        for i in range(2):
+            result = list(self.classic_website.get_journals_pids_and_records())
+            self.assertEqual(["0001-3714"], [_id for _id, records in result])
+        with open(self.calls_file_path) as fp:
+            self.assertEqual(1, len(fp.readlines()))
@@ -0,0 +1,244 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from tests.builders import write_isis_db
+
+from scielo_classic_website import config, exceptions
+from scielo_classic_website.incremental_migration import (
+    HighWaterMark,
+    IncrementalMigration,
+)
+
+DOCUMENT_PIDS = [
+    {"updated": "20210915", "pid": "S2352-22912021005005225"},
+    {"updated": "20210917", "pid": "S2675-54752021000300400"},
+    {"updated": "20210916", "pid": "S2352-22912021005005226"},
+    {"updated": "20210917", "pid": "S2352-22912021005005225"},
+]
+
+
+class TestIncrementalMigration(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.high_water_mark = HighWaterMark(
+            os.path.join(self.tmpdir.name, "high_water_mark.json")
+        )
+        self.queries = []
+        self.migrated = []
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def get_document_pids(self, from_date, to_date):
+        self.queries.append((from_date, to_date))
+        from_date = from_date or "0" * 8
+        to_date = to_date or "9" * 8
+        return [
+            item for item in DOCUMENT_PIDS if from_date <= item["updated"] <= to_date
+        ]
+
+    def migrate_document(self, pid):
+        if pid == "S2352-22912021005005226":
+            raise ValueError("invalid record")
+        self.migrated.append(pid)
+        return "<article/>"
+
+    def get_migration(self, migrate_document=None):
+        return IncrementalMigration(
+            "scl",
+            self.high_water_mark,
+            get_document_pids=self.get_document_pids,
+            migrate_document=migrate_document or self.migrated.append,
+        )
+
+    def test_get_changed_documents_keeps_last_update_of_each_pid(self):
+        result = self.get_migration().get_changed_documents()
+        self.assertEqual(
+            [
+                {"updated": "20210916", "pid": "S2352-22912021005005226"},
+                {"updated": "20210917", "pid": "S2352-22912021005005225"},
+                {"updated": "20210917", "pid": "S2675-54752021000300400"},
+            ],
+            result,
+        )
+
+    def test_run_starts_from_high_water_mark(self):
+        list(self.get_migration().run())
+        self.assertEqual("20210917", self.high_water_mark.get("scl"))
+        self.assertEqual([(None, None)], self.queries)
+
+        self.migrated = []
+        list(self.get_migration().run())
+        self.assertEqual(("20210917", None), self.queries[-1])
+        self.assertEqual(
+            ["S2675-54752021000300400", "S2352-22912021005005225"], self.migrated
+        )
+
+    def test_run_advances_beyond_failed_document_and_keeps_its_pid(self):
+        result = dict(self.get_migration(self.migrate_document).run())
+        self.assertIsInstance(result["S2352-22912021005005226"], ValueError)
+        self.assertEqual("<article/>", result["S2675-54752021000300400"])
+        self.assertEqual("20210917", self.high_water_mark.get("scl"))
+        self.assertEqual(
+            ["S2352-22912021005005226"], self.high_water_mark.get_failed_pids("scl")
+        )
+
+    def test_run_retries_failed_documents(self):
+        list(self.get_migration(self.migrate_document).run())
+
+        self.migrated = []
+        result = list(self.get_migration(self.migrate_document).run())
+        self.assertEqual("S2352-22912021005005226", result[0][0])
+        self.assertIsInstance(result[0][1], ValueError)
+        self.assertEqual(
+            ["S2352-22912021005005226"], self.high_water_mark.get_failed_pids("scl")
+        )
+
+        self.migrated = []
+        list(self.get_migration().run())
+        self.assertEqual("S2352-22912021005005226", self.migrated[0])
+        self.assertEqual([], self.high_water_mark.get_failed_pids("scl"))
+        self.assertEqual("20210917", self.high_water_mark.get("scl"))
+
+    def test_run_interrupted_keeps_failed_documents_not_retried(self):
+        self.high_water_mark.set(
+            "scl", "20210917", ["S2352-22912021005005226", "S2352-22912021005005227"]
+        )
+        items = self.get_migration().run()
+        next(items)
+        items.close()
+        self.assertEqual(
+            ["S2352-22912021005005227"], self.high_water_mark.get_failed_pids("scl")
+        )
+        self.assertEqual("20210917", self.high_water_mark.get("scl"))
+
+    def test_high_water_mark_reads_date_only_format(self):
+        with open(self.high_water_mark.file_path, "w") as fp:
+            fp.write('{"scl": "20210916"}')
+        self.assertEqual("20210916", self.high_water_mark.get("scl"))
+        self.assertEqual([], self.high_water_mark.get_failed_pids("scl"))
+
+    def test_run_interrupted_keeps_first_pending_date(self):
+        self.high_water_mark.set("arg", "20200101")
+        items = self.get_migration().run()
+        next(items)
+        items.close()
+        self.assertEqual("20210917", self.high_water_mark.get("scl"))
+        self.assertEqual("20200101", self.high_water_mark.get("arg"))
+
+
+PID = "S0044-59672019000300242"
+
+
+def get_article_fields(rec_type):
+    return [
+        (706, rec_type),
+        (880, PID),
+        (702, "aa/v49n3/a01.htm"),
+        (12, "Título^lpt"),
+        (40, "pt"),
+        (10, "^nMarta^sWOLFF"),
+        (65, "20190900"),
+        (14, "^f242^l250"),
+    ]
+
+
+class TestIncrementalMigrationMigrateDocument(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        bases_path = os.path.join(self.tmpdir.name, "bases")
+        self.config = (
+            config.CLASSIC_WEBSITE_BASES_PATH,
+            config.CLASSIC_WEBSITE_BASES_PDF_PATH,
+        )
+        config.CLASSIC_WEBSITE_BASES_PATH = bases_path
+        config.CLASSIC_WEBSITE_BASES_PDF_PATH = os.path.join(bases_path, "pdf")
+
+        for name, records in (
+            (
+                "artigo",
+                [
+                    [(706, "o"), (880, PID), (702, "aa/v49n3/a01.htm")],
+                    get_article_fields("h"),
+                    get_article_fields("f"),
+                ],
+            ),
+            (
+                "title",
+                [
+                    [
+                        (400, "0044-5967"),
+                        (68, "aa"),
+                        (100, "Acta Amazonica"),
+                        (150, "Acta Amaz."),
+                        (435, "0044-5967^tPRINT"),
+                        (480, "INPA"),
+                        (490, "Manaus"),
+                        (320, "AM"),
+                        (310, "BR"),
+                    ]
+                ],
+            ),
+            (
+                "issue",
+                [
+                    [
+                        (35, "0044-5967"),
+                        (36, "20193"),
+                        (31, "49"),
+                        (32, "3"),
+                        (65, "20190900"),
+                    ]
+                ],
+            ),
+        ):
+            os.makedirs(os.path.join(bases_path, name))
+            write_isis_db(os.path.join(bases_path, name, name), records)
+
+        p_id_file_path = config.get_paragraphs_id_file_path(PID)
+        os.makedirs(os.path.dirname(p_id_file_path))
+        with open(p_id_file_path, "w", encoding="iso-8859-1") as fp:
+            fp.write(
+                f"!ID 0000001\n!v706!p\n!v880!{PID}\n!v701!1\n"
+                "!v704!<p>Texto</p>\n"
+                f"!ID 0000002\n!v706!p\n!v880!{PID}\n!v701!2\n!v888!1\n"
+                "!v704!<p>1. Silva A. Título. 2001.</p>\n"
+            )
+
+        self.migration = IncrementalMigration(
+            "scl",
+            HighWaterMark(os.path.join(self.tmpdir.name, "high_water_mark.json")),
+            get_document_pids=lambda from_date, to_date: [
+                {"updated": "20210915", "pid": PID},
+                {"updated": "20210916", "pid": "S0044-59672019000400242"},
+            ],
+        )
+
+    def tearDown(self):
+        (
+            config.CLASSIC_WEBSITE_BASES_PATH,
+            config.CLASSIC_WEBSITE_BASES_PDF_PATH,
+        ) = self.config
+        self.tmpdir.cleanup()
+
+    def test_migrate_document(self):
+        xml = self.migration.migrate_document(PID).decode("utf-8")
+        self.assertIn('<journal-id journal-id-type="publisher-id">aa</journal-id>', xml)
+        self.assertIn(f'specific-use="scielo-v2">{PID}</article-id>', xml)
+
+    def test_get_paragraphs_records(self):
+        records = self.migration.get_paragraphs_records(PID)
+        self.assertEqual(["1", "2"], [record["v701"][0]["_"] for record in records])
+
+    def test_migrate_document_raises_error_if_issue_does_not_exist(self):
+        with self.assertRaises(exceptions.IssueNotFoundError):
+            self.migration.migrate_document("S0044-59672019000400242")
+
+    def test_run_advances_high_water_mark(self):
+        result = dict(self.migration.run())
+        self.assertIsInstance(result[PID], bytes)
+        self.assertIsInstance(
+            result["S0044-59672019000400242"], exceptions.IssueNotFoundError
+        )
+        self.assertEqual("20210916", self.migration.high_water_mark.get("scl"))
@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from scielo_classic_website.models.issue_context import IssueContext
+
+ISSUE_RECORD = {
+    "v035": [{"_": "0001-3714"}],
+    "v036": [{"_": "19983"}],
+    "v049": [
+        {"l": "pt", "t": "Artigos", "c": "ABC010"},
+        {"l": "en", "t": "Articles", "c": "ABC010"},
+        {"l": "pt", "t": "Resenhas", "c": "ABC020"},
+    ],
+}
+JOURNAL_RECORD = {"v100": [{"_": "Acta"}], "v930": [{"_": "ACTA"}]}
+
+
+def get_article_records(pid, section_code):
+    return [
+        {
+            "v706": [{"_": "o"}],
+            "v880": [{"_": pid}],
+            "v702": [{"_": f"acta/v1n3/a{pid}.htm"}],
+        },
+        {
+            "v706": [{"_": "f"}],
+            "v880": [{"_": pid}],
+            "v702": [{"_": f"acta/v1n3/a{pid}.htm"}],
+            "v049": [{"_": section_code}],
+        },
+    ]
+
+
+class TestIssueContext(TestCase):
+    def setUp(self):
+        self.issue_context = IssueContext(ISSUE_RECORD, JOURNAL_RECORD)
+
+    def test_documents_share_journal_and_issue(self):
+        documents = [
+            document
+            for pid, document in self.issue_context.get_documents(
+                [
+                    ("S0001-37141998000300001", get_article_records("1", "ABC010")),
+                    ("S0001-37141998000300002", get_article_records("2", "ABC020")),
+                ]
+            )
+        ]
+        self.assertIs(self.issue_context.journal, documents[0].journal)
+        self.assertIs(self.issue_context.journal, documents[1].journal)
+        self.assertIs(self.issue_context.issue, documents[0].issue)
+        self.assertIs(self.issue_context.issue, documents[1].issue)
+
+    def test_get_section(self):
+        document = self.issue_context.get_document(get_article_records("1", "ABC010"))
+        self.assertEqual("Artigos", document.get_section("pt"))
+        self.assertEqual("Articles", document.get_section("en"))
+        self.assertIsNone(document.get_section("es"))
+
+    def test_get_sections_by_language_is_created_once(self):
+        issue = self.issue_context.issue
+        self.assertEqual(
+            {"pt": {"language": "pt", "text": "Resenhas", "code": "ABC020"}},
+            issue.get_sections_by_language("ABC020"),
+        )
+        self.assertIs(
+            issue.get_sections_by_language("ABC010"),
+            issue.get_sections_by_language("ABC010"),
+        )
+        self.assertEqual({}, issue.get_sections_by_language("XYZ"))
+
+    def test_issue_context_without_records(self):
+        issue_context = IssueContext()
+        document = issue_context.get_document(get_article_records("1", "ABC010"))
+        self.assertIsNone(document.journal)
+        self.assertIsNone(document.issue)
@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+
+from scielo_classic_website.models.issue_files import IssueFiles
+
+
+def create_file(file_path, content=""):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w", encoding="iso-8859-1") as fp:
+        fp.write(content)
+
+
+class TestIssueFiles(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = os.path.realpath(self.tmpdir.name)
+        self.paths = SimpleNamespace(
+            bases_xml_path=os.path.join(root, "bases", "xml"),
+            bases_translation_path=os.path.join(root, "bases", "translation"),
+            bases_pdf_path=os.path.join(root, "bases", "pdf"),
+            htdocs_img_revistas_path=os.path.join(root, "htdocs", "img", "revistas"),
+        )
+        issue = os.path.join("aa", "v1n1")
+        self.image_path = os.path.join(
+            self.paths.htdocs_img_revistas_path, issue, "f1.jpg"
+        )
+        create_file(self.image_path)
+        create_file(
+            os.path.join(self.paths.htdocs_img_revistas_path, issue, "a01", "f2.jpg")
+        )
+        create_file(os.path.join(self.paths.bases_xml_path, issue, "a01.xml"))
+        create_file(os.path.join(self.paths.bases_xml_path, issue, "a01.txt"))
+        create_file(os.path.join(self.paths.bases_xml_path, issue, ".a02.xml"))
+        create_file(os.path.join(self.paths.bases_pdf_path, issue, "a01.pdf"))
+        create_file(os.path.join(self.paths.bases_pdf_path, issue, "en_a01.pdf"))
+        create_file(
+            os.path.join(self.paths.bases_translation_path, issue, "en_a01.htm"),
+            f'<html><body><p><img src="{self.image_path}"/></p></body></html>',
+        )
+        create_file(
+            os.path.join(self.paths.bases_translation_path, issue, "en_ba01.htm"),
+            "<html><body><p>After</p></body></html>",
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _get_names(self, issue_files):
+        return sorted((item["type"], item["name"]) for item in issue_files.files)
+
+    def test_files(self):
+        issue_files = IssueFiles("aa", "v1n1", self.paths)
+        self.assertEqual(
+            [
+                ("asset", "f1.jpg"),
+                ("asset", "f2.jpg"),
+                ("html", "en_a01.htm"),
+                ("html", "en_ba01.htm"),
+                ("pdf", "a01.pdf"),
+                ("pdf", "en_a01.pdf"),
+                ("xml", "a01.xml"),
+            ],
+            self._get_names(issue_files),
+        )
+
+    def test_files_with_max_workers_returns_the_same_files(self):
+        self.assertEqual(
+            self._get_names(IssueFiles("aa", "v1n1", self.paths)),
+            self._get_names(IssueFiles("aa", "v1n1", self.paths, max_workers=4)),
+        )
+
+    def test_bases_translation_files_replacements_are_obtained_on_access(self):
+        issue_files = IssueFiles("aa", "v1n1", self.paths)
+        items = {item["name"]: item for item in issue_files.bases_translation_files}
+        self.assertIn("replacements", items["en_a01.htm"])
+        self.assertIsNone(issue_files._asset_links)
+        self.assertEqual(
+            {self.image_path: "/img/revistas/aa/v1n1/f1.jpg"},
+            items["en_a01.htm"]["replacements"],
+        )
+        self.assertIs(
+            items["en_a01.htm"]["replacements"], items["en_a01.htm"].replacements
+        )
+        self.assertEqual({}, items["en_ba01.htm"].get("replacements"))
+        self.assertEqual("before", items["en_a01.htm"]["part"])
+        self.assertEqual("after", items["en_ba01.htm"]["part"])
+
+    def test_bases_translation_files_items_have_replacements_key(self):
+        issue_files = IssueFiles("aa", "v1n1", self.paths)
+        item = dict(issue_files.bases_translation_files[0])
+        self.assertEqual(
+            ["type", "key", "path", "name", "relative_path", "lang", "part"]
+            + ["replacements"],
+            list(item),
+        )
+        self.assertEqual(item, json.loads(json.dumps(item)))
@@ -0,0 +1,179 @@
+import os
+import struct
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+from tests.builders import RECORDS, write_isis_db
+
+from scielo_classic_website import exceptions
+from scielo_classic_website.isisdb import isis_cmd, master_file
+from scielo_classic_website.isisdb.pid_index import PidIndex
+
+
+class TestMasterFile(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_file_path = os.path.join(self.tmpdir.name, "artigo")
+        write_isis_db(self.db_file_path, RECORDS)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_get_record(self):
+        expected = {
+            "v706": [{"_": "h"}],
+            "v880": [{"_": "S0044-59672019000300242"}],
+            "v010": [
+                {
+                    "1": "aff1 aff2",
+                    "k": "0000-0002-3193-6659",
+                    "n": "Yardany",
+                    "r": "ND",
+                    "s": "RAMOS-PASTRANA",
+                },
+                {"1": "aff2", "n": "Marta", "r": "ND", "s": "WOLFF"},
+            ],
+            "v012": [{"_": "Título", "l": "pt"}],
+        }
+        with master_file.MasterFile(self.db_file_path) as mf:
+            result = mf.get_record(1)
+        self.assertEqual(expected, result)
+
+    def test_get_record_returns_none_for_deleted_record(self):
+        with master_file.MasterFile(self.db_file_path) as mf:
+            self.assertIsNone(mf.get_record(2))
+            self.assertIsNone(mf.get_record(99))
+
+    def test_records_strips_trailing_spaces(self):
+        with master_file.MasterFile(self.db_file_path) as mf:
+            records = list(mf.records())
+        self.assertEqual(3, len(records))
+        self.assertEqual([{"_": "Acta Amaz."}], records[1]["v030"])
+
+    def test_records_with_aligned_leader(self):
+        write_isis_db(self.db_file_path, RECORDS, leader_format="<ihxxiHHHH")
+        with master_file.MasterFile(self.db_file_path) as mf:
+            result = mf.get_record(4)
+        self.assertEqual({"_": "S0044-59672019000300250"}, result["v880"][0])
+
+    def test_pids_and_their_records(self):
+        result = list(master_file.pids_and_their_records(self.db_file_path, "artigo"))
+        self.assertEqual(
+            ["S0044-59672019000300242", "S0044-59672019000300250"],
+            [_id for _id, records in result],
+        )
+        self.assertEqual(2, len(result[0][1]))
+
+    def test_invalid_master_file_raises_master_file_error(self):
+        with open(self.db_file_path + ".mst", "wb") as fp:
+            fp.write(b"x" * 64)
+        with self.assertRaises(exceptions.MasterFileError):
+            master_file.pids_and_their_records(self.db_file_path, "artigo")
+
+    def test_corrupted_record_raises_master_file_error_before_iteration(self):
+        with open(self.db_file_path + ".mst", "r+b") as fp:
+            content = fp.read()
+            # MFN do último registro
+            position = content.rindex(struct.pack("<i", 4))
+            fp.seek(position)
+            fp.write(struct.pack("<i", 9))
+        with self.assertRaises(exceptions.MasterFileError):
+            master_file.pids_and_their_records(self.db_file_path, "artigo")
+
+    def test_truncated_master_file_raises_master_file_error_before_iteration(self):
+        with open(self.db_file_path + ".mst", "r+b") as fp:
+            fp.truncate(os.path.getsize(self.db_file_path + ".mst") - 10)
+        with self.assertRaises(exceptions.MasterFileError):
+            master_file.pids_and_their_records(self.db_file_path, "artigo")
+
+
+class TestPidIndex(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_file_path = os.path.join(self.tmpdir.name, "artigo")
+        write_isis_db(self.db_file_path, RECORDS)
+        self.master_file = master_file.MasterFile(self.db_file_path)
+
+    def tearDown(self):
+        self.master_file.close()
+        self.tmpdir.cleanup()
+
+    def test_get_mfn_ranges(self):
+        pid_index = PidIndex(self.master_file)
+        self.assertEqual([[1, 3]], pid_index.get_mfn_ranges("S0044-59672019000300242"))
+        self.assertEqual([], pid_index.get_mfn_ranges("S0044-59672019000300999"))
+
+    def test_get_records(self):
+        pid_index = PidIndex(self.master_file)
+        records = pid_index.get_records("S0044-59672019000300250")
+        self.assertEqual([{"_": "h"}], records[0]["v706"])
+        self.assertEqual(1, len(records))
+
+    def test_index_is_persisted(self):
+        PidIndex(self.master_file).pids
+        self.assertTrue(os.path.isfile(self.db_file_path + ".pid_index.json"))
+
+        pid_index = PidIndex(self.master_file)
+        self.assertIsNotNone(pid_index._read())
+
+    def test_index_is_rebuilt_if_database_changes(self):
+        PidIndex(self.master_file).pids
+        self.master_file.close()
+        write_isis_db(self.db_file_path, RECORDS[:1])
+        os.utime(self.db_file_path + ".mst", ns=(0, 0))
+
+        pid_index = PidIndex(self.master_file)
+        self.assertIsNone(pid_index._read())
+        self.assertEqual(["S0044-59672019000300242"], list(pid_index.pids))
+
+    def test_empty_index_is_not_rebuilt(self):
+        self.master_file.close()
+        write_isis_db(self.db_file_path, [])
+        self.assertEqual({}, PidIndex(self.master_file).pids)
+
+        pid_index = PidIndex(self.master_file)
+        with mock.patch.object(pid_index, "build") as build:
+            self.assertEqual({}, pid_index.pids)
+        build.assert_not_called()
+
+
+class TestISISCommaderRecordsByPid(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_file_path = os.path.join(self.tmpdir.name, "artigo")
+        write_isis_db(self.db_file_path, RECORDS)
+        self.isis_commander = isis_cmd.ISISCommader(
+            SimpleNamespace(BASES_ARTIGO_PATH=self.db_file_path, cisis_path=None)
+        )
+
+    def tearDown(self):
+        self.isis_commander.close()
+        self.tmpdir.cleanup()
+
+    def test_get_records_by_pid_reuses_the_open_database(self):
+        self.isis_commander.get_records_by_pid("S0044-59672019000300250")
+        pid_index = self.isis_commander._get_pid_index()
+        self.isis_commander.get_records_by_pid("S0044-59672019000300242")
+        self.assertIs(pid_index, self.isis_commander._get_pid_index())
+
+    def test_get_records_by_pid_reopens_the_changed_database(self):
+        self.assertEqual(
+            1, len(self.isis_commander.get_records_by_pid("S0044-59672019000300250"))
+        )
+        old_master_file = self.isis_commander._get_pid_index().master_file
+
+        write_isis_db(self.db_file_path, RECORDS[:1])
+        os.utime(self.db_file_path + ".mst", ns=(0, 0))
+
+        self.assertEqual(
+            [], self.isis_commander.get_records_by_pid("S0044-59672019000300250")
+        )
+        self.assertIsNone(old_master_file._mst)
+
+    def test_close(self):
+        self.isis_commander.get_records_by_pid("S0044-59672019000300250")
+        master_file = self.isis_commander._get_pid_index().master_file
+        self.isis_commander.close()
+        self.assertIsNone(master_file._mst)
+        self.assertEqual({}, self.isis_commander._pid_indexes)
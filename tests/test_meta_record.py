@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from scielo_classic_website.isisdb import meta_record
+from scielo_classic_website.isisdb import meta_record, p_record
 
 
 class TestMetaRecord(TestCase):
@@ -288,3 +288,61 @@ class TestMetaRecord(TestCase):
         }
         result = self.meta_record.get_full_record_as_dict(None)
         self.assertEqual(expected, result)
+
+
+class TestFieldProperty(TestCase):
+    class Record(meta_record.MetaRecord):
+        calls = 0
+
+        @meta_record.field_property
+        def issue_folder(self):
+            self.calls += 1
+            return self.get_field_content("v004", single=True, simple=True)
+
+    def test_field_property_is_calculated_once(self):
+        record = self.Record({"v004": [{"_": "v49n3"}]})
+        self.assertEqual("v49n3", record.issue_folder)
+        self.assertEqual("v49n3", record.issue_folder)
+        self.assertEqual(1, record.calls)
+
+    def test_field_property_is_recalculated_if_record_is_replaced(self):
+        record = self.Record({"v004": [{"_": "v49n3"}]})
+        self.assertEqual("v49n3", record.issue_folder)
+        record.record = {"v004": [{"_": "v50n1"}]}
+        self.assertEqual("v50n1", record.issue_folder)
+
+    def test_field_property_is_recalculated_after_clear_field_values(self):
+        record = self.Record({"v004": [{"_": "v49n3"}]})
+        self.assertEqual("v49n3", record.issue_folder)
+        record.record["v004"] = [{"_": "v50n1"}]
+        record.clear_field_values()
+        self.assertEqual("v50n1", record.issue_folder)
+
+
+class TestRecordSlots(TestCase):
+    def test_record_has_no_instance_dict(self):
+        record = p_record.ParagraphRecord({"v706": [{"_": "p"}]})
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual("p", record.rec_type)
+
+
+class TestNormalizeTags(TestCase):
+    def test_get_canonical_tag(self):
+        self.assertEqual("v010", meta_record.get_canonical_tag("v10"))
+        self.assertEqual("v010", meta_record.get_canonical_tag("v010"))
+        self.assertEqual("v1001", meta_record.get_canonical_tag("v1001"))
+        self.assertEqual("10", meta_record.get_canonical_tag("10"))
+
+    def test_normalize_tags_returns_same_record_if_tags_are_canonical(self):
+        record = {"v010": [{"s": "WOLFF"}], "v012": [{"_": "Título"}]}
+        self.assertIs(record, meta_record.normalize_tags(record))
+
+    def test_normalize_tags(self):
+        record = {"v10": [{"s": "WOLFF"}], "v012": [{"_": "Título"}]}
+        expected = {"v010": [{"s": "WOLFF"}], "v012": [{"_": "Título"}]}
+        self.assertEqual(expected, meta_record.normalize_tags(record))
+
+    def test_get_field_content_accepts_both_spellings(self):
+        record = meta_record.MetaRecord({"v10": [{"s": "WOLFF"}]})
+        self.assertEqual([{"s": "WOLFF"}], record.get_field_content("v010"))
+        self.assertEqual([{"s": "WOLFF"}], record.get_field_content("v10"))
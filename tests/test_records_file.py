@@ -0,0 +1,70 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from scielo_classic_website import exceptions
+from scielo_classic_website.iid2json import id2json3, records_file
+
+PIDS_AND_RECORDS = [
+    (
+        "S0044-59672019000300242",
+        [
+            {
+                "v706": [{"_": "h"}],
+                "v010": [
+                    {"n": "Yardany", "s": "RAMOS-PASTRANA", "1": "aff1 aff2"},
+                    {"n": "Marta", "s": "WOLFF"},
+                ],
+                "v012": [{"_": "Título", "l": "pt"}],
+            },
+            {"v706": [{"_": "c"}], "v030": [{"_": "Acta Amaz."}]},
+        ],
+    ),
+    (None, []),
+    ("S0044-59672019000300250", [{"v706": [{"_": "h"}]}]),
+]
+
+
+class TestRecordsFile(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmpdir.name, "artigo.rec")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_write_and_read(self):
+        total = records_file.write_records_file(self.file_path, PIDS_AND_RECORDS)
+        self.assertEqual(3, total)
+        result = list(records_file.pids_and_their_records(self.file_path))
+        self.assertEqual(PIDS_AND_RECORDS, result)
+        # a ordem das tags e dos subcampos é mantida
+        self.assertEqual(["v706", "v010", "v012"], list(result[0][1][0]))
+        self.assertEqual(["n", "s", "1"], list(result[0][1][0]["v010"][0]))
+
+    def test_get_records_decodes_only_accessed_records(self):
+        records_file.write_records_file(self.file_path, PIDS_AND_RECORDS)
+        with records_file.RecordsFile(self.file_path) as rf:
+            self.assertEqual(3, len(rf))
+            self.assertIn("S0044-59672019000300250", rf)
+            records = rf.get_records("S0044-59672019000300242")
+            self.assertEqual(2, len(records))
+            self.assertEqual([{"_": "Acta Amaz."}], records[-1]["v030"])
+            self.assertEqual([1], list(records._cache))
+
+    def test_id_file_to_records_file(self):
+        expected = list(
+            id2json3.pids_and_their_records("tests/fixtures/hrecord.id", "artigo")
+        )
+        records_file.write_records_file(self.file_path, expected)
+        result = list(records_file.pids_and_their_records(self.file_path))
+        self.assertEqual(expected, result)
+
+    def test_incomplete_file_raises_records_file_error(self):
+        records_file.write_records_file(self.file_path, PIDS_AND_RECORDS)
+        with open(self.file_path, "rb") as fp:
+            content = fp.read()
+        with open(self.file_path, "wb") as fp:
+            fp.write(content[:-10])
+        with self.assertRaises(exceptions.RecordsFileError):
+            records_file.RecordsFile(self.file_path)
@@ -6,6 +6,7 @@ from scielo_classic_website.models.document import Document
 from scielo_classic_website.spsxml.sps_xml_article_meta import (  # XMLArticleMetaSelfUriPipe,; XMLArticleMetaCountsPipe,; XMLBodyPipe,; XMLArticleMetaCitationsPipe,; XMLSubArticlePipe,
     XMLArticleMetaAbstractsPipe,
     XMLArticleMetaAffiliationPipe,
+    XMLArticleMetaCountsPipe,
     XMLArticleMetaElocationInfoPipe,
     XMLArticleMetaHistoryPipe,
     XMLArticleMetaIssueInfoPipe,
@@ -580,3 +581,42 @@ class TestXMLArticleMetaPermissionPipe(TestCase):
         )
         result = tostring(transformed[1])
         self.assertEqual(expected, result)
+
+
+class FakeRaw:
+    citations = [{}, {}]
+    start_page = "10"
+    end_page = "12"
+
+
+class TestXMLArticleMetaCountsPipe(TestCase):
+    def test_transform(self):
+        xml = get_tree(
+            "<article><front><article-meta/></front>"
+            "<body>"
+            '<fig id="f1"/><fig-group id="f2"><fig/></fig-group>'
+            '<sec><table-wrap id="t1"/></sec>'
+            '<disp-formula id="e1"/><disp-formula/>'
+            "</body>"
+            "<sub-article><front-stub/></sub-article>"
+            "</article>"
+        )
+        _, result = XMLArticleMetaCountsPipe().transform((FakeRaw(), xml))
+        expected = (
+            "<counts>"
+            '<fig-count count="2"/>'
+            '<table-count count="1"/>'
+            '<equation-count count="1"/>'
+            '<ref-count count="2"/>'
+            '<page-count count="3"/>'
+            "</counts>"
+        )
+        self.assertEqual(expected, tostring(result.find("./front/article-meta/counts")))
+        self.assertEqual(
+            "<counts>"
+            '<fig-count count="2"/>'
+            '<table-count count="1"/>'
+            '<equation-count count="1"/>'
+            "</counts>",
+            tostring(result.find("./sub-article/front-stub/counts")),
+        )
@@ -0,0 +1,68 @@
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+from scielo_classic_website.spsxml import sps_xml_attributes
+
+
+class TestLazyTables(TestCase):
+    def test_import_does_not_load_tables(self):
+        code = (
+            "import sys\n"
+            "import scielo_classic_website.spsxml.sps_xml_pipes\n"
+            "module = sys.modules['scielo_classic_website.spsxml.sps_xml_attributes']\n"
+            "print('ARTICLE_TYPES' in vars(module))\n"
+            "module.CONTRIB_ROLES\n"
+            "print(sorted(set(module.FILENAMES) & set(vars(module))))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.assertEqual(
+            "False\n['ARTICLE_TYPES', 'CONTRIB_ROLES', 'COUNTRY_ITEMS']\n",
+            result.stdout,
+        )
+
+    def test_get_attribute_value(self):
+        self.assertEqual(
+            "research-article",
+            sps_xml_attributes.get_attribute_value("article-type", "oa"),
+        )
+        self.assertEqual(
+            "Brazil", sps_xml_attributes.get_attribute_value("country_name", "BR")
+        )
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            sps_xml_attributes.UNKNOWN
+
+
+class TestSnapshot(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmpdir.name, "attributes.pickle")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_write_snapshot_and_read_snapshot(self):
+        sps_xml_attributes.write_snapshot(self.file_path)
+        tables = sps_xml_attributes._read_snapshot(self.file_path)
+        self.assertEqual(sps_xml_attributes.ARTICLE_TYPES, tables["ARTICLE_TYPES"])
+        self.assertEqual("author", tables["CONTRIB_ROLES"].get_sps_value("ND"))
+        self.assertEqual("Brazil", tables["COUNTRY_ITEMS"].name("BR"))
+
+    def test_read_snapshot_returns_none_if_csv_files_changed(self):
+        with open(self.file_path, "wb") as fp:
+            pickle.dump({"signature": [], "tables": {}}, fp)
+        self.assertIsNone(sps_xml_attributes._read_snapshot(self.file_path))
+
+    def test_read_snapshot_returns_none_if_file_does_not_exist(self):
+        self.assertIsNone(sps_xml_attributes._read_snapshot(self.file_path))
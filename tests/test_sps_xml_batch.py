@@ -0,0 +1,120 @@
+import pickle
+import time
+from unittest import TestCase
+
+from tests.builders import ISSUE_RECORD, JOURNAL_RECORD, get_article_records
+
+from scielo_classic_website.models.document import Document
+from scielo_classic_website.models.issue_context import IssueContext
+from scielo_classic_website.spsxml import sps_xml_batch
+
+
+def fake_convert(item):
+    if isinstance(item, Document):
+        return item.scielo_pid_v2
+    if not item:
+        raise ValueError("no records")
+    # os primeiros documentos terminam por último
+    time.sleep(item[0]["delay"])
+    return item[0]["xml"]
+
+
+def get_records(pid):
+    return [{"v706": [{"_": "f"}], "v880": [{"_": pid}], "v702": [{"_": "a.htm"}]}]
+
+
+class TestGenerateFullXMLInBatch(TestCase):
+    def test_ordered_results(self):
+        items = [
+            ("S1", [{"xml": b"<article>1</article>", "delay": 0.2}]),
+            ("S2", []),
+            ("S3", [{"xml": b"<article>3</article>", "delay": 0}]),
+        ]
+        result = list(
+            sps_xml_batch.generate_full_xml_in_batch(
+                items, max_workers=2, convert=fake_convert
+            )
+        )
+        self.assertEqual(["S1", "S2", "S3"], [key for key, xml, error in result])
+        self.assertEqual(b"<article>1</article>", result[0][1])
+        self.assertIsNone(result[1][1])
+        self.assertIsInstance(result[1][2], ValueError)
+        self.assertIsNone(result[2][2])
+
+    def test_unordered_results(self):
+        items = [
+            ("S1", [{"xml": b"<article>1</article>", "delay": 0.5}]),
+            ("S2", [{"xml": b"<article>2</article>", "delay": 0}]),
+        ]
+        result = list(
+            sps_xml_batch.generate_full_xml_in_batch(
+                items, max_workers=2, ordered=False, convert=fake_convert
+            )
+        )
+        self.assertEqual(["S2", "S1"], [key for key, xml, error in result])
+
+    def test_documents_are_sent_to_workers(self):
+        documents = [
+            Document({"article": get_records("S0044-59672019000300242")}),
+            Document({"article": get_records("S0044-59672019000300250")}),
+        ]
+        result = list(
+            sps_xml_batch.generate_full_xml_in_batch(
+                documents, max_workers=1, convert=fake_convert
+            )
+        )
+        self.assertEqual(
+            [
+                (0, "S0044-59672019000300242", None),
+                (1, "S0044-59672019000300250", None),
+            ],
+            result,
+        )
+
+    def test_generate_full_xml(self):
+        issue_context = IssueContext(ISSUE_RECORD, JOURNAL_RECORD)
+        items = [
+            (
+                "S0044-59672019000300242",
+                issue_context.get_document(
+                    get_article_records("S0044-59672019000300242")
+                ),
+            ),
+            (
+                "S0044-59672019000300250",
+                {
+                    "article": get_article_records("S0044-59672019000300250"),
+                    "title": JOURNAL_RECORD,
+                    "issue": ISSUE_RECORD,
+                },
+            ),
+            ("S0044-59672019000300260", get_article_records("S0044-59672019000300260")),
+        ]
+        result = list(sps_xml_batch.generate_full_xml_in_batch(items, max_workers=2))
+        for key, xml, error in result[:2]:
+            with self.subTest(key=key):
+                self.assertIsNone(error)
+                xml = xml.decode("utf-8")
+                self.assertIn(
+                    '<journal-id journal-id-type="publisher-id">aa</journal-id>', xml
+                )
+                self.assertIn(f'specific-use="scielo-v2">{key}</article-id>', xml)
+        key, xml, error = result[2]
+        self.assertIsNone(xml)
+        self.assertIsInstance(error, ValueError)
+
+
+class TestDocumentPickle(TestCase):
+    def test_document_can_be_pickled(self):
+        document = Document({"article": get_records("S0044-59672019000300242")})
+        result = pickle.loads(pickle.dumps(document))
+        self.assertEqual("S0044-59672019000300242", result.scielo_pid_v2)
+
+    def test_document_with_issue_context_can_be_pickled(self):
+        issue_context = IssueContext(ISSUE_RECORD, JOURNAL_RECORD)
+        document = issue_context.get_document(
+            get_article_records("S0044-59672019000300242")
+        )
+        result = pickle.loads(pickle.dumps(document))
+        self.assertEqual("aa", result.journal.acronym)
+        self.assertEqual("49", result.issue.volume)
@@ -6,11 +6,13 @@ from scielo_classic_website.spsxml.sps_xml_body_pipes import (
     AHrefPipe,
     ANamePipe,
     ASourcePipe,
+    ConvertElementsPipe,
     EndPipe,
     FigPipe,
     FontSymbolPipe,
     ImgSrcPipe,
     MainHTMLPipe,
+    NodeHandlers,
     OlPipe,
     RemoveCDATAPipe,
     RemoveCommentPipe,
@@ -22,6 +24,10 @@ from scielo_classic_website.spsxml.sps_xml_body_pipes import (
     TranslatedHTMLPipe,
     UlPipe,
     XRefTypePipe,
+    convert_html_to_xml,
+    convert_html_to_xml_step_1,
+    convert_html_to_xml_step_2,
+    convert_html_to_xml_step_3,
 )
 
 
@@ -653,3 +659,106 @@ class TestFigPipe(TestCase):
         _, transformed_xml = FigPipe().transform(data)
         result = tree_tostring_decode(transformed_xml)
         self.assertEqual(expected, result)
+
+
+class FakeDocument:
+    def __init__(self):
+        self.main_html_paragraphs = {
+            "before references": [
+                {"text": '<p><font face="symbol">a</font> <b>Texto</b></p>'},
+                {"text": '<p><a href="#t1">Tabela 1</a></p>'},
+            ],
+            "references": [{"text": "<p>Ref <i>1</i></p>", "reference_index": 1}],
+            "after references": [{"text": "<p>Depois das referencias</p>"}],
+        }
+        self.translated_html_by_lang = {
+            "en": {
+                "before references": "<p>Text</p>",
+                "after references": "<p>After</p>",
+            },
+            "es": {
+                "before references": "<p>Texto</p>",
+                "after references": "<p>Despues</p>",
+            },
+        }
+
+
+class TestConvertHtmlToXml(TestCase):
+    def _convert_html_to_xml_by_steps(self):
+        document = FakeDocument()
+        document.xml_body_and_back = []
+        document.xml_body_and_back.append(convert_html_to_xml_step_1(document))
+        document.xml_body_and_back.append(convert_html_to_xml_step_2(document))
+        document.xml_body_and_back.append(convert_html_to_xml_step_3(document))
+        return document.xml_body_and_back
+
+    def test_convert_html_to_xml_returns_the_same_xml_as_by_steps(self):
+        expected = self._convert_html_to_xml_by_steps()
+        document = FakeDocument()
+        convert_html_to_xml(document)
+        self.assertEqual([expected[-1]], document.xml_body_and_back)
+
+    def test_convert_html_to_xml_with_snapshots(self):
+        expected = self._convert_html_to_xml_by_steps()
+        document = FakeDocument()
+        convert_html_to_xml(document, snapshots=True)
+        self.assertEqual(expected, document.xml_body_and_back)
+
+
+class TestNodeHandlers(TestCase):
+    def test_process_applies_handlers_registered_for_the_new_tag(self):
+        xml = get_tree("<root><dir/><ul/><a/></root>")
+        node_handlers = NodeHandlers()
+        node_handlers.register("ul", lambda node: node.set("done", "yes"))
+        node_handlers.register("dir", lambda node: setattr(node, "tag", "ul"))
+        node_handlers.register("ul", lambda node: node.set("list-type", "bullet"))
+        node_handlers.process(xml)
+        self.assertEqual(
+            '<root><ul list-type="bullet"/><ul done="yes" list-type="bullet"/><a/></root>',
+            tree_tostring_decode(xml),
+        )
+
+    def test_process_checks_attribute_and_value(self):
+        xml = get_tree('<root><span name="style_bold"/><span name="x"/><span/></root>')
+        node_handlers = NodeHandlers()
+        node_handlers.register(
+            "span", lambda node: setattr(node, "tag", "bold"), "name", "style_bold"
+        )
+        node_handlers.register("span", lambda node: node.set("seen", "1"), "name")
+        node_handlers.process(xml)
+        self.assertEqual(
+            '<root><bold name="style_bold"/><span name="x" seen="1"/><span/></root>',
+            tree_tostring_decode(xml),
+        )
+
+    def test_process_does_not_change_root(self):
+        xml = get_tree("<ol><ol/></ol>")
+        node_handlers = NodeHandlers()
+        node_handlers.register("ol", lambda node: setattr(node, "tag", "list"))
+        node_handlers.process(xml)
+        self.assertEqual("<ol><list/></ol>", tree_tostring_decode(xml))
+
+
+class TestConvertElementsPipe(TestCase):
+    def test_transform_returns_the_same_as_running_each_pipe(self):
+        text = (
+            "<root><body>"
+            "<div><h1 class='x'>Title</h1>"
+            "<p><b>b</b> <i>i</i> <span name='style_sup'>1</span><br/></p>"
+            "<dir><li>item</li></dir><ol><li>item</li></ol>"
+            "<dl><dd>def</dd></dl><blockquote>quote</blockquote>"
+            "<a src='http://www.scielo.br'>site</a>"
+            "<a href='mailto:x@y.org'>mail</a>"
+            "<a href='#t1'>Tabela 1</a>"
+            "<a href='' name='f1'>Fig 1</a>"
+            "<img src='/img/revistas/aa/v1n1/f1.jpg'/>"
+            "</div>"
+            "</body></root>"
+        )
+        expected = get_tree(text)
+        for pipe in ConvertElementsPipe.PIPES:
+            pipe().transform((None, expected))
+
+        xml = get_tree(text)
+        ConvertElementsPipe().transform((None, xml))
+        self.assertEqual(tree_tostring_decode(expected), tree_tostring_decode(xml))
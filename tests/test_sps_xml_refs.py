@@ -0,0 +1,124 @@
+import threading
+from unittest import TestCase, mock
+
+from lxml import etree as ET
+
+from scielo_classic_website.spsxml import sps_xml_refs
+
+
+class TestGetRefsById(TestCase):
+    def test_get_refs_by_id_keeps_first_ref_of_repeated_id(self):
+        reflist = ET.fromstring(
+            "<ref-list>"
+            '<ref id="B1"><mixed-citation>a</mixed-citation></ref>'
+            '<ref id="B2"><mixed-citation>b</mixed-citation></ref>'
+            '<ref id="B1"><mixed-citation>c</mixed-citation></ref>'
+            "</ref-list>"
+        )
+        result = sps_xml_refs.get_refs_by_id(reflist)
+        self.assertEqual(["B1", "B2"], list(result.keys()))
+        self.assertIs(reflist.find(".//ref[@id='B1']"), result["B1"])
+        self.assertEqual("b", result["B2"].findtext("mixed-citation"))
+
+
+class TestGetXMLCitation(TestCase):
+    def test_get_xml_citation_is_reused_by_the_same_thread(self):
+        self.assertIs(sps_xml_refs.get_xml_citation(), sps_xml_refs.get_xml_citation())
+
+    def test_get_xml_citation_is_not_shared_between_threads(self):
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(sps_xml_refs.get_xml_citation())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(sps_xml_refs.get_xml_citation(), result[0])
+
+    def test_render_references_returns_nothing_for_no_citations(self):
+        self.assertEqual([], list(sps_xml_refs.render_references([])))
+
+
+class FakeReference:
+    """
+    Substitui `ReferenceXyloseAdapter`, que não tem `supplement`
+    e não pode ser renderizado pelo pipeline completo
+    """
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    def __getattr__(self, name):
+        if name.endswith("_authors"):
+            return []
+        return None
+
+
+def get_fake_references():
+    return [
+        FakeReference(
+            index_number="1",
+            publication_type="journal",
+            mixed_citation=ET.fromstring(
+                "<mixed-citation>Silva J. A title. <i>Rev X</i> 2019</mixed-citation>"
+            ),
+            analytic_person_authors=[{"surname": "Silva", "given_names": "J"}],
+            article_title="A title",
+            source="Rev X",
+            volume="10",
+            issue="2",
+            start_page="1",
+            end_page="9",
+            doi="10.1590/x",
+            publication_date="2019",
+        ),
+        FakeReference(
+            index_number="2",
+            publication_type="book",
+            monographic_person_authors=[{"surname": "Souza", "given_names": "A"}],
+            source="Book",
+            publisher_name="Editora",
+            publisher_location="São Paulo",
+            publication_date="2001",
+        ),
+        FakeReference(
+            index_number="3",
+            publication_type="webpage",
+            source="Site",
+            link="https://www.scielo.br",
+            access_date="10 jan 2020",
+            access_date_iso="20200110",
+        ),
+    ]
+
+
+class TestRenderReferencesParity(TestCase):
+    def get_expected(self):
+        # caminho anterior: um pipeline novo executado por citação
+        return [
+            ET.tostring(sps_xml_refs.XMLCitation().deploy(raw)[1])
+            for raw in get_fake_references()
+        ]
+
+    def test_deploy_many_renders_the_same_refs_as_deploy(self):
+        result = [
+            ET.tostring(ref)
+            for raw, ref in sps_xml_refs.XMLCitation().deploy_many(
+                get_fake_references()
+            )
+        ]
+        self.assertEqual(self.get_expected(), result)
+
+    @mock.patch.object(
+        sps_xml_refs.xylose_adapters,
+        "ReferenceXyloseAdapter",
+        new=lambda citation: citation,
+    )
+    def test_render_references_renders_the_same_refs_as_deploy(self):
+        expected = self.get_expected()
+        for i in range(2):
+            with self.subTest(i):
+                result = [
+                    ET.tostring(ref)
+                    for ref in sps_xml_refs.render_references(get_fake_references())
+                ]
+                self.assertEqual(expected, result)
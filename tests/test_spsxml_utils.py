@@ -0,0 +1,29 @@
+import threading
+from unittest import TestCase
+
+from lxml import etree
+
+from scielo_classic_website.spsxml import utils
+
+
+class TestGetXPath(TestCase):
+    def test_get_xpath_returns_compiled_xpath(self):
+        xml = etree.fromstring("<root><p><b/></p><b/></root>")
+        result = utils.get_xpath(".//b")
+        self.assertIsInstance(result, etree.XPath)
+        self.assertEqual(2, len(result(xml)))
+
+    def test_get_xpath_is_compiled_once_per_thread(self):
+        self.assertIs(utils.get_xpath(".//b"), utils.get_xpath(".//b"))
+
+        result = []
+        thread = threading.Thread(target=lambda: result.append(utils.get_xpath(".//b")))
+        thread.start()
+        thread.join()
+        self.assertIsNot(utils.get_xpath(".//b"), result[0])
+
+
+class TestGetHTMLParser(TestCase):
+    def test_get_html_parser_is_reused(self):
+        self.assertIsInstance(utils.get_html_parser(), etree.HTMLParser)
+        self.assertIs(utils.get_html_parser(), utils.get_html_parser())